@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Iterator, List, Optional
 
 
 class SourceAdapter:
@@ -6,6 +6,21 @@ class SourceAdapter:
 
     def __init__(self, params: dict):
         self.params = params
+        # locations the upstream reported as unchanged since the previous run
+        self.unchanged: List[str] = []
+        # incremental position: seeded from the stored watermark, advanced as payloads are yielded
+        self.watermark: Any = None
 
-    def fetch(self) -> List[bytes]:
+    def watermark_column(self) -> Optional[str]:
+        """Names the increasing column(s) the watermark tracks; None when the source is not incremental."""
+        return None
+
+    def fetch(self) -> List[dict]:
         raise NotImplementedError
+
+    def iter_payloads(self) -> Iterator[dict]:
+        """Yields payload entries one at a time; streaming adapters override this."""
+        yield from self.fetch()
+
+    def commit_state(self) -> None:
+        """Persists incremental state once the run's payloads have been stored."""
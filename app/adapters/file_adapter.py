@@ -1,28 +1,34 @@
 import hashlib
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional
 
 from app.adapters.base import SourceAdapter
+from app.adapters.file_reader import ChunkedFileReader
 from app.adapters.file_strategy import FileStrategy
 from app.adapters.raw_payload import RawPayload
+from app.core.config import settings
 from app.core.error_codes import ErrorCode
 from app.core.errors import AdapterConfigurationError, AdapterError
+from app.core.logging import get_logger
 from app.storage.index_store import FileIndexStore
 from app.validation.file_filters import FileFilter
-from app.validation.encoding import EncodingDetector
 
 
 class FileSource(SourceAdapter):
-    """Reads files from a directory with incremental checkpoints and encoding detection."""
+    """Reads files from a directory with incremental checkpoints and encoding detection.
+
+    Files are streamed in read_chunk_bytes pieces and emitted as payloads of at most
+    payload_chunk_bytes. Line-oriented files are split on line boundaries so memory stays
+    bounded for large logs; other formats are emitted whole and skipped when larger.
+    """
+
+    CSV_SUFFIXES = {".csv", ".tsv"}
+    LINE_SUFFIXES = CSV_SUFFIXES | {".txt", ".log", ".ndjson", ".jsonl"}
 
     def __init__(self, params: dict):
         super().__init__(params)
         self.index_store = FileIndexStore(Path(params.get("state_path", ".state/file_index.json")))
-
-    def _should_skip(self, file_path: Path, strategy: str) -> bool:
-        if strategy == "mtime":
-            return self.index_store.is_seen_mtime(file_path)
-        return self.index_store.is_seen_checksum(file_path)
+        self.logger = get_logger(__name__)
 
     def _remember(self, file_path: Path, strategy: str, checksum: Optional[str] = None) -> None:
         if strategy == "mtime":
@@ -31,26 +37,20 @@ class FileSource(SourceAdapter):
             if checksum:
                 self.index_store.record_checksum(file_path, checksum)
 
-    def _read_file(self, file_path: Path) -> Tuple[bytes, str]:
-        raw_bytes = file_path.read_bytes()
-        encoding = EncodingDetector.detect(raw_bytes)
-        try:
-            text = raw_bytes.decode(encoding, errors="ignore")
-            return text.encode("utf-8"), encoding
-        except Exception as exc:
-            raise AdapterError(f"Failed to decode file {file_path}: {exc}", ErrorCode.ADAPTER_RUNTIME) from exc
-
-    def fetch(self) -> List[dict]:
+    def iter_payloads(self) -> Iterator[dict]:
         directory = Path(self.params.get("directory", ""))
         pattern = self.params.get("pattern", "*.csv")
         strategy = FileStrategy(self.params.get("incremental", "mtime"))
         strategy.validate()
-        max_size = int(self.params.get("max_size_bytes", 5 * 1024 * 1024))
+        max_size = int(self.params.get("max_size_bytes", 2 * 1024 * 1024 * 1024))
+        read_chunk = int(self.params.get("read_chunk_bytes", 1024 * 1024))
+        # parts larger than the validator's size limit would be rejected, so that is the default bound
+        payload_chunk = int(self.params.get("payload_chunk_bytes", settings.max_payload_size_bytes))
+        mmap_min = int(self.params.get("mmap_min_bytes", 64 * 1024 * 1024))
         filter_ext = FileFilter(allow_extensions=self.params.get("extensions"))
         if not directory.exists():
             raise AdapterConfigurationError(f"Directory {directory} does not exist")
 
-        results: List[dict] = []
         for file_path in directory.glob(pattern):
             if not file_path.is_file():
                 continue
@@ -58,20 +58,60 @@ class FileSource(SourceAdapter):
                 continue
             if not filter_ext.allowed(file_path):
                 continue
-            if self._should_skip(file_path, strategy.mode):
+            # mtime is checked before reading; checksum needs the scan's hash of the raw bytes
+            if strategy.mode == "mtime" and self.index_store.is_seen_mtime(file_path):
+                continue
+            reader = ChunkedFileReader(file_path, read_size=read_chunk, mmap_min_bytes=mmap_min)
+            try:
+                file_checksum, encoding = reader.scan()
+            except OSError as exc:
+                raise AdapterError(f"Failed to read file {file_path}: {exc}", ErrorCode.ADAPTER_RUNTIME) from exc
+            if strategy.mode == "checksum" and self.index_store.is_seen_checksum(file_path, file_checksum):
                 continue
-            payload, encoding = self._read_file(file_path)
-            checksum = hashlib.sha256(payload).hexdigest()
-            results.append(
-                RawPayload(
-                    body=payload,
-                    content_type=f"text/{file_path.suffix.strip('.') or 'plain'}; charset=utf-8",
-                    url=str(file_path),
+            yield from self._file_payloads(file_path, reader, encoding, payload_chunk)
+            self._remember(file_path, strategy.mode, checksum=file_checksum)
+        self.index_store.save()
+
+    def _file_payloads(self, file_path: Path, reader: ChunkedFileReader, encoding: str, payload_chunk: int) -> Iterator[dict]:
+        content_type = f"text/{file_path.suffix.strip('.') or 'plain'}; charset=utf-8"
+        suffix = file_path.suffix.lower()
+        if suffix in self.LINE_SUFFIXES:
+            parts = reader.payload_chunks(encoding, payload_chunk, repeat_header=suffix in self.CSV_SUFFIXES)
+        else:
+            parts = self._whole_file(file_path, reader, encoding, payload_chunk)
+        try:
+            # one part of look-ahead tells whether the file was split, which decides the part suffix on the URL
+            current = next(parts, None)
+            index = 0
+            while current is not None:
+                following = next(parts, None)
+                split = index > 0 or following is not None
+                yield RawPayload(
+                    body=current,
+                    content_type=content_type,
+                    url=f"{file_path}#part={index}" if split else str(file_path),
                     status_code=200,
                     encoding=encoding,
-                    checksum=checksum,
+                    checksum=hashlib.sha256(current).hexdigest(),
                 ).__dict__
-            )
-            self._remember(file_path, strategy.mode, checksum=checksum)
-        self.index_store.save()
-        return results
+                current = following
+                index += 1
+        except (OSError, LookupError, UnicodeError) as exc:
+            raise AdapterError(f"Failed to decode file {file_path}: {exc}", ErrorCode.ADAPTER_RUNTIME) from exc
+
+    def _whole_file(self, file_path: Path, reader: ChunkedFileReader, encoding: str, payload_chunk: int) -> Iterator[bytes]:
+        # splitting JSON or XML anywhere would produce parts that no longer parse
+        body = bytearray()
+        for chunk in reader.utf8_chunks(encoding):
+            body += chunk
+            if len(body) > payload_chunk:
+                # skipped rather than raised: failing the run would retry the same file forever
+                self.logger.warning(
+                    "Skipping file larger than payload_chunk_bytes that cannot be split",
+                    extra={"run_id": "-", "source_id": "-", "payload": {"path": str(file_path), "limit": payload_chunk}},
+                )
+                return
+        yield bytes(body)
+
+    def fetch(self) -> List[dict]:
+        return list(self.iter_payloads())
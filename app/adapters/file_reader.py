@@ -0,0 +1,96 @@
+import codecs
+import hashlib
+import mmap
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from app.validation.encoding import StreamingEncodingDetector
+
+
+class ChunkedFileReader:
+    """Reads a file in fixed-size chunks so hashing, encoding detection and transcoding never hold it whole."""
+
+    def __init__(self, path: Path, *, read_size: int = 1024 * 1024, mmap_min_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.read_size = max(1, read_size)
+        # files at or above this size are mapped instead of read; 0 disables mmap
+        self.mmap_min_bytes = mmap_min_bytes
+
+    def chunks(self) -> Iterator[bytes]:
+        size = self.path.stat().st_size
+        with self.path.open("rb") as handle:
+            if size and self.mmap_min_bytes and size >= self.mmap_min_bytes:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for start in range(0, len(mapped), self.read_size):
+                        yield mapped[start : start + self.read_size]
+                return
+            while True:
+                chunk = handle.read(self.read_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def scan(self) -> Tuple[str, str]:
+        """One pass returning the SHA-256 of the raw bytes and the detected encoding."""
+        digest = hashlib.sha256()
+        detector = StreamingEncodingDetector()
+        for chunk in self.chunks():
+            digest.update(chunk)
+            if not detector.settled:
+                detector.feed(chunk)
+        if not detector.settled:
+            detector.feed(b"", final=True)
+        return digest.hexdigest(), detector.result()
+
+    def utf8_chunks(self, encoding: str) -> Iterator[bytes]:
+        if codecs.lookup(encoding).name == "utf-8":
+            # detection already proved the bytes decode cleanly, so transcoding would be a copy
+            yield from self.chunks()
+            return
+        decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        for chunk in self.chunks():
+            text = decoder.decode(chunk)
+            if text:
+                yield text.encode("utf-8")
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail.encode("utf-8")
+
+    def payload_chunks(self, encoding: str, max_bytes: int, repeat_header: bool = False) -> Iterator[bytes]:
+        """Yields UTF-8 bodies of at most max_bytes cut at line boundaries; repeat_header prefixes the first line.
+
+        A single line longer than the bound is hard-split at a character boundary.
+        """
+        max_bytes = max(1, max_bytes)
+        buffer = bytearray()
+        header = b""
+        emitted = False
+        for chunk in self.utf8_chunks(encoding):
+            buffer += chunk
+            # repeated headers count against the bound so every part stays within max_bytes
+            while len(buffer) > (limit := max(1, max_bytes - len(header))):
+                cut = buffer.rfind(b"\n", 0, limit)
+                end = cut + 1 if cut != -1 else self._char_boundary(buffer, limit)
+                piece = bytes(buffer[:end])
+                del buffer[:end]
+                if repeat_header and not emitted and cut != -1:
+                    header = piece[: piece.find(b"\n") + 1]
+                    if len(header) >= max_bytes:
+                        header = b""
+                yield header + piece if emitted else piece
+                emitted = True
+        if buffer or not emitted:
+            yield header + bytes(buffer) if emitted else bytes(buffer)
+
+    @staticmethod
+    def _char_boundary(buffer: bytearray, limit: int) -> int:
+        """Largest cut at or below limit that does not split a UTF-8 sequence (at least one character)."""
+        end = limit
+        # continuation bytes look like 0b10xxxxxx
+        while end > 0 and buffer[end] & 0xC0 == 0x80:
+            end -= 1
+        if end == 0:
+            end = limit
+            while end < len(buffer) and buffer[end] & 0xC0 == 0x80:
+                end += 1
+        return end
@@ -1,5 +1,10 @@
 import json
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import httpx
 
 from app.adapters.base import SourceAdapter
 from app.adapters.http_auth import HttpAuth
@@ -7,9 +12,11 @@ from app.adapters.http_client import HttpClient
 from app.adapters.http_request_builder import HttpRequestBuilder
 from app.adapters.http_response_parser import HttpResponseParser
 from app.adapters.raw_payload import RawPayload
+from app.core.config import settings
 from app.core.error_codes import ErrorCode
 from app.core.errors import AdapterConfigurationError, AdapterError, RetryableError
 from app.adapters.http_pagination import OffsetPagination
+from app.storage.http_validator_store import HttpValidatorStore
 
 
 class HttpAPISource(SourceAdapter):
@@ -19,6 +26,10 @@ class HttpAPISource(SourceAdapter):
         super().__init__(params)
         self.client = HttpClient(timeout=params.get("timeout", 10.0))
         self.request_builder = HttpRequestBuilder(params)
+        self.validators = HttpValidatorStore(Path(params.get("validator_state_path", settings.http_validators_path)))
+
+    def _conditional_enabled(self) -> bool:
+        return bool(self.params.get("conditional", True)) and self.request_builder.method() == "GET"
 
     def _build_headers(self) -> Dict[str, str]:
         headers = self.request_builder.headers()
@@ -26,15 +37,19 @@ class HttpAPISource(SourceAdapter):
         headers.update(HttpAuth.bearer(token))
         return headers
 
-    def _make_request(self, method: str, url: str, *, params=None, json_body=None, data=None):
+    def _make_request(self, method: str, url: str, *, params=None, json_body=None, data=None, conditional_key: Optional[str] = None):
+        headers = self._build_headers()
+        if conditional_key:
+            headers.update(self.validators.conditional_headers(conditional_key))
         try:
             response = self.client.request(
                 method,
                 url,
-                headers=self._build_headers(),
+                headers=headers,
                 params=params,
                 json=json_body,
                 data=data,
+                allow_not_modified=conditional_key is not None,
             )
             return response
         except AdapterError:
@@ -61,6 +76,10 @@ class HttpAPISource(SourceAdapter):
 
         if mode == "offset":
             pager = OffsetPagination(limit=limit, start=offset, max_pages=max_pages)
+            concurrency = int(pagination.get("concurrency", 1))
+            if concurrency > 1:
+                yield from self._iterate_offsets_concurrently(current_url, pager.steps(), limit, concurrency)
+                return
             for step in pager.steps():
                 response = self._make_request(
                     self.params.get("method", "GET"),
@@ -82,17 +101,69 @@ class HttpAPISource(SourceAdapter):
                 if not next_url:
                     break
         else:
-            response = self._make_request(self.params.get("method", "GET"), current_url, params=self.params.get("query"), json_body=self.params.get("body"))
+            query = self.params.get("query")
+            # validators are only tracked for single-URL polling; paged responses depend on earlier pages
+            conditional_key = str(httpx.URL(current_url, params=query)) if self._conditional_enabled() else None
+            response = self._make_request(
+                self.params.get("method", "GET"),
+                current_url,
+                params=query,
+                json_body=self.params.get("body"),
+                conditional_key=conditional_key,
+            )
+            if response.status_code == 304:
+                self.unchanged.append(conditional_key)
+                return
+            if conditional_key:
+                self.validators.remember(conditional_key, response.headers)
             yield response
 
-    def fetch(self) -> List[dict]:
+    def _iterate_offsets_concurrently(self, url: str, steps: Iterable[Dict[str, int]], limit: int, concurrency: int):
+        """Keeps up to `concurrency` offset pages in flight and yields responses in page order."""
+        steps = iter(steps)
+        method = self.params.get("method", "GET")
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="http-page") as executor:
+            in_flight = deque()
+
+            def submit_next() -> None:
+                step = next(steps, None)
+                if step is not None:
+                    in_flight.append(
+                        executor.submit(
+                            self._make_request,
+                            method,
+                            url,
+                            params={**self.params.get("query", {}), **step},
+                            json_body=self.params.get("body"),
+                        )
+                    )
+
+            for _ in range(concurrency):
+                submit_next()
+            try:
+                while in_flight:
+                    response = in_flight.popleft().result()
+                    yield response
+                    if len(response.json()) < limit:
+                        break
+                    submit_next()
+            finally:
+                # pages past the first short page are not needed
+                for future in in_flight:
+                    future.cancel()
+
+    def iter_payloads(self) -> Iterator[dict]:
         url = self.params.get("url")
         if not url:
             raise AdapterConfigurationError("HTTP API source missing 'url'")
         self.request_builder.method()  # validate method
+        self.unchanged = []
 
-        payloads: List[dict] = []
         for response in self._iterate_pages(url):
-            parsed = HttpResponseParser.to_payload(response)
-            payloads.append(parsed.__dict__)
-        return payloads
+            yield HttpResponseParser.to_payload(response).__dict__
+
+    def fetch(self) -> List[dict]:
+        return list(self.iter_payloads())
+
+    def commit_state(self) -> None:
+        self.validators.save()
@@ -3,24 +3,42 @@ from typing import Dict, Optional
 
 import httpx
 
+from app.adapters.http_pool import HttpClientPool, http_pool
 from app.core.config import settings
 from app.core.error_codes import ErrorCode
 from app.core.errors import AdapterError, RetryableError
 
 
 class HttpClient:
-    """HTTP client with simple retry/backoff for transient network errors."""
+    """HTTP client with simple retry/backoff for transient network errors, borrowing pooled connections."""
 
-    def __init__(self, timeout: float = 10.0, max_retries: int | None = None, backoff_seconds: int | None = None):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_retries: int | None = None,
+        backoff_seconds: int | None = None,
+        pool: HttpClientPool | None = None,
+    ):
         self.timeout = timeout
+        self.pool = pool or http_pool
         self.max_retries = settings.max_retries if max_retries is None else max_retries
         self.backoff_seconds = settings.retry_backoff_seconds if backoff_seconds is None else backoff_seconds
 
-    def request(self, method: str, url: str, *, headers: Optional[Dict[str, str]] = None, params=None, json=None, data=None):
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params=None,
+        json=None,
+        data=None,
+        allow_not_modified: bool = False,
+    ):
         attempt = 0
         while True:
             try:
-                response = httpx.request(
+                response = self.pool.client_for(url).request(
                     method,
                     url,
                     headers=headers,
@@ -29,9 +47,13 @@ class HttpClient:
                     data=data,
                     timeout=self.timeout,
                 )
+                self.pool.record(url, ok=response.is_success)
+                if allow_not_modified and response.status_code == 304:
+                    return response
                 response.raise_for_status()
                 return response
             except httpx.RequestError as exc:
+                self.pool.record(url, ok=False)
                 attempt += 1
                 if attempt > self.max_retries:
                     raise AdapterError(f"HTTP request failed after retries: {exc}", ErrorCode.RETRYABLE) from exc
@@ -0,0 +1,89 @@
+import importlib.util
+import threading
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+
+class HttpClientPool:
+    """Process-wide registry of keep-alive httpx clients, one per scheme/host/port."""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.logger = get_logger(__name__)
+        self.http2 = http2 and self._http2_available()
+        # overrides the network transport for every client (tests, proxies)
+        self.transport = transport
+        self._clients: Dict[str, httpx.Client] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _http2_available(self) -> bool:
+        if importlib.util.find_spec("h2") is None:
+            self.logger.warning("HTTP/2 requested but the 'h2' package is missing; using HTTP/1.1", extra={"run_id": "-", "source_id": "-"})
+            return False
+        return True
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parsed = httpx.URL(url)
+        return f"{parsed.scheme}://{parsed.host}:{parsed.port or (443 if parsed.scheme == 'https' else 80)}"
+
+    def client_for(self, url: str) -> httpx.Client:
+        key = self.host_key(url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(limits=self.limits, http2=self.http2, transport=self.transport)
+                self._clients[key] = client
+                self._stats.setdefault(key, {"clients": 0, "requests": 0, "failures": 0})["clients"] += 1
+            return client
+
+    def record(self, url: str, ok: bool) -> None:
+        key = self.host_key(url)
+        with self._lock:
+            stats = self._stats.setdefault(key, {"clients": 0, "requests": 0, "failures": 0})
+            stats["requests"] += 1
+            if not ok:
+                stats["failures"] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hosts = {key: dict(value) for key, value in self._stats.items()}
+            open_clients = sum(1 for client in self._clients.values() if not client.is_closed)
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "open_clients": open_clients,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+http_pool = HttpClientPool(
+    max_connections=settings.http_pool_max_connections,
+    max_keepalive_connections=settings.http_pool_max_keepalive,
+    keepalive_expiry=settings.http_pool_keepalive_expiry,
+    http2=settings.http2_enabled,
+)
@@ -11,6 +11,7 @@ class HttpResponseParser:
     def to_payload(response) -> RawPayload:
         content_type = response.headers.get("content-type", "")
         if "application/json" in content_type:
+            # normalised so checksums (dedupe, ETag) stay stable regardless of server formatting
             body = json.dumps(response.json()).encode("utf-8")
         else:
             body = response.content
@@ -1,6 +1,6 @@
 import json
 import sqlite3
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from app.adapters.base import SourceAdapter
 from app.adapters.raw_payload import RawPayload
@@ -12,7 +12,22 @@ from app.adapters.sqlite_pager import SQLitePager
 class SQLiteSource(SourceAdapter):
     """Reads rows from a SQLite table and serializes each row to JSON bytes."""
 
-    def fetch(self) -> List[dict]:
+    def _watermark_columns(self) -> Tuple[Optional[str], Optional[str]]:
+        column = self.params.get("watermark_column")
+        if not column:
+            return None, None
+        # rows sharing a watermark value (e.g. updated_at) are ordered and resumed by the tie column
+        if self.params.get("mode", "table") == "table":
+            return column, self.params.get("key_column", "rowid")
+        return column, self.params.get("key_column")
+
+    def watermark_column(self) -> Optional[str]:
+        column, tie = self._watermark_columns()
+        if not column:
+            return None
+        return f"{column},{tie}" if tie else column
+
+    def iter_payloads(self) -> Iterator[dict]:
         db_path = self.params.get("db_path")
         table = self.params.get("table")
         mode = self.params.get("mode", "table")
@@ -21,35 +36,50 @@ class SQLiteSource(SourceAdapter):
         where = self.params.get("where")
         limit = int(self.params.get("limit", 100))
         offset = int(self.params.get("offset", 0))
+        paging = self.params.get("paging", "offset")  # offset | keyset
+        key_column = self.params.get("key_column", "rowid")
         if not db_path:
             raise AdapterConfigurationError("SQLite source requires 'db_path'")
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
         pager = SQLitePager(conn, limit=limit, offset=offset)
         try:
-            payloads: List[dict] = []
-            if mode == "table":
-                query_text = pager.build_table_query(table, columns=columns, where=where)
-            elif mode == "query":
-                if not query:
-                    raise AdapterConfigurationError("Query mode requires 'query'")
-                query_text = pager.build_safe_query(query)
-            else:
+            if mode not in ("table", "query"):
                 raise AdapterConfigurationError("Unsupported SQLite mode")
-            for page_rows in pager.execute_paginated(query_text):
-                serialized = [dict(row) for row in page_rows]
-                payloads.append(
-                    RawPayload(
-                        body=json.dumps(serialized).encode("utf-8"),
-                        content_type="application/json",
-                        url=f"sqlite://{db_path}",
-                        status_code=200,
-                        row_count=len(serialized),
-                        columns=list(serialized[0].keys()) if serialized else [],
-                    ).__dict__
-                )
-            return payloads
+            if mode == "query" and not query:
+                raise AdapterConfigurationError("Query mode requires 'query'")
+            watermark_column, tie_column = self._watermark_columns()
+            if watermark_column and not tie_column:
+                raise AdapterConfigurationError("SQLite watermark_column over a query requires key_column")
+            if watermark_column or paging == "keyset":
+                seek = {"key_column": key_column}
+                if watermark_column:
+                    start = tuple(self.watermark) if tie_column and self.watermark is not None else self.watermark
+                    seek = {"key_column": watermark_column, "tie_column": tie_column, "start": start}
+                if mode == "table":
+                    pages = pager.execute_keyset(table=table, columns=columns, where=where, **seek)
+                else:
+                    pages = pager.execute_keyset(query=query, **seek)
+            elif mode == "table":
+                pages = pager.execute_paginated(pager.build_table_query(table, columns=columns, where=where))
+            else:
+                pages = pager.execute_paginated(pager.build_safe_query(query))
+            for page_rows in pages:
+                serialized = [SQLitePager.row_dict(row) for row in page_rows]
+                if watermark_column:
+                    self.watermark = SQLitePager.row_key(page_rows[-1], tie_column is not None)
+                yield RawPayload(
+                    body=json.dumps(serialized).encode("utf-8"),
+                    content_type="application/json",
+                    url=f"sqlite://{db_path}",
+                    status_code=200,
+                    row_count=len(serialized),
+                    columns=list(serialized[0].keys()) if serialized else [],
+                ).__dict__
         except sqlite3.OperationalError as exc:
             raise AdapterError(f"SQLite operation failed: {exc}", ErrorCode.ADAPTER_RUNTIME) from exc
         finally:
             conn.close()
+
+    def fetch(self) -> List[dict]:
+        return list(self.iter_payloads())
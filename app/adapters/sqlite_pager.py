@@ -1,11 +1,14 @@
 import sqlite3
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.core.errors import AdapterConfigurationError
 
 
 class SQLitePager:
-    """Helper to read SQLite data in pages."""
+    """Helper to read SQLite data in pages, by LIMIT/OFFSET or by seeking on an ordered key."""
+
+    KEY_ALIAS = "__pager_key"
+    TIE_ALIAS = "__pager_tie"
 
     def __init__(self, conn: sqlite3.Connection, limit: int = 100, offset: int = 0):
         self.conn = conn
@@ -37,3 +40,65 @@ class SQLitePager:
             if len(rows) < self.limit:
                 break
             current_offset += self.limit
+
+    def execute_keyset(
+        self,
+        *,
+        key_column: str,
+        tie_column: Optional[str] = None,
+        table: Optional[str] = None,
+        query: Optional[str] = None,
+        columns=None,
+        where=None,
+        start: Any = None,
+    ) -> Iterable[List[sqlite3.Row]]:
+        """Seeks past the last key of each page (WHERE key > ? ORDER BY key) instead of scanning OFFSET rows.
+
+        With a tie_column the seek is on (key, tie) so a non-unique key such as updated_at never drops rows
+        at a page boundary; start is then a (key, tie) pair.
+        """
+        selected = f"{key_column} AS {self.KEY_ALIAS}"
+        if tie_column:
+            selected += f", {tie_column} AS {self.TIE_ALIAS}"
+        if table:
+            cols = ", ".join(columns) if columns else "*"
+            source = f"SELECT {selected}, {cols} FROM {table}"
+            filters = [f"({where})"] if where else []
+        elif query:
+            if key_column.lower() == "rowid" or (tie_column or "").lower() == "rowid":
+                raise AdapterConfigurationError("Keyset pagination over a query requires an explicit 'key_column'")
+            source = f"SELECT {selected}, * FROM ({self.build_safe_query(query)})"
+            filters = []
+        else:
+            raise AdapterConfigurationError("Keyset pagination requires a table or query")
+        seek = f"({key_column}, {tie_column}) > (?, ?)" if tie_column else f"{key_column} > ?"
+        order = f"{key_column}, {tie_column}" if tie_column else key_column
+        last_seen = start
+        while True:
+            conditions = list(filters)
+            params: list = []
+            if last_seen is not None:
+                conditions.append(seek)
+                params.extend(last_seen if tie_column else [last_seen])
+            where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            paged_query = f"{source}{where_clause} ORDER BY {order} LIMIT ?"
+            rows = self.conn.execute(paged_query, (*params, self.limit)).fetchall()
+            if not rows:
+                break
+            yield rows
+            if len(rows) < self.limit:
+                break
+            last_seen = self.row_key(rows[-1], tie_column is not None)
+
+    @classmethod
+    def row_key(cls, row: sqlite3.Row, with_tie: bool = False) -> Any:
+        if with_tie:
+            return (row[cls.KEY_ALIAS], row[cls.TIE_ALIAS])
+        return row[cls.KEY_ALIAS]
+
+    @classmethod
+    def row_dict(cls, row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        data.pop(cls.KEY_ALIAS, None)
+        data.pop(cls.TIE_ALIAS, None)
+        return data
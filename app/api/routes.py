@@ -1,7 +1,8 @@
 import json
 from typing import List
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.errors import SourceNotFoundError
@@ -25,6 +26,10 @@ from app.services.run_repository import RunRepository
 from app.services.run_health import RunHealthService
 from app.services.source_stats import SourceStatsService
 from app.services.summary import RunSummaryService
+from app.services.payload_stream import etag_matches, parse_byte_range
+from app.services.record_export import EXPORT_COMPRESSIONS, RecordExporter
+from app.services.record_filter import RecordFilter
+from app.services.time_window import TimeWindow
 from app.services.record_query import RecordQueryService
 from app.services.events_service import EventsService
 from app.services.config_service import ConfigService
@@ -32,6 +37,7 @@ from app.services.record_stats import RecordStatsService
 from app.services.history_reader import HistoryReader
 from app.services.run_timeline import RunTimelineService
 from app.services.diagnostics import DiagnosticsService
+from app.services.monitoring_cache import cached_snapshot, monitoring_cache
 from app.services.bulk_cancel import BulkCancelService
 from app.services.source_manager import SourceManager
 
@@ -73,14 +79,6 @@ def trigger_run(source_id: int, db: Session = Depends(get_session)):
         raise HTTPException(status_code=404, detail=str(exc))
 
 
-@router.get("/runs/{run_id}", response_model=RunRead)
-def get_run(run_id: str, db: Session = Depends(get_session)):
-    run = db.query(IngestionRun).filter(IngestionRun.run_id == run_id).first()
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-    return run
-
-
 @router.get("/runs", response_model=RunListResponse)
 def list_runs(
     source_id: int | None = None,
@@ -115,16 +113,25 @@ def cancel_run(run_id: str, db: Session = Depends(get_session)):
 
 @router.get("/runs/summary", response_model=RunSummary)
 def run_summary(db: Session = Depends(get_session)):
-    counts = RunSummaryService(db).counts()
+    counts = cached_snapshot("runs_summary", db, lambda session: RunSummaryService(session).counts())
     return RunSummary(counts=counts)
 
 
 @router.get("/runs/health", response_model=RunHealth)
 def run_health(db: Session = Depends(get_session)):
-    counts = RunHealthService(db).snapshot()
+    counts = cached_snapshot("runs_health", db, lambda session: RunHealthService(session).snapshot())
     return RunHealth(counts=counts)
 
 
+# after /runs/summary and /runs/health so those paths are not read as run ids
+@router.get("/runs/{run_id}", response_model=RunRead)
+def get_run(run_id: str, db: Session = Depends(get_session)):
+    run = db.query(IngestionRun).filter(IngestionRun.run_id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+
 @router.get("/runs/{run_id}/events", response_model=RunEventsPage)
 def list_run_events(run_id: str, page: int = 1, page_size: int = 50, db: Session = Depends(get_session)):
     total, items = EventsService(db).list(run_id, page=page, page_size=page_size)
@@ -138,8 +145,11 @@ def get_config():
 
 @router.get("/records/stats", response_model=RecordStats)
 def records_stats(db: Session = Depends(get_session)):
-    svc = RecordStatsService(db)
-    return RecordStats(totals=svc.totals(), by_format=svc.by_format(), by_status=svc.by_status())
+    def _build(session: Session):
+        svc = RecordStatsService(session)
+        return {"totals": svc.totals(), "by_format": svc.by_format(), "by_status": svc.by_status()}
+
+    return RecordStats(**cached_snapshot("records_stats", db, _build))
 
 
 @router.get("/runs/{run_id}/history", response_model=RunHistoryResponse)
@@ -160,7 +170,9 @@ def run_timeline(run_id: str, db: Session = Depends(get_session)):
 
 @router.get("/diagnostics", response_model=DiagnosticsSnapshot)
 def diagnostics(db: Session = Depends(get_session)):
-    return DiagnosticsSnapshot(**DiagnosticsService(db).snapshot())
+    snapshot = cached_snapshot("diagnostics", db, lambda session: DiagnosticsService(session).snapshot())
+    # cache counters are read live so they are not as old as the snapshot
+    return DiagnosticsSnapshot(**snapshot, caches={"monitoring": monitoring_cache.stats()})
 
 
 @router.post("/runs/cancel")
@@ -180,21 +192,63 @@ def list_records(
     sort: str = "desc",
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
+    total: str = "cached",
     db: Session = Depends(get_session),
 ):
     service = RecordQueryService(db)
-    total, items = service.list_records(
+    try:
+        count, items, next_cursor = service.list_records(
+            run_id=run_id,
+            source_id=source_id,
+            fmt=format,
+            validation_status=validation_status,
+            from_time=from_time,
+            to_time=to_time,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            total_mode=total,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return RecordsPage(page=page, page_size=page_size, total=count, items=items, next_cursor=next_cursor)
+
+
+# declared before /records/{record_id} so "export" is not parsed as an id
+@router.get("/records/export")
+def export_records(
+    run_id: str | None = None,
+    source_id: int | None = None,
+    format: str | None = None,
+    validation_status: str | None = None,
+    from_time: str | None = None,
+    to_time: str | None = None,
+    include_payload: bool = True,
+    compression: str | None = None,
+    db: Session = Depends(get_session),
+):
+    """Streams every matching record as one NDJSON line of metadata plus payload, oldest first."""
+    if compression is not None and compression not in EXPORT_COMPRESSIONS:
+        raise HTTPException(status_code=400, detail=f"compression must be one of {', '.join(EXPORT_COMPRESSIONS)}")
+    start, end = TimeWindow.parse(from_time, to_time)
+    record_filter = RecordFilter(
         run_id=run_id,
         source_id=source_id,
         fmt=format,
         validation_status=validation_status,
-        from_time=from_time,
-        to_time=to_time,
-        sort=sort,
-        page=page,
-        page_size=page_size,
+        start=start,
+        end=end,
+    )
+    headers = {"Content-Disposition": 'attachment; filename="records.ndjson"'}
+    if compression:
+        headers["Content-Encoding"] = compression
+    return StreamingResponse(
+        RecordExporter(db).ndjson(record_filter, include_payload=include_payload, compression=compression),
+        media_type="application/x-ndjson",
+        headers=headers,
     )
-    return RecordsPage(page=page, page_size=page_size, total=total, items=items)
 
 
 @router.get("/records/{record_id}", response_model=RecordReadSingle)
@@ -203,7 +257,11 @@ def get_record(record_id: int, db: Session = Depends(get_session)):
     record = service.get_record(record_id)
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
-    return record
+    detail = RecordReadSingle.model_validate(record)
+    # compressed and file-backed payloads are not in the payload column
+    data = service.read_payload(record)
+    detail.payload = data.decode("utf-8", errors="replace") if data is not None else None
+    return detail
 
 
 @router.get("/records/{record_id}/payload")
@@ -215,6 +273,45 @@ def get_record_payload(record_id: int, db: Session = Depends(get_session)):
     return {"record_id": record_id, "content_type": content_type, "payload": payload.decode("utf-8", errors="replace")}
 
 
+@router.get("/records/{record_id}/raw")
+def download_record_payload(
+    record_id: int,
+    range_header: str | None = Header(None, alias="Range"),
+    if_none_match: str | None = Header(None),
+    if_range: str | None = Header(None),
+    db: Session = Depends(get_session),
+):
+    """Raw payload bytes with the stored content type; supports single byte ranges and checksum ETags."""
+    service = RecordQueryService(db)
+    record = service.get_record(record_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Record not found")
+    etag = f'"{record.checksum}"'
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    stream = service.open_payload(record)
+    if stream is None:
+        raise HTTPException(status_code=404, detail="Payload not found")
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    # a stale If-Range validator means the client's partial copy is outdated: send everything
+    if if_range is not None and if_range.strip() != etag:
+        range_header = None
+    try:
+        byte_range = parse_byte_range(range_header, stream.size)
+    except ValueError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{stream.size}"})
+    start, end = byte_range or (0, stream.size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{stream.size}"
+    return StreamingResponse(
+        stream.chunks(start, end),
+        status_code=206 if byte_range is not None else 200,
+        media_type=record.content_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Multi-source data ingestion")
     app.include_router(router)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -7,17 +8,54 @@ class Settings(BaseSettings):
     """Application-level settings with defaults suitable for local runs."""
 
     database_url: str = "sqlite:///./data/app.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    sqlite_journal_mode: str = "WAL"  # WAL | DELETE | TRUNCATE ...
+    sqlite_synchronous: str = "NORMAL"  # OFF | NORMAL | FULL
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_busy_timeout_ms: int = 5000
     log_dir: Path = Path("logs")
+    log_format: str = "text"  # text | json
+    log_async: bool = True
+    # logger name prefix -> fraction of INFO/DEBUG records kept, e.g. {"app.services.debug_tools": 0.1}
+    log_sampling: Dict[str, float] = {}
     data_dir: Path = Path("data")
     max_payload_size_bytes: int = 5 * 1024 * 1024
     scheduler_interval_seconds: int = 10
+    scheduler_workers: int = 4
+    scheduler_executor: str = "thread"  # thread | process
     allow_queue_on_busy: bool = True
     run_timeout_seconds: int = 90
     retry_backoff_seconds: int = 2
     max_retries: int = 2
-    storage_mode: str = "db"  # db | file
+    http_pool_max_connections: int = 20
+    http_pool_max_keepalive: int = 10
+    http_pool_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+    http_validators_path: Path = Path(".state/http_validators.json")  # ETag/Last-Modified per URL
+    storage_mode: str = "db"  # db | file | blob | segment
+    segment_max_bytes: int = 256 * 1024 * 1024
     dedupe_mode: str = "store"  # store | skip
+    dedupe_ttl_days: int = 30  # 0 keeps checksums forever
+    dedupe_bloom_capacity: int = 1_000_000
+    dedupe_index_path: Path = Path(".state/dedupe_index.db")  # opened only in skip mode
+    payload_compression: str = "none"  # none | gzip | zlib | zstd
+    payload_compression_level: int = 6
+    payload_compression_min_bytes: int = 256
+    insert_mode: str = "bulk"  # bulk | orm
+    bulk_insert_chunk_size: int = 500
     retention_days: int = 7
+    records_count_ttl_seconds: float = 30.0
+    payload_stream_chunk_bytes: int = 256 * 1024
+    export_batch_size: int = 1000
+    monitoring_cache_ttl_seconds: float = 5.0
+    monitoring_cache_stale_seconds: float = 30.0  # served while refreshing in the background
+    event_buffer_size: int = 50
+    event_flush_seconds: float = 2.0
+    pipeline_batch_size: int = 200
+    pipeline_max_inflight_bytes: int = 8 * 1024 * 1024
 
     model_config = SettingsConfigDict(env_prefix="INGEST_")
 
@@ -1,29 +1,163 @@
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import os
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional
 
 from app.core.config import settings
 
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] run_id=%(run_id)s source_id=%(source_id)s %(name)s: %(message)s"
+# third-party loggers do not pass run/source context
+CONTEXT_DEFAULTS = {"run_id": "-", "source_id": "-"}
+
+_listener: Optional[QueueListener] = None
+
+
+class TextFormatter(logging.Formatter):
+    """LOG_FORMAT line with the structured payload appended when a record carries one."""
+
+    def __init__(self):
+        super().__init__(LOG_FORMAT, defaults=CONTEXT_DEFAULTS)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        payload = getattr(record, "payload", None)
+        if payload is None:
+            return line
+        return f"{line} payload={json.dumps(payload, ensure_ascii=False, default=str)}"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line including run/source context and the payload extra."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "run_id": getattr(record, "run_id", "-"),
+            "source_id": getattr(record, "source_id", "-"),
+        }
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            entry["payload"] = payload
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # rendered by ContextQueueHandler before the record crossed the queue
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ContextQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback as exc_text instead of folding it into the message.
+
+    The stock prepare() formats the record with a plain formatter, so the listener's JSON
+    formatter would see the traceback inside "message" and no exception at all.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            # traceback objects pin frames and cannot be pickled; the text is all formatters need
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of INFO/DEBUG records per logger name prefix; warnings and errors always pass."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # longest prefix first so "app.services.debug_tools" wins over "app.services"
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def rate_for(self, name: str) -> float:
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+def _formatter() -> logging.Formatter:
+    return JsonFormatter() if settings.log_format == "json" else TextFormatter()
 
 
 def _build_handler() -> RotatingFileHandler:
     handler = RotatingFileHandler(settings.log_dir / "app.log", maxBytes=2_000_000, backupCount=3)
-    formatter = logging.Formatter(LOG_FORMAT)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_formatter())
     return handler
 
 
+def _start_listener(log_queue: queue.Queue, handlers: List[logging.Handler]) -> None:
+    global _listener
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _restart_listener_in_child() -> None:
+    # a forked worker inherits the queue handler but not the listener thread
+    if _listener is None:
+        return
+    log_queue: queue.Queue = queue.Queue(-1)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, QueueHandler):
+            handler.queue = log_queue
+    _start_listener(log_queue, list(_listener.handlers))
+
+
+def shutdown_logging() -> None:
+    """Drains queued records and stops the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging() -> None:
     logger = logging.getLogger()
     if logger.handlers:
         return
     logger.setLevel(logging.INFO)
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(console_handler)
-    logger.addHandler(_build_handler())
+    console_handler.setFormatter(_formatter())
+    handlers: List[logging.Handler] = [console_handler, _build_handler()]
+    sampling = SamplingFilter(settings.log_sampling)
+    if settings.log_async:
+        # callers only enqueue; formatting and I/O run on the listener thread
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = ContextQueueHandler(log_queue)
+        queue_handler.addFilter(sampling)
+        logger.addHandler(queue_handler)
+        _start_listener(log_queue, handlers)
+        atexit.register(shutdown_logging)
+    else:
+        for handler in handlers:
+            handler.addFilter(sampling)
+            logger.addHandler(handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
 
 
 class ContextLoggerAdapter(logging.LoggerAdapter):
@@ -31,9 +165,8 @@ class ContextLoggerAdapter(logging.LoggerAdapter):
 
     def process(self, msg, kwargs):
         extra = kwargs.get("extra", {})
-        context = self.extra.copy()
-        context.update({"run_id": extra.get("run_id", "-"), "source_id": extra.get("source_id", "-")})
-        kwargs["extra"] = context
+        # call-site extras (payload included) win over the adapter's bound context
+        kwargs["extra"] = {**self.extra, **extra}
         return msg, kwargs
 
 
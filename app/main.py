@@ -1,15 +1,21 @@
 from fastapi import FastAPI
 
+from app.adapters.http_pool import http_pool
 from app.api.routes import create_app
 from app.core.config import settings
 from app.core.logging import configure_logging
 from app.models import entities  # noqa: F401 - ensure model registration
 from app.models.database import Base, SessionLocal, engine
+from app.models.migrations import upgrade
 from app.scheduler.scheduler import Scheduler
+from app.storage.rollups import StatsRollups
 
 
 def init_db() -> None:
     Base.metadata.create_all(bind=engine)
+    upgrade(engine)
+    with SessionLocal() as session:
+        StatsRollups(session).ensure_built()
 
 
 def build_app() -> FastAPI:
@@ -25,6 +31,7 @@ def build_app() -> FastAPI:
     @app.on_event("shutdown")
     async def _stop_scheduler():
         scheduler.stop()
+        http_pool.close()
 
     return app
 
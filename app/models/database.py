@@ -1,10 +1,63 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config import settings
 
 
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
+def _is_file_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """Pragmas applied to every new SQLite connection, in execution order."""
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        # negative cache_size is in KiB rather than pages
+        "cache_size": -abs(settings.sqlite_cache_size_kib),
+        "mmap_size": settings.sqlite_mmap_size,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "temp_store": "MEMORY",
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any] | None = None) -> None:
+    pragmas = sqlite_pragmas() if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def build_engine(url: str | None = None, pragmas: Dict[str, Any] | None = None) -> Engine:
+    """Creates the app engine; file-backed SQLite gets a sized pool and tuned pragmas on connect."""
+    url = url or settings.database_url
+    options: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False, "timeout": settings.sqlite_busy_timeout_ms / 1000}
+    if _is_file_sqlite(url) or make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_pre_ping=True,
+        )
+    built = create_engine(url, **options)
+    if make_url(url).get_backend_name() == "sqlite":
+        apply_sqlite_pragmas(built, pragmas)
+    return built
+
+
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -2,7 +2,7 @@ import json
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, LargeBinary, String, Text
 
 from app.models.database import Base
 
@@ -54,6 +54,15 @@ class IngestionRun(Base):
     duration_ms = Column(Integer, nullable=False, default=0)
     cancellation_requested = Column(Boolean, default=False)
 
+    __table_args__ = (
+        # queue heads, active-run checks and per-source history
+        Index("ix_ingestion_runs_source_status_started", "source_id", "status", "started_at"),
+        # timeout sweeps, queue depth and running-source lookups
+        Index("ix_ingestion_runs_status_started", "status", "started_at"),
+        # retention cutoffs and run listings
+        Index("ix_ingestion_runs_started_at", "started_at"),
+    )
+
 
 class RawRecord(Base):
     __tablename__ = "raw_records"
@@ -77,6 +86,20 @@ class RawRecord(Base):
     columns = Column(Text, nullable=True)
     metadata_json = Column(Text, nullable=True)
     payload_path = Column(Text, nullable=True)
+    payload_compressed = Column(LargeBinary, nullable=True)
+    payload_encoding = Column(String, nullable=True)
+    stored_size = Column(Integer, nullable=True)
+    payload_offset = Column(Integer, nullable=True)
+    payload_length = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # per-run listing and retention purges
+        Index("ix_raw_records_run_id", "run_id"),
+        # per-source listing ordered by ingest time
+        Index("ix_raw_records_source_ingest", "source_id", "ingest_time"),
+        # unfiltered and time-window listing
+        Index("ix_raw_records_ingest_time", "ingest_time"),
+    )
 
 
 class RunEvent(Base):
@@ -89,3 +112,57 @@ class RunEvent(Base):
     event_type = Column(String, nullable=False)
     message = Column(Text, nullable=False)
     error_code = Column(String, nullable=True)
+
+
+class SourceWatermark(Base):
+    __tablename__ = "source_watermarks"
+
+    source_id = Column(Integer, primary_key=True)
+    column = Column(String, nullable=False)
+    value = Column(Text, nullable=False)
+    run_id = Column(String, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+
+class PayloadBlob(Base):
+    __tablename__ = "payload_blobs"
+
+    checksum = Column(String, primary_key=True)
+    path = Column(Text, nullable=False)
+    size = Column(Integer, nullable=False)
+    encoding = Column(String, nullable=True)
+    stored_size = Column(Integer, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), default=_utcnow)
+
+
+class RunRollup(Base):
+    __tablename__ = "run_rollups"
+
+    # finished runs only; PENDING/RUNNING are counted live
+    source_id = Column(Integer, primary_key=True)
+    status = Column(String, primary_key=True)
+    runs = Column(Integer, nullable=False, default=0)
+    records = Column(Integer, nullable=False, default=0)
+    bytes_total = Column(Integer, nullable=False, default=0)
+
+
+class RecordRollup(Base):
+    __tablename__ = "record_rollups"
+
+    source_id = Column(Integer, primary_key=True)
+    format = Column(String, primary_key=True)
+    validation_status = Column(String, primary_key=True)
+    records = Column(Integer, nullable=False, default=0)
+    bytes_total = Column(Integer, nullable=False, default=0)
+
+
+class RecordHourlyRollup(Base):
+    __tablename__ = "record_hourly_rollups"
+
+    source_id = Column(Integer, primary_key=True)
+    format = Column(String, primary_key=True)
+    validation_status = Column(String, primary_key=True)
+    hour = Column(String, primary_key=True)  # UTC "YYYY-MM-DD HH:00"
+    records = Column(Integer, nullable=False, default=0)
+    bytes_total = Column(Integer, nullable=False, default=0)
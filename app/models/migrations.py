@@ -0,0 +1,49 @@
+from typing import Dict
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.core.logging import get_logger
+from app.models import entities  # noqa: F401 - ensure model registration
+from app.models.database import Base
+
+
+# columns added after their table was first released; create_all does not alter existing tables
+ADDED_COLUMNS: Dict[str, Dict[str, str]] = {
+    "raw_records": {
+        "payload_compressed": "BLOB",
+        "payload_encoding": "VARCHAR",
+        "stored_size": "INTEGER",
+        "payload_offset": "INTEGER",
+        "payload_length": "INTEGER",
+    },
+    "payload_blobs": {
+        "encoding": "VARCHAR",
+        "stored_size": "INTEGER",
+    },
+}
+
+
+def upgrade(engine: Engine) -> None:
+    """Adds missing nullable columns and indexes to tables created by an older version."""
+    logger = get_logger(__name__)
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, columns in ADDED_COLUMNS.items():
+            if not inspector.has_table(table):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, ddl in columns.items():
+                if name in existing:
+                    continue
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+                logger.info("Added column", extra={"run_id": "-", "source_id": "-", "payload": {"table": table, "column": name}})
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                index.create(conn)
+                logger.info("Created index", extra={"run_id": "-", "source_id": "-", "payload": {"table": table.name, "index": index.name}})
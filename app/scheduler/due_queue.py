@@ -0,0 +1,48 @@
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+
+class DueQueue:
+    """Min-heap of sources keyed by next due time, with lazy removal of superseded entries."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, int]] = []
+        self._due: Dict[int, float] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, source_id: int) -> bool:
+        return source_id in self._due
+
+    def schedule(self, source_id: int, due_at: float) -> None:
+        self._due[source_id] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._counter), source_id))
+
+    def remove(self, source_id: int) -> None:
+        self._due.pop(source_id, None)
+
+    def due_at(self, source_id: int) -> Optional[float]:
+        return self._due.get(source_id)
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            due_at, _, source_id = self._heap[0]
+            if self._due.get(source_id) == due_at:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> Optional[Tuple[int, float]]:
+        """Removes and returns the earliest (source_id, due_at) if it is due by ``now``."""
+        self._discard_stale()
+        if not self._heap or self._heap[0][0] > now:
+            return None
+        due_at, _, source_id = heapq.heappop(self._heap)
+        del self._due[source_id]
+        return source_id, due_at
@@ -1,36 +1,50 @@
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Set
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.models.entities import IngestionRun, SourceConfig
+from app.models.entities import SourceConfig
+from app.scheduler.due_queue import DueQueue
 from app.scheduler.timeout_monitor import TimeoutMonitor
-from app.services.rate_limiter import RateLimiter
+from app.scheduler.worker_pool import RunWorkerPool
 from app.services.run_cleanup import RunCleanupService
-from app.services.run_health import RunHealthService
-from app.services.ingestion_service import IngestionService
 from app.services.run_queue import RunQueue
-from app.services.run_state import RunStatus
 from app.services.monitor_service import MonitorService
+from app.services.schedule_parser import ScheduleParser
+from app.services.source_events import source_changes
 from app.storage.retention import RetentionPolicy
 from app.storage.retention_task import RetentionTask
-from app.services.queue_metrics import QueueMetrics
 
 
 class Scheduler:
-    """Interval-based scheduler that triggers enabled sources with schedules and dispatches queued runs."""
+    """Next-due scheduler that sleeps until the earliest source is due and dispatches runs to a worker pool."""
 
-    def __init__(self, session_factory, interval_seconds: int = 10):
+    def __init__(self, session_factory, interval_seconds: int = 10, workers: int | None = None, executor: str | None = None):
         self.session_factory = session_factory
+        # cadence for queue sweeps, retention and health reporting; source triggers use their own intervals
         self.interval_seconds = interval_seconds
+        self.pool = RunWorkerPool(
+            session_factory,
+            workers=workers or settings.scheduler_workers,
+            executor=executor or settings.scheduler_executor,
+        )
         self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._last_run: Dict[int, datetime] = {}
+        # re-entrant: a pool callback can fire synchronously while dispatch holds the lock
+        self._lock = threading.RLock()
+        self._due = DueQueue()
+        self._intervals: Dict[int, int] = {}
+        self._last_dispatch: Dict[int, float] = {}
+        self._waiting_on_worker: Set[int] = set()
+        self._sources_dirty = True
+        self._queue_dirty = True
         self.logger = get_logger(__name__)
-        self.rate_limiter = RateLimiter(interval_seconds=interval_seconds)
+        source_changes.subscribe(self._on_source_change)
+        self.pool.add_done_listener(self._on_run_done)
 
     def start(self):
         if not self._thread.is_alive():
@@ -39,20 +53,57 @@ class Scheduler:
 
     def stop(self):
         self._stop_event.set()
+        self._wakeup.set()
         self._thread.join(timeout=5)
+        source_changes.unsubscribe(self._on_source_change)
+        self.pool.shutdown(wait=False)
         self.logger.info("Scheduler stopped")
 
+    def _on_source_change(self, source_id: int) -> None:
+        with self._lock:
+            self._sources_dirty = True
+        self._wakeup.set()
+
+    def _on_run_done(self, source_id: int) -> None:
+        with self._lock:
+            if source_id in self._waiting_on_worker:
+                self._waiting_on_worker.discard(source_id)
+                if source_id in self._intervals:
+                    self._due.schedule(source_id, time.monotonic())
+            self._queue_dirty = True
+        self._wakeup.set()
+
     def _run_loop(self):
+        next_maintenance = time.monotonic()
         while not self._stop_event.is_set():
+            now = time.monotonic()
             try:
-                self._check_sources()
-                self._drain_queue()
-                self._report_health()
+                if self._sources_dirty:
+                    self._reload_sources()
+                self._dispatch_due(now)
+                maintenance_due = now >= next_maintenance
+                if maintenance_due:
+                    self._maintain()
+                    next_maintenance = now + self.interval_seconds
+                if maintenance_due or self._queue_dirty:
+                    self._drain_queue()
+                if maintenance_due:
+                    self._report_health()
             except Exception:  # pragma: no cover - background safeguard
                 self.logger.exception("Scheduler iteration failed")
-            time.sleep(self.interval_seconds)
+            self._wakeup.wait(self._sleep_seconds(next_maintenance))
+            self._wakeup.clear()
 
-    def _check_sources(self):
+    def _sleep_seconds(self, next_maintenance: float) -> float:
+        deadline = next_maintenance
+        with self._lock:
+            next_due = self._due.next_due()
+        # with the pool saturated, a finishing worker wakes the loop instead
+        if next_due is not None and self.pool.has_capacity():
+            deadline = min(deadline, next_due)
+        return max(0.0, deadline - time.monotonic())
+
+    def _reload_sources(self):
         session: Session = self.session_factory()
         try:
             sources = (
@@ -60,48 +111,68 @@ class Scheduler:
                 .filter(SourceConfig.enabled == True, SourceConfig.schedule != None)
                 .all()
             )
+            intervals = {}
             for source in sources:
-                schedule_conf = source.schedule_dict() or {}
-                interval = schedule_conf.get("interval_seconds")
-                if not interval:
-                    continue
-                last_run = self._last_run.get(source.id)
-                now = datetime.now(timezone.utc)
-                if not last_run or (now - last_run).total_seconds() >= interval:
-                    self._last_run[source.id] = now
-                    if not self.rate_limiter.allow(source.id):
-                        continue
-                    self.logger.info(
-                        "Triggering scheduled run", extra={"source_id": source.id, "run_id": "scheduler"}
-                    )
-                    service = IngestionService(session)
-                    try:
-                        service.trigger_run(source.id)
-                    except Exception:
-                        self.logger.exception("Scheduled run failed", extra={"source_id": source.id})
+                interval = ScheduleParser.interval_seconds(source.schedule_dict())
+                if interval:
+                    intervals[source.id] = interval
         finally:
             session.close()
+        now = time.monotonic()
+        with self._lock:
+            self._sources_dirty = False
+            for source_id in set(self._intervals) - set(intervals):
+                self._due.remove(source_id)
+                self._waiting_on_worker.discard(source_id)
+                self._last_dispatch.pop(source_id, None)
+            for source_id, interval in intervals.items():
+                if self._intervals.get(source_id) == interval and (source_id in self._due or source_id in self._waiting_on_worker):
+                    continue
+                last = self._last_dispatch.get(source_id)
+                self._due.schedule(source_id, now if last is None else max(now, last + interval))
+            self._intervals = intervals
+        self.logger.info("Schedule reloaded", extra={"run_id": "scheduler", "source_id": "-", "payload": {"sources": len(intervals)}})
 
-    def _drain_queue(self):
+    def _dispatch_due(self, now: float):
+        with self._lock:
+            while self.pool.has_capacity():
+                item = self._due.pop_due(now)
+                if item is None:
+                    break
+                source_id, due_at = item
+                if self.pool.is_busy(source_id):
+                    # previous run still executing; requeued when its worker finishes
+                    self._waiting_on_worker.add(source_id)
+                    continue
+                self.logger.info("Triggering scheduled run", extra={"source_id": source_id, "run_id": "scheduler"})
+                self.pool.submit_trigger(source_id)
+                self._last_dispatch[source_id] = now
+                interval = self._intervals[source_id]
+                next_due = due_at + interval
+                self._due.schedule(source_id, next_due if next_due > now else now + interval)
+
+    def _maintain(self):
         session: Session = self.session_factory()
         try:
             TimeoutMonitor(session).sweep()
             RunCleanupService(session).cleanup()
             RetentionPolicy(session).enforce()
             RetentionTask(session).run()
-            sources = session.query(SourceConfig).filter(SourceConfig.enabled == True).all()
-            for source in sources:
-                queue = RunQueue(session)
-                if queue.has_running(source.id):
+        finally:
+            session.close()
+
+    def _drain_queue(self):
+        with self._lock:
+            self._queue_dirty = False
+        session: Session = self.session_factory()
+        try:
+            queue = RunQueue(session)
+            running = queue.running_sources()
+            for pending in queue.pending_heads():
+                if pending.source_id in running or self.pool.is_busy(pending.source_id):
                     continue
-                pending = queue.next_for_source(source.id)
-                if pending:
-                    self.logger.info("Dispatching queued run", extra={"source_id": source.id, "run_id": pending.run_id})
-                    service = IngestionService(session)
-                    try:
-                        service._execute_run(pending, source)
-                    except Exception:
-                        self.logger.exception("Queued run failed", extra={"source_id": source.id})
+                if self.pool.submit_pending(pending.source_id, pending.run_id):
+                    self.logger.info("Dispatching queued run", extra={"source_id": pending.source_id, "run_id": pending.run_id})
         finally:
             session.close()
 
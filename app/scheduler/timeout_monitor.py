@@ -6,6 +6,7 @@ from app.core.config import settings
 from app.core.logging import get_logger
 from app.models.entities import IngestionRun
 from app.services.run_state import RunStatus
+from app.storage.rollups import StatsRollups, run_snapshot
 
 
 class TimeoutMonitor:
@@ -23,14 +24,17 @@ class TimeoutMonitor:
             .filter(IngestionRun.status == RunStatus.RUNNING.value)
             .all()
         )
+        rollups = StatsRollups(self.db)
         for run in candidates:
             if not run.started_at:
                 continue
             elapsed = (now - run.started_at).total_seconds()
             if elapsed >= timeout_seconds:
+                before = run_snapshot(run)
                 run.status = RunStatus.FAILED.value
                 run.error_code = "TIMEOUT"
                 run.error_message = f"Run exceeded timeout of {timeout_seconds}s"
                 run.finished_at = now
+                rollups.run_changed(run.source_id, before, run_snapshot(run))
                 self.logger.info("Marking run as timeout", extra={"run_id": run.run_id, "source_id": run.source_id})
         self.db.commit()
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from app.core.logging import get_logger
+from app.models.entities import IngestionRun, SourceConfig
+from app.services.ingestion_service import IngestionService
+from app.services.run_state import RunStatus
+
+
+def trigger_source_run(source_id: int, session_factory: Optional[Callable] = None) -> None:
+    """Worker entry point: creates and executes a run in a session owned by the worker."""
+    if session_factory is None:
+        from app.models.database import SessionLocal as session_factory
+    session = session_factory()
+    try:
+        IngestionService(session).trigger_run(source_id)
+    finally:
+        session.close()
+
+
+def execute_pending_run(run_id: str, session_factory: Optional[Callable] = None) -> None:
+    """Worker entry point: executes a queued run if it is still pending."""
+    if session_factory is None:
+        from app.models.database import SessionLocal as session_factory
+    session = session_factory()
+    try:
+        run = session.query(IngestionRun).filter(IngestionRun.run_id == run_id).first()
+        if not run or run.status != RunStatus.PENDING.value:
+            return
+        source = session.query(SourceConfig).filter(SourceConfig.id == run.source_id).first()
+        if not source:
+            return
+        IngestionService(session)._execute_run(run, source)
+    finally:
+        session.close()
+
+
+class RunWorkerPool:
+    """Bounded pool that executes runs off the scheduler thread, at most one per source."""
+
+    def __init__(self, session_factory, workers: int = 4, executor: str = "thread"):
+        self.session_factory = session_factory
+        self.workers = max(1, workers)
+        self.executor_kind = executor
+        self.logger = get_logger(__name__)
+        self._executor: Executor = self._build_executor()
+        self._active: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[int], None]] = []
+
+    def _build_executor(self) -> Executor:
+        if self.executor_kind == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        if self.executor_kind == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest-worker")
+        raise ValueError(f"Unsupported scheduler executor: {self.executor_kind}")
+
+    def add_done_listener(self, listener: Callable[[int], None]) -> None:
+        self._listeners.append(listener)
+
+    def is_busy(self, source_id: int) -> bool:
+        with self._lock:
+            return source_id in self._active
+
+    def has_capacity(self) -> bool:
+        with self._lock:
+            return len(self._active) < self.workers
+
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def submit_trigger(self, source_id: int) -> bool:
+        return self._submit(source_id, trigger_source_run, source_id)
+
+    def submit_pending(self, source_id: int, run_id: str) -> bool:
+        return self._submit(source_id, execute_pending_run, run_id)
+
+    def _submit(self, source_id: int, func: Callable, arg) -> bool:
+        with self._lock:
+            if source_id in self._active or len(self._active) >= self.workers:
+                return False
+            # sessions cannot cross process boundaries; process workers open their own
+            if self.executor_kind == "process":
+                future = self._executor.submit(func, arg)
+            else:
+                future = self._executor.submit(func, arg, self.session_factory)
+            self._active[source_id] = future
+        future.add_done_callback(lambda f, sid=source_id: self._on_done(sid, f))
+        return True
+
+    def _on_done(self, source_id: int, future: Future) -> None:
+        with self._lock:
+            self._active.pop(source_id, None)
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(
+                "Worker run failed",
+                exc_info=future.exception(),
+                extra={"run_id": "scheduler", "source_id": source_id},
+            )
+        for listener in self._listeners:
+            listener(source_id)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -9,3 +9,6 @@ class DiagnosticsSnapshot(BaseModel):
     queues: Dict
     record_totals: Dict
     record_status: Dict
+    http_pools: Dict = {}
+    payload_blobs: Dict = {}
+    caches: Dict = {}
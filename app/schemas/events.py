@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RunEventRead(BaseModel):
@@ -13,8 +13,7 @@ class RunEventRead(BaseModel):
     message: str
     error_code: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RunEventsPage(BaseModel):
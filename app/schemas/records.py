@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RawRecordRead(BaseModel):
@@ -21,9 +21,10 @@ class RawRecordRead(BaseModel):
     columns: Optional[str]
     metadata_json: Optional[str]
     payload_path: Optional[str]
+    payload_encoding: Optional[str] = None
+    stored_size: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RecordsResponse(BaseModel):
@@ -37,5 +38,8 @@ class RecordReadSingle(RawRecordRead):
 class RecordsPage(BaseModel):
     page: int
     page_size: int
-    total: int
+    # None when the caller asked for total=none
+    total: Optional[int]
     items: List[RawRecordRead]
+    # pass back as ?cursor= for the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RunRead(BaseModel):
@@ -17,8 +17,7 @@ class RunRead(BaseModel):
     started_at: datetime
     finished_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TriggerResponse(BaseModel):
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.models.entities import IngestionRun
 from app.services.run_state import RunStatus
+from app.storage.rollups import StatsRollups, run_snapshot
 
 
 class BulkCancelService:
@@ -19,8 +20,11 @@ class BulkCancelService:
             .all()
         )
         ids = []
+        rollups = StatsRollups(self.db)
         for run in runs:
+            before = run_snapshot(run)
             run.status = RunStatus.CANCELED.value
+            rollups.run_changed(run.source_id, before, run_snapshot(run))
             ids.append(run.run_id)
         self.db.commit()
         return ids
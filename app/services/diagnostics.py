@@ -1,9 +1,11 @@
 from typing import Dict
 
+from app.adapters.http_pool import http_pool
 from app.services.monitor_service import MonitorService
 from app.services.runtime_info import RuntimeInfo
 from app.services.record_stats import RecordStatsService
 from app.services.version_info import VersionInfo
+from app.storage.blob_store import BlobStore
 
 
 class DiagnosticsService:
@@ -23,4 +25,6 @@ class DiagnosticsService:
             "record_totals": stats.totals(),
             "record_status": stats.by_status(),
             "versions": VersionInfo.snapshot(),
+            "http_pools": http_pool.stats(),
+            "payload_blobs": BlobStore(self.db).stats(),
         }
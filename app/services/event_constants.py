@@ -2,6 +2,7 @@ class EventType:
     RUN_STARTED = "RUN_STARTED"
     FETCH_STARTED = "FETCH_STARTED"
     FETCH_DONE = "FETCH_DONE"
+    FETCH_NOT_MODIFIED = "FETCH_NOT_MODIFIED"
     DETECT_DONE = "DETECT_DONE"
     VALIDATION_DONE = "VALIDATION_DONE"
     STORAGE_DONE = "STORAGE_DONE"
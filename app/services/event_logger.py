@@ -1,18 +1,28 @@
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.models.entities import RunEvent
 
 
 class EventLogger:
-    """Persists run events for audit trail."""
+    """Persists run events for audit trail.
 
-    def __init__(self, db: Session):
+    Events are buffered and written in one transaction by ``flush`` (called at stage boundaries and
+    before a run is finalized) or once the buffer reaches its size or age threshold.
+    """
+
+    def __init__(self, db: Session, max_pending: int | None = None, max_age_seconds: float | None = None):
         self.db = db
         self.logger = get_logger(__name__)
+        self.max_pending = max(1, max_pending or settings.event_buffer_size)
+        self.max_age_seconds = settings.event_flush_seconds if max_age_seconds is None else max_age_seconds
+        self._pending: List[RunEvent] = []
+        self._oldest: float = 0.0
 
     def log(
         self,
@@ -31,9 +41,25 @@ class EventLogger:
             message=message,
             error_code=error_code,
         )
-        self.db.add(event)
-        self.db.commit()
+        if not self._pending:
+            self._oldest = time.monotonic()
+        self._pending.append(event)
         self.logger.info(
             "run_event",
             extra={"run_id": run_id, "source_id": "-", "payload": {"stage": stage, "type": event_type, "code": error_code}},
         )
+        if len(self._pending) >= self.max_pending or time.monotonic() - self._oldest >= self.max_age_seconds:
+            self.flush()
+
+    def flush(self, commit: bool = True) -> None:
+        """Writes buffered events; with commit=False they join the session's next commit."""
+        if not self._pending:
+            return
+        self.db.add_all(self._pending)
+        self._pending = []
+        if commit:
+            self.db.commit()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
@@ -1,11 +1,12 @@
 import hashlib
 import uuid
 from datetime import datetime, timezone
-from typing import List
+from typing import Callable, Iterable
 
 from sqlalchemy.orm import Session
 
 from app.adapters.factory import get_adapter
+from app.core.config import settings
 from app.core.error_codes import ErrorCode
 from app.core.errors import AdapterError, IngestionError, RetryableError, SourceNotFoundError, StorageError, ValidationError
 from app.core.logging import get_logger
@@ -13,6 +14,7 @@ from app.models.entities import IngestionRun, RawRecord, SourceConfig
 from app.services.metrics import RunMetrics
 from app.services.statistics import RunStatistics
 from app.services.run_manager import RunManager
+from app.services.run_repository import RunRepository
 from app.services.run_reporter import RunReporter
 from app.services.run_state import RunStatus
 from app.services.run_context import new_context
@@ -25,15 +27,15 @@ from app.services.source_validator import SourceValidator
 from app.services.event_logger import EventLogger
 from app.services.event_constants import EventType
 from app.services.payload_audit import PayloadAudit
-from app.services.run_labeler import RunLabeler
 from app.services.run_metrics_logger import RunMetricsLogger
 from app.services.trace_context import TraceContext, TraceEmitter
-from app.services.payload_stats import PayloadStats
+from app.services.watermark_store import WatermarkStore
+from app.services.payload_pipeline import PayloadPipeline
 from app.storage.payload_service import PayloadService
 from app.storage.record_builder import RecordBuilder
 from app.storage.sample_writer import SampleWriter
 from app.validation.basic import BasicValidator
-from app.validation.detector import FormatDetector
+from app.validation.analyzer import PayloadAnalyzer
 from app.validation.payload import PayloadValidator
 
 
@@ -51,16 +53,15 @@ class IngestionService:
         self.runtime_info = RuntimeInfo()
         self.event_logger = EventLogger(db)
         self.payload_audit = PayloadAudit()
-        self.run_labeler = RunLabeler()
         self.metrics_logger = RunMetricsLogger()
         self.trace_emitter = TraceEmitter()
-        self.payload_stats = PayloadStats()
 
     def trigger_run(self, source_id: int) -> str:
+        active_run = RunRepository(self.db).get_active_run(source_id)
         run = self.run_manager.create_run(source_id)
         source = self.db.query(SourceConfig).filter(SourceConfig.id == source_id).first()
-        if run.status == RunStatus.PENDING.value:
-            # start immediately if no other active run
+        if run.status == RunStatus.PENDING.value and active_run is None:
+            # start immediately if no other active run; otherwise it stays queued for the scheduler
             SourceValidator.validate(source.type, source.params_dict())
             self.debug_tools.snapshot_source(source)
             runtime_snapshot = self.runtime_info.as_dict()
@@ -82,21 +83,50 @@ class IngestionService:
         logger = get_logger(__name__, run_id=run.run_id, source_id=str(source.id))
         metrics = RunMetrics(started_at=datetime.now(timezone.utc))
         stats = RunStatistics()
+        # RUN_STARTED rides the RUNNING transition's commit
+        self.event_logger.flush(commit=False)
         self.run_manager.start_run(run)
         self.reporter.started(run.run_id, source.id)
         adapter = get_adapter(source.type, source.params_dict())
+        watermarks = WatermarkStore(self.db)
+        watermark_column = adapter.watermark_column()
+        start_watermark = watermarks.load(source.id, watermark_column) if watermark_column else None
         try:
             def _run_fetch():
+                # a retried attempt resumes from the committed watermark, not from rows it never stored
+                adapter.watermark = start_watermark
                 self.event_logger.log(run.run_id, stage="FETCH", event_type=EventType.FETCH_STARTED, message="Starting fetch")
-                payloads = adapter.fetch()
-                self.event_logger.log(run.run_id, stage="FETCH", event_type=EventType.FETCH_DONE, message=f"Fetched {len(payloads)} payloads")
-                stored_items = self._process_payloads(payloads, run, source.id, metrics, stats)
-                run.message = f"Stored {len(stored_items)} records"
+
+                def _stage_watermark() -> None:
+                    # the pipeline does not read ahead, so adapter.watermark is the batch's last row;
+                    # it commits with the batch, so a run failing later does not refetch stored rows
+                    if watermark_column and adapter.watermark is not None and adapter.watermark != start_watermark:
+                        watermarks.save(source.id, watermark_column, adapter.watermark, run.run_id, commit=False)
+
+                stored_count = self._process_payloads(
+                    adapter.iter_payloads(),
+                    run,
+                    source.id,
+                    metrics,
+                    stats,
+                    compression=source.params_dict().get("compression"),
+                    before_commit=_stage_watermark,
+                )
+                for location in adapter.unchanged:
+                    self.event_logger.log(
+                        run.run_id,
+                        stage="FETCH",
+                        event_type=EventType.FETCH_NOT_MODIFIED,
+                        message=f"Skipped unchanged payload: {location}",
+                    )
+                adapter.commit_state()
+                run.message = f"Stored {stored_count} records"
                 logger.info(run.message)
 
             self.run_manager.execute_with_retry(_run_fetch, metrics, run)
             metrics.finished_at = datetime.now(timezone.utc)
-            self.run_manager.finalize_run(run, metrics, RunStatus.SUCCESS, error_code=ErrorCode.UNKNOWN)
+            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_SUCCESS, message="Run succeeded")
+            self._finalize(run, metrics, RunStatus.SUCCESS, error_code=ErrorCode.UNKNOWN)
             self.reporter.finished(
                 run.run_id,
                 source.id,
@@ -104,51 +134,80 @@ class IngestionService:
                 {"records": stats.records, "bytes": stats.bytes_total, "duration_ms": metrics.duration_ms},
             )
             self.log_enricher.complete(run.run_id, source.id, {"status": "SUCCESS", "records": stats.records})
-            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_SUCCESS, message="Run succeeded")
             self.metrics_logger.log(run.run_id, source.id, metrics)
         except (AdapterError, RetryableError, StorageError, ValidationError) as exc:
             metrics.finished_at = datetime.now(timezone.utc)
-            self.run_manager.finalize_run(run, metrics, RunStatus.FAILED, error_code=getattr(exc, "error_code", ErrorCode.UNKNOWN), error_message=str(exc))
+            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=getattr(exc, "error_code", None))
+            self._finalize(run, metrics, RunStatus.FAILED, error_code=getattr(exc, "error_code", ErrorCode.UNKNOWN), error_message=str(exc))
             logger.exception("Run failed")
             self.log_enricher.failure(run.run_id, source.id, str(exc))
-            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=getattr(exc, "error_code", None))
         except SourceNotFoundError as exc:
             metrics.finished_at = datetime.now(timezone.utc)
-            self.run_manager.finalize_run(run, metrics, RunStatus.FAILED, error_code=ErrorCode.SOURCE_NOT_FOUND, error_message=str(exc))
+            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=ErrorCode.SOURCE_NOT_FOUND)
+            self._finalize(run, metrics, RunStatus.FAILED, error_code=ErrorCode.SOURCE_NOT_FOUND, error_message=str(exc))
             logger.exception("Run failed")
             self.log_enricher.failure(run.run_id, source.id, str(exc))
-            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=ErrorCode.SOURCE_NOT_FOUND)
         except IngestionError as exc:
             metrics.finished_at = datetime.now(timezone.utc)
-            self.run_manager.finalize_run(run, metrics, RunStatus.FAILED, error_code=getattr(exc, "error_code", ErrorCode.UNKNOWN), error_message=str(exc))
+            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=getattr(exc, "error_code", None))
+            self._finalize(run, metrics, RunStatus.FAILED, error_code=getattr(exc, "error_code", ErrorCode.UNKNOWN), error_message=str(exc))
             logger.exception("Run failed")
             self.log_enricher.failure(run.run_id, source.id, str(exc))
-            self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_FAILED, message=str(exc), error_code=getattr(exc, "error_code", None))
         finally:
             if self.run_manager.should_cancel(run):
                 self.reporter.canceled(run.run_id, source.id)
                 self.run_tags.annotate(run.run_id, source.id, "canceled_by_request")
                 self.event_logger.log(run.run_id, stage="RUN", event_type=EventType.RUN_CANCELED, message="Cancellation requested")
+            self.event_logger.flush()
+
+    def _finalize(self, run: IngestionRun, metrics: RunMetrics, status: RunStatus, **kwargs) -> None:
+        # buffered events, including the failure event, commit in the same transaction as the final status
+        self.event_logger.flush(commit=False)
+        self.run_manager.finalize_run(run, metrics, status, **kwargs)
 
-    def _process_payloads(self, payloads: List[dict], run: IngestionRun, source_id: int, metrics: RunMetrics, stats: RunStatistics) -> List[RawRecord]:
+    def _process_payloads(
+        self,
+        payloads: Iterable[dict],
+        run: IngestionRun,
+        source_id: int,
+        metrics: RunMetrics,
+        stats: RunStatistics,
+        compression: str | None = None,
+        before_commit: Callable[[], None] | None = None,
+    ) -> int:
         builder = RecordBuilder(run.run_id, source_id)
-        records = builder.build_many(payloads, FormatDetector, BasicValidator)
-        self.event_logger.log(run.run_id, stage="PROCESS", event_type=EventType.DETECT_DONE, message=f"Detected {len(records)} payloads")
-        for rec in records:
-            payload_bytes = rec["payload"]
-            metrics.add_payload(payload_bytes)
-            stats.update(payload_bytes)
+        pipeline = PayloadPipeline(
+            builder,
+            PayloadAnalyzer,
+            BasicValidator,
+            batch_size=settings.pipeline_batch_size,
+            max_inflight_bytes=settings.pipeline_max_inflight_bytes,
+        )
+        payload_service = PayloadService(self.db, compression=compression)
+        stored = 0
+        try:
+            for batch in pipeline.batches(payloads):
+                if stored == 0:
+                    self.sample_writer.write(run.run_id, source_id, batch[0]["payload"])
+                # file storage strips payload bytes from the records, so count them first
+                for rec in batch:
+                    metrics.add_payload(rec["payload"])
+                    stats.update(rec["payload"])
+                stored += payload_service.persist(run_id=run.run_id, source_id=source_id, records=batch, before_commit=before_commit)
+        except RetryableError as exc:
+            # batches are committed as they go, so a retry would store them twice
+            if stored:
+                raise AdapterError(f"Fetch failed after {stored} records were stored: {exc}", ErrorCode.RETRYABLE) from exc
+            raise
+        totals = pipeline.totals
+        self.event_logger.log(run.run_id, stage="FETCH", event_type=EventType.FETCH_DONE, message=f"Fetched {totals.records} payloads")
+        self.event_logger.log(run.run_id, stage="PROCESS", event_type=EventType.DETECT_DONE, message=f"Detected {totals.records} payloads")
         self.event_logger.log(run.run_id, stage="VALIDATION", event_type=EventType.VALIDATION_DONE, message="Validation completed")
-        self.payload_audit.log(run.run_id, source_id, records)
-        stats_summary = self.payload_stats.summarize(records)
-        self.log_enricher.emit(run.run_id, source_id, {"payload_stats": stats_summary})
-        labels = self.run_labeler.labels_for_payloads(records)
-        self.run_tags.annotate(run.run_id, source_id, f"formats:{labels}")
-        stored = PayloadService(self.db).persist(run_id=run.run_id, source_id=source_id, records=records)
+        self.payload_audit.log_summary(run.run_id, source_id, totals.audit_summary())
+        self.log_enricher.emit(run.run_id, source_id, {"payload_stats": totals.size_summary()})
+        self.run_tags.annotate(run.run_id, source_id, f"formats:{totals.formats}")
         run.records_count = stats.records
         run.bytes_total = stats.bytes_total
-        self.event_logger.log(run.run_id, stage="STORAGE", event_type=EventType.STORAGE_DONE, message=f"Persisted {len(stored)} records")
-        if records:
-            sample = records[0]["payload"]
-            self.sample_writer.write(run.run_id, source_id, sample)
+        self.event_logger.log(run.run_id, stage="STORAGE", event_type=EventType.STORAGE_DONE, message=f"Persisted {stored} records")
+        self.event_logger.flush()
         return stored
@@ -0,0 +1,27 @@
+from typing import Callable, Dict
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.ttl_cache import SnapshotCache
+
+# shared by every request in the process; run changes show up once the TTL lapses, since with
+# many sources finishing every second an invalidate-on-write cache would almost never hit
+monitoring_cache = SnapshotCache(
+    ttl_seconds=settings.monitoring_cache_ttl_seconds,
+    stale_seconds=settings.monitoring_cache_stale_seconds,
+)
+
+
+def cached_snapshot(key: str, db: Session, build: Callable[[Session], Dict]) -> Dict:
+    """Returns build()'s snapshot from the monitoring cache, computing it on a miss."""
+    engine = db.get_bind()
+    # keyed per engine so databases sharing the process never see each other's snapshots
+    cache_key = (key, engine)
+
+    def _load() -> Dict:
+        # background refreshes outlive the request, so every load gets its own session
+        with Session(bind=engine) as session:
+            return build(session)
+
+    return monitoring_cache.get(cache_key, _load)
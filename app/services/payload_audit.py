@@ -16,5 +16,7 @@ class PayloadAudit:
         return {"records": len(records), "bytes": total}
 
     def log(self, run_id: str, source_id: int, records: List[dict]) -> None:
-        summary = self.summarize(records)
+        self.log_summary(run_id, source_id, self.summarize(records))
+
+    def log_summary(self, run_id: str, source_id: int, summary: Dict[str, int]) -> None:
         self.logger.info("payload_audit", extra={"run_id": run_id, "source_id": source_id, "payload": summary})
@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List
+
+from app.core.config import settings
+from app.storage.record_builder import RecordBuilder
+
+
+@dataclass
+class PipelineTotals:
+    """Running totals over every record that passed through the pipeline."""
+
+    records: int = 0
+    bytes_total: int = 0
+    min_size: int = 0
+    max_size: int = 0
+    formats: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: dict) -> None:
+        size = record.get("raw_size", 0)
+        self.min_size = size if self.records == 0 else min(self.min_size, size)
+        self.max_size = max(self.max_size, size)
+        self.records += 1
+        self.bytes_total += size
+        fmt = record.get("format", "UNKNOWN")
+        self.formats[fmt] = self.formats.get(fmt, 0) + 1
+
+    def audit_summary(self) -> Dict[str, int]:
+        return {"records": self.records, "bytes": self.bytes_total}
+
+    def size_summary(self) -> Dict[str, int]:
+        if not self.records:
+            return {"min": 0, "max": 0, "avg": 0}
+        return {"min": self.min_size, "max": self.max_size, "avg": int(self.bytes_total / self.records)}
+
+
+class PayloadPipeline:
+    """Streams payload entries through analysis/validation into bounded record batches."""
+
+    def __init__(
+        self,
+        builder: RecordBuilder,
+        analyzer,
+        validator,
+        *,
+        batch_size: int | None = None,
+        max_inflight_bytes: int | None = None,
+    ):
+        self.builder = builder
+        self.analyzer = analyzer
+        self.validator = validator
+        self.batch_size = max(1, batch_size or settings.pipeline_batch_size)
+        self.max_inflight_bytes = max(1, max_inflight_bytes or settings.pipeline_max_inflight_bytes)
+        self.totals = PipelineTotals()
+
+    def batches(self, payloads: Iterable[dict]) -> Iterator[List[dict]]:
+        """Yields record batches; a batch is flushed once it reaches the record or byte bound."""
+        batch: List[dict] = []
+        inflight = 0
+        for payload_entry in payloads:
+            record = self.builder.build_entry(payload_entry, self.analyzer, self.validator)
+            self.totals.add(record)
+            batch.append(record)
+            inflight += len(record["payload"])
+            if len(batch) >= self.batch_size or inflight >= self.max_inflight_bytes:
+                yield batch
+                batch = []
+                inflight = 0
+        if batch:
+            yield batch
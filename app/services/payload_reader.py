@@ -4,11 +4,13 @@ from typing import Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.models.entities import RawRecord
+from app.services.payload_stream import PayloadStream
+from app.storage.compression import PayloadCompressor
 from app.storage.file_loader import FileLoader
 
 
 class PayloadReader:
-    """Reads payloads from DB or filesystem depending on stored path."""
+    """Reads payloads from DB or filesystem depending on stored path, decompressing transparently."""
 
     def __init__(self, db: Session):
         self.db = db
@@ -18,7 +20,26 @@ class PayloadReader:
         record = self.db.query(RawRecord).filter(RawRecord.record_id == record_id).first()
         if not record:
             return None, None
-        if record.payload_path:
+        return self.read(record), record.content_type
+
+    def read(self, record: RawRecord) -> Optional[bytes]:
+        if record.payload_path and record.payload_offset is not None:
+            data = self.file_loader.read_range(record.payload_path, record.payload_offset, record.payload_length or 0)
+        elif record.payload_path:
             data = self.file_loader.read(record.payload_path)
-            return data, record.content_type
-        return record.payload.encode("utf-8"), record.content_type
+        elif record.payload_compressed is not None:
+            data = record.payload_compressed
+        else:
+            return record.payload.encode("utf-8")
+        if data is None:
+            return None
+        return PayloadCompressor.decompress(data, record.payload_encoding)
+
+    def open_stream(self, record: RawRecord) -> Optional[PayloadStream]:
+        """Streams uncompressed files straight from disk; other payloads are materialised once."""
+        if record.payload_path and not record.payload_encoding:
+            if record.payload_offset is not None:
+                return PayloadStream.from_file(record.payload_path, record.payload_offset, record.payload_length or 0)
+            return PayloadStream.from_file(record.payload_path)
+        data = self.read(record)
+        return PayloadStream.from_bytes(data) if data is not None else None
@@ -0,0 +1,89 @@
+import os
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from app.core.config import settings
+
+
+@dataclass
+class PayloadStream:
+    """Stored payload bytes exposed as a sized, range-readable chunk stream.
+
+    Uncompressed file-backed payloads (plain files, blobs, segment slices) are read from disk
+    on demand; everything else is served from an in-memory buffer.
+    """
+
+    size: int
+    path: Optional[str] = None
+    offset: int = 0
+    data: Optional[bytes] = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PayloadStream":
+        return cls(size=len(data), data=data)
+
+    @classmethod
+    def from_file(cls, path: str, offset: int = 0, length: Optional[int] = None) -> Optional["PayloadStream"]:
+        try:
+            file_size = os.path.getsize(path)
+        except OSError:
+            return None
+        size = file_size - offset if length is None else length
+        if size < 0 or offset + size > file_size:
+            return None
+        return cls(size=size, path=path, offset=offset)
+
+    def chunks(self, start: int = 0, end: Optional[int] = None, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yields bytes start..end inclusive."""
+        end = self.size - 1 if end is None else end
+        chunk_size = chunk_size or settings.payload_stream_chunk_bytes
+        if self.data is not None:
+            view = memoryview(self.data)
+            for position in range(start, end + 1, chunk_size):
+                yield bytes(view[position:min(position + chunk_size, end + 1)])
+            return
+        remaining = end - start + 1
+        with open(self.path, "rb") as handle:
+            handle.seek(self.offset + start)
+            while remaining > 0:
+                chunk = handle.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Resolves a single ``bytes=`` Range header to an inclusive (start, end).
+
+    Returns None when the whole payload should be served (no header, another unit or a
+    multi-range request) and raises ValueError when the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if first == "":
+        # suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(0, size - suffix), size - 1
+    start, end = int(first), int(last) if last else size - 1
+    if last and start > end:
+        return None
+    if start >= size:
+        raise ValueError("Unsatisfiable range")
+    return start, min(end, size - 1)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -1,5 +1,6 @@
 from typing import Dict
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.entities import IngestionRun
@@ -14,11 +15,9 @@ class QueueMetrics:
 
     def depth(self) -> Dict[int, int]:
         rows = (
-            self.db.query(IngestionRun.source_id, IngestionRun.run_id)
+            self.db.query(IngestionRun.source_id, func.count())
             .filter(IngestionRun.status == RunStatus.PENDING.value)
+            .group_by(IngestionRun.source_id)
             .all()
         )
-        counts: Dict[int, int] = {}
-        for source_id, _ in rows:
-            counts[source_id] = counts.get(source_id, 0) + 1
-        return counts
+        return {source_id: count for source_id, count in rows}
@@ -0,0 +1,30 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class RecordCursor:
+    """Opaque keyset position in the (ingest_time, record_id) ordering of raw records."""
+
+    ingest_time: datetime
+    record_id: int
+    sort: str = "desc"
+
+    def encode(self) -> str:
+        raw = json.dumps({"t": self.ingest_time.isoformat(), "id": self.record_id, "s": self.sort}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, text: str) -> "RecordCursor":
+        """Raises ValueError when the cursor was not produced by encode()."""
+        try:
+            padded = text + "=" * (-len(text) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            cursor = cls(datetime.fromisoformat(data["t"]), int(data["id"]), data.get("s", "desc"))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if cursor.sort not in ("asc", "desc"):
+            raise ValueError("Invalid cursor")
+        return cursor
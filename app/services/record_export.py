@@ -0,0 +1,75 @@
+import base64
+import json
+import zlib
+from typing import Iterator, List, Optional
+
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.entities import RawRecord
+from app.schemas.records import RawRecordRead
+from app.services.payload_reader import PayloadReader
+from app.services.record_filter import RecordFilter
+
+EXPORT_COMPRESSIONS = ("gzip",)
+
+
+class RecordExporter:
+    """Streams filtered records as NDJSON in keyset batches so memory stays bounded by one batch."""
+
+    def __init__(self, db: Session, batch_size: int | None = None, flush_bytes: int | None = None):
+        self.db = db
+        self.batch_size = max(1, batch_size or settings.export_batch_size)
+        self.flush_bytes = max(1, flush_bytes or settings.payload_stream_chunk_bytes)
+        self.reader = PayloadReader(db)
+
+    def batches(self, record_filter: RecordFilter) -> Iterator[List[RawRecord]]:
+        """Each batch is a fresh query after the last (ingest_time, record_id), so no read transaction spans the export."""
+        key = tuple_(RawRecord.ingest_time, RawRecord.record_id)
+        last = None
+        while True:
+            query = record_filter.apply(self.db.query(RawRecord))
+            if last is not None:
+                query = query.filter(key > tuple_(literal(last[0], RawRecord.ingest_time.type), literal(last[1])))
+            batch = query.order_by(RawRecord.ingest_time.asc(), RawRecord.record_id.asc()).limit(self.batch_size).all()
+            if not batch:
+                return
+            last = (batch[-1].ingest_time, batch[-1].record_id)
+            yield batch
+            # drop the batch from the identity map before loading the next one
+            self.db.expunge_all()
+            if len(batch) < self.batch_size:
+                return
+
+    def line(self, record: RawRecord, include_payload: bool = True) -> bytes:
+        entry = RawRecordRead.model_validate(record).model_dump(mode="json")
+        if include_payload:
+            data = self.reader.read(record)
+            if data is None:
+                entry["payload"] = None
+            else:
+                try:
+                    entry["payload"] = data.decode("utf-8")
+                except UnicodeDecodeError:
+                    entry["payload_base64"] = base64.b64encode(data).decode("ascii")
+        return json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def ndjson(self, record_filter: RecordFilter, include_payload: bool = True, compression: Optional[str] = None) -> Iterator[bytes]:
+        """Yields NDJSON chunks of roughly flush_bytes, gzip-framed when compression is "gzip"."""
+        # wbits=31 writes a gzip header and trailer
+        compressor = zlib.compressobj(settings.payload_compression_level, zlib.DEFLATED, 31) if compression == "gzip" else None
+        buffer = bytearray()
+        for batch in self.batches(record_filter):
+            for record in batch:
+                buffer += self.line(record, include_payload)
+                if len(buffer) >= self.flush_bytes:
+                    chunk = compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+                    buffer.clear()
+                    if chunk:
+                        yield chunk
+        tail = bytes(buffer)
+        if compressor:
+            tail = compressor.compress(tail) + compressor.flush()
+        if tail:
+            yield tail
@@ -1,13 +1,24 @@
+from dataclasses import astuple
 from datetime import datetime
 from typing import List, Optional, Tuple
 
+from sqlalchemy import literal, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.entities import RawRecord
 from app.services.time_window import TimeWindow
 from app.services.record_filter import RecordFilter
 from app.services.payload_reader import PayloadReader
+from app.services.payload_stream import PayloadStream
+from app.services.record_cursor import RecordCursor
 from app.services.record_limiter import RecordLimiter
+from app.services.ttl_cache import TTLCache
+
+TOTAL_MODES = ("exact", "cached", "none")
+
+# filtered totals shared across requests; a page only pays a COUNT once per TTL
+_count_cache = TTLCache(ttl_seconds=settings.records_count_ttl_seconds, max_entries=1024)
 
 
 class RecordQueryService:
@@ -36,7 +47,17 @@ class RecordQueryService:
         sort: str,
         page: int,
         page_size: int,
-    ) -> Tuple[int, List[RawRecord]]:
+        cursor: Optional[str] = None,
+        total_mode: str = "cached",
+    ) -> Tuple[Optional[int], List[RawRecord], Optional[str]]:
+        """Returns (total, items, next_cursor).
+
+        With a cursor the page is a keyset seek on (ingest_time, record_id) and ``page`` is ignored.
+        ``total_mode`` is exact, cached (shared TTL cache per filter) or none.
+        Raises ValueError for an unreadable cursor or unknown total_mode.
+        """
+        if total_mode not in TOTAL_MODES:
+            raise ValueError(f"total_mode must be one of {', '.join(TOTAL_MODES)}")
         start, end = TimeWindow.parse(from_time, to_time)
         record_filter = RecordFilter(
             run_id=run_id,
@@ -48,13 +69,37 @@ class RecordQueryService:
         )
         query = record_filter.apply(self.db.query(RawRecord))
         page_size = RecordLimiter().clamp(page_size)
-        total = query.count()
-        if sort == "asc":
-            query = query.order_by(RawRecord.ingest_time.asc())
+        total = self._total(query, record_filter, total_mode)
+
+        position = RecordCursor.decode(cursor) if cursor else None
+        if position is not None:
+            sort = position.sort
+        descending = sort != "asc"
+        key = tuple_(RawRecord.ingest_time, RawRecord.record_id)
+        if position is not None:
+            bound = tuple_(literal(position.ingest_time, RawRecord.ingest_time.type), literal(position.record_id))
+            query = query.filter(key < bound if descending else key > bound)
+        if descending:
+            query = query.order_by(RawRecord.ingest_time.desc(), RawRecord.record_id.desc())
         else:
-            query = query.order_by(RawRecord.ingest_time.desc())
-        items = query.offset((page - 1) * page_size).limit(page_size).all()
-        return total, items
+            query = query.order_by(RawRecord.ingest_time.asc(), RawRecord.record_id.asc())
+        if position is None:
+            query = query.offset((page - 1) * page_size)
+        items = query.limit(page_size).all()
+
+        next_cursor = None
+        if len(items) == page_size:
+            last = items[-1]
+            next_cursor = RecordCursor(last.ingest_time, last.record_id, "desc" if descending else "asc").encode()
+        return total, items, next_cursor
+
+    def _total(self, query, record_filter: RecordFilter, total_mode: str) -> Optional[int]:
+        if total_mode == "none":
+            return None
+        if total_mode == "exact":
+            return query.count()
+        key = (self.db.get_bind(), *astuple(record_filter))
+        return _count_cache.get_or_load(key, query.count)
 
     def get_record(self, record_id: int) -> Optional[RawRecord]:
         return self.db.query(RawRecord).filter(RawRecord.record_id == record_id).first()
@@ -62,3 +107,9 @@ class RecordQueryService:
     def get_payload(self, record_id: int) -> Tuple[Optional[bytes], Optional[str]]:
         reader = PayloadReader(self.db)
         return reader.fetch(record_id)
+
+    def read_payload(self, record: RawRecord) -> Optional[bytes]:
+        return PayloadReader(self.db).read(record)
+
+    def open_payload(self, record: RawRecord) -> Optional[PayloadStream]:
+        return PayloadReader(self.db).open_stream(record)
@@ -1,28 +1,23 @@
 from typing import Dict
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.models.entities import RawRecord
+from app.models.entities import RecordRollup
+from app.storage.rollups import StatsRollups
 
 
 class RecordStatsService:
-    """Aggregates record statistics for monitoring."""
+    """Aggregates record statistics for monitoring from the record rollup."""
 
     def __init__(self, db: Session):
         self.db = db
+        self.rollups = StatsRollups(db)
 
     def by_format(self) -> Dict[str, int]:
-        rows = self.db.query(RawRecord.format, func.count(RawRecord.record_id)).group_by(RawRecord.format).all()
-        return {fmt: count for fmt, count in rows}
+        return self.rollups.record_counts(RecordRollup.format)
 
     def by_status(self) -> Dict[str, int]:
-        rows = (
-            self.db.query(RawRecord.validation_status, func.count(RawRecord.record_id))
-            .group_by(RawRecord.validation_status)
-            .all()
-        )
-        return {status: count for status, count in rows}
+        return self.rollups.record_counts(RecordRollup.validation_status)
 
     def totals(self) -> Dict[str, int]:
-        return {"records": self.db.query(func.count(RawRecord.record_id)).scalar() or 0}
+        return {"records": self.rollups.record_total()}
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from app.core.logging import get_logger
 from app.models.entities import IngestionRun
 from app.services.run_state import RunStatus
+from app.storage.rollups import StatsRollups, run_snapshot
 
 
 class RunCleanupService:
@@ -22,8 +23,11 @@ class RunCleanupService:
             .filter(IngestionRun.status == RunStatus.PENDING.value, IngestionRun.started_at < cutoff)
             .all()
         )
+        rollups = StatsRollups(self.db)
         for run in stale:
+            before = run_snapshot(run)
             run.status = RunStatus.CANCELED.value
             run.error_message = "Stale pending run canceled by cleanup"
+            rollups.run_changed(run.source_id, before, run_snapshot(run))
             self.logger.info("Canceling stale run", extra={"run_id": run.run_id, "source_id": run.source_id})
         self.db.commit()
@@ -1,5 +1,6 @@
 from typing import Dict
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
@@ -15,13 +16,19 @@ class RunHealthService:
         self.logger = get_logger(__name__)
 
     def snapshot(self) -> Dict[str, int]:
-        counts = {"running": 0, "pending": 0, "failed": 0}
-        for status, key in [
-            (RunStatus.RUNNING.value, "running"),
-            (RunStatus.PENDING.value, "pending"),
-            (RunStatus.FAILED.value, "failed"),
-        ]:
-            total = self.db.query(IngestionRun).filter(IngestionRun.status == status).count()
-            counts[key] = total
+        keys = {
+            RunStatus.RUNNING.value: "running",
+            RunStatus.PENDING.value: "pending",
+            RunStatus.FAILED.value: "failed",
+        }
+        counts = {key: 0 for key in keys.values()}
+        rows = (
+            self.db.query(IngestionRun.status, func.count())
+            .filter(IngestionRun.status.in_(list(keys)))
+            .group_by(IngestionRun.status)
+            .all()
+        )
+        for status, total in rows:
+            counts[keys[status]] = total
         self.logger.info("Run health snapshot", extra={"run_id": "-", "source_id": "-", "payload": counts})
         return counts
@@ -1,4 +1,5 @@
 import time
+import uuid
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
@@ -13,6 +14,7 @@ from app.models.entities import IngestionRun, SourceConfig
 from app.services.run_validator import RunValidator
 from app.services.metrics import RunMetrics
 from app.services.run_state import RunStatus
+from app.storage.rollups import StatsRollups, run_snapshot
 
 
 class RunManager:
@@ -46,7 +48,8 @@ class RunManager:
             raise SourceBusyError("Source has an active run", ErrorCode.SOURCE_BUSY)
 
         run = IngestionRun(
-            run_id=str(int(time.time() * 1000)),
+            # millisecond prefix keeps ids time-ordered; the suffix keeps parallel workers from colliding
+            run_id=f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}",
             source_id=source_id,
             status=RunStatus.PENDING.value,
             started_at=datetime.now(timezone.utc),
@@ -106,6 +109,13 @@ class RunManager:
         error_code: str = ErrorCode.UNKNOWN,
         error_message: Optional[str] = None,
     ) -> None:
+        # the committed row, not the in-memory one: a timeout sweep may already have finished the run
+        with self.db.no_autoflush:
+            before = (
+                self.db.query(IngestionRun.status, IngestionRun.records_count, IngestionRun.bytes_total)
+                .filter(IngestionRun.run_id == run.run_id)
+                .one()
+            )
         run.status = status.value
         run.error_code = error_code
         run.error_message = error_message
@@ -113,4 +123,5 @@ class RunManager:
         run.bytes_total = metrics.bytes_total
         run.duration_ms = metrics.duration_ms
         run.finished_at = metrics.finished_at or datetime.now(timezone.utc)
+        StatsRollups(self.db).run_changed(run.source_id, tuple(before), run_snapshot(run))
         self.db.commit()
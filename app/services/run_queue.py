@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
 from sqlalchemy.orm import Session
 
-from app.models.entities import IngestionRun
+from app.models.entities import IngestionRun, SourceConfig
 from app.services.run_state import RunStatus
 
 
@@ -31,3 +31,26 @@ class RunQueue:
             .first()
             is not None
         )
+
+    def pending_heads(self) -> List[IngestionRun]:
+        """Returns the oldest pending run of every enabled source in a single query."""
+        runs = (
+            self.db.query(IngestionRun)
+            .join(SourceConfig, SourceConfig.id == IngestionRun.source_id)
+            .filter(IngestionRun.status == RunStatus.PENDING.value, SourceConfig.enabled == True)
+            .order_by(IngestionRun.started_at.asc())
+            .all()
+        )
+        heads: Dict[int, IngestionRun] = {}
+        for run in runs:
+            heads.setdefault(run.source_id, run)
+        return list(heads.values())
+
+    def running_sources(self) -> Set[int]:
+        rows = (
+            self.db.query(IngestionRun.source_id)
+            .filter(IngestionRun.status == RunStatus.RUNNING.value)
+            .distinct()
+            .all()
+        )
+        return {source_id for (source_id,) in rows}
@@ -1,5 +1,8 @@
+import os
 import platform
 import sys
+from datetime import datetime
+from pathlib import Path
 from typing import Dict
 
 from app.core.logging import get_logger
@@ -0,0 +1,28 @@
+import threading
+from typing import Callable, List
+
+
+class SourceChangeNotifier:
+    """Process-wide notification hook fired when a source configuration changes."""
+
+    def __init__(self):
+        self._listeners: List[Callable[[int], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[int], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def notify(self, source_id: int) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(source_id)
+
+
+source_changes = SourceChangeNotifier()
@@ -4,6 +4,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.models.entities import SourceConfig
+from app.services.source_events import source_changes
 
 
 class SourceManager:
@@ -23,6 +24,7 @@ class SourceManager:
         self.db.add(source)
         self.db.commit()
         self.db.refresh(source)
+        source_changes.notify(source.id)
         return source
 
     def update(self, source_id: int, payload) -> Optional[SourceConfig]:
@@ -41,6 +43,7 @@ class SourceManager:
             source.schedule = json.dumps(payload.schedule)
         self.db.commit()
         self.db.refresh(source)
+        source_changes.notify(source.id)
         return source
 
     def list(self) -> List[SourceConfig]:
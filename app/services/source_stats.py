@@ -2,26 +2,26 @@ from typing import Dict
 
 from sqlalchemy.orm import Session
 
-from app.models.entities import IngestionRun
+from app.services.run_state import RunStatus
+from app.storage.rollups import StatsRollups
 
 
 class SourceStatsService:
-    """Aggregates per-source statistics from runs."""
+    """Aggregates per-source statistics from the run rollup."""
 
     def __init__(self, db: Session):
         self.db = db
 
     def stats_for_source(self, source_id: int) -> Dict[str, int]:
-        runs = self.db.query(IngestionRun).filter(IngestionRun.source_id == source_id).all()
         totals = {"runs": 0, "success": 0, "failed": 0, "canceled": 0, "records": 0, "bytes": 0}
-        for run in runs:
-            totals["runs"] += 1
-            if run.status == "SUCCESS":
-                totals["success"] += 1
-            if run.status == "FAILED":
-                totals["failed"] += 1
-            if run.status == "CANCELED":
-                totals["canceled"] += 1
-            totals["records"] += run.records_count or 0
-            totals["bytes"] += run.bytes_total or 0
+        for status, (runs, records, bytes_total) in StatsRollups(self.db).run_totals(source_id).items():
+            totals["runs"] += runs
+            if status == RunStatus.SUCCESS.value:
+                totals["success"] += runs
+            if status == RunStatus.FAILED.value:
+                totals["failed"] += runs
+            if status == RunStatus.CANCELED.value:
+                totals["canceled"] += runs
+            totals["records"] += records
+            totals["bytes"] += bytes_total
         return totals
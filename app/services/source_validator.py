@@ -3,6 +3,7 @@ from typing import Dict
 
 from app.core.errors import AdapterConfigurationError
 from app.services.schedule_parser import ScheduleParser
+from app.storage.compression import PayloadCompressor
 
 
 class SourceValidator:
@@ -19,6 +20,7 @@ class SourceValidator:
         else:
             raise AdapterConfigurationError(f"Unsupported source type: {source_type}")
         SourceValidator._validate_schedule(params.get("schedule"))
+        SourceValidator._validate_compression(params.get("compression"))
 
     @staticmethod
     def _validate_http(params: Dict) -> None:
@@ -27,6 +29,13 @@ class SourceValidator:
         method = (params.get("method") or "GET").upper()
         if method not in {"GET", "POST"}:
             raise AdapterConfigurationError("HTTP source only supports GET/POST")
+        pagination = params.get("pagination") or {}
+        try:
+            concurrency = int(pagination.get("concurrency", 1))
+        except (TypeError, ValueError):
+            concurrency = 0
+        if concurrency < 1:
+            raise AdapterConfigurationError("HTTP pagination concurrency must be a positive integer")
 
     @staticmethod
     def _validate_file(params: Dict) -> None:
@@ -45,6 +54,24 @@ class SourceValidator:
         mode = params.get("mode", "table")
         if mode not in {"table", "query"}:
             raise AdapterConfigurationError("SQLite mode must be table or query")
+        paging = params.get("paging", "offset")
+        if paging not in {"offset", "keyset"}:
+            raise AdapterConfigurationError("SQLite paging must be offset or keyset")
+        if paging == "keyset" and mode == "query" and not params.get("key_column"):
+            raise AdapterConfigurationError("SQLite keyset paging over a query requires key_column")
+        watermark_column = params.get("watermark_column")
+        if watermark_column is not None and (not isinstance(watermark_column, str) or not watermark_column.strip()):
+            raise AdapterConfigurationError("SQLite watermark_column must be a column name")
+        # without a unique tie column, rows sharing the last watermark value would be skipped on resume
+        if watermark_column and mode == "query" and not params.get("key_column"):
+            raise AdapterConfigurationError("SQLite watermark_column over a query requires key_column")
+
+    @staticmethod
+    def _validate_compression(compression):
+        if compression is None:
+            return
+        if str(compression).lower() not in {"none", *PayloadCompressor.CODECS}:
+            raise AdapterConfigurationError("compression must be none, gzip, zlib or zstd")
 
     @staticmethod
     def _validate_schedule(schedule):
@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.core.logging import get_logger
+
+
+class TTLCache:
+    """Thread-safe bounded cache whose entries expire a fixed time after they were stored."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.clock() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            # loaders run outside the lock; concurrent misses may both load
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+class SnapshotCache:
+    """Process-wide snapshot cache with stale-while-revalidate.
+
+    A value younger than ttl_seconds is served as-is. For a further stale_seconds it is still
+    served while one background thread reloads it; after that the caller loads it inline, with
+    concurrent callers for the same key waiting on a single load.
+    """
+
+    def __init__(self, ttl_seconds: float, stale_seconds: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.clock = clock
+        self.logger = get_logger(__name__)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._refreshing: Set[Hashable] = set()
+        # bumped by invalidate() so loads that started earlier cannot store outdated values
+        self._generation = 0
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self.clock() - entry[0]
+                if age < self.ttl_seconds:
+                    self._counters["hits"] += 1
+                    return entry[1]
+                if age < self.ttl_seconds + self.stale_seconds:
+                    self._counters["stale_hits"] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(target=self._refresh, args=(key, loader, self._generation), daemon=True).start()
+                    return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                # loaded by the caller we were waiting on
+                if entry is not None and self.clock() - entry[0] < self.ttl_seconds:
+                    self._counters["hits"] += 1
+                    return entry[1]
+                self._counters["misses"] += 1
+                generation = self._generation
+            value = loader()
+            self._store(key, value, generation)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            self._counters["invalidations"] += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counters = {name: self._counters[name] for name in ("hits", "stale_hits", "misses", "refreshes", "refresh_errors", "invalidations")}
+            counters["entries"] = len(self._entries)
+        return counters
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self.clock(), value)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], generation: int) -> None:
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self._counters["refresh_errors"] += 1
+            self.logger.exception("Snapshot refresh failed", extra={"run_id": "-", "source_id": "-", "payload": {"key": str(key)}})
+        else:
+            self._store(key, value, generation)
+            with self._lock:
+                self._counters["refreshes"] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
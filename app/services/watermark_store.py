@@ -0,0 +1,43 @@
+import json
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.entities import SourceWatermark
+
+
+class WatermarkStore:
+    """Persists the last processed incremental position of each source next to its runs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def load(self, source_id: int, column: str) -> Optional[Any]:
+        mark = self.db.get(SourceWatermark, source_id)
+        if mark is None or mark.column != column:
+            # a different watermark column means positions are not comparable; start over
+            return None
+        try:
+            return json.loads(mark.value)
+        except json.JSONDecodeError:
+            return None
+
+    def save(self, source_id: int, column: str, value: Any, run_id: str, commit: bool = True) -> None:
+        """commit=False leaves the change for the caller's transaction, e.g. the batch it belongs to."""
+        mark = self.db.get(SourceWatermark, source_id)
+        if mark is None:
+            mark = SourceWatermark(source_id=source_id)
+            self.db.add(mark)
+        mark.column = column
+        mark.value = json.dumps(value, default=str)
+        mark.run_id = run_id
+        if commit:
+            self.db.commit()
+
+    def reset(self, source_id: int) -> bool:
+        mark = self.db.get(SourceWatermark, source_id)
+        if mark is None:
+            return False
+        self.db.delete(mark)
+        self.db.commit()
+        return True
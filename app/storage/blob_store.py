@@ -0,0 +1,129 @@
+import os
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.errors import StorageError
+from app.core.logging import get_logger
+from app.models.entities import PayloadBlob
+from app.storage.compression import PayloadCompressor
+
+
+class BlobStore:
+    """Content-addressed payload files keyed by SHA-256 with reference counts in payload_blobs.
+
+    Reference changes are flushed into the caller's transaction; the record insert commits them,
+    so a blob's count always matches the records that point at it.
+    """
+
+    def __init__(self, db: Session, base_dir: Path | None = None, compressor: PayloadCompressor | None = None):
+        self.db = db
+        self.compressor = compressor or PayloadCompressor("none")
+        self.logger = get_logger(__name__)
+        # shard directories are created by _write, so read-only and release-only uses touch no disk
+        self.base_dir = base_dir or settings.data_dir / "blobs"
+
+    def blob_path(self, checksum: str) -> Path:
+        return self.base_dir / checksum[:2] / checksum[2:4] / checksum
+
+    def put_many(self, records: List[dict]) -> None:
+        """Points each record at its blob, writing content only for checksums not stored yet."""
+        refs = Counter(record["checksum"] for record in records)
+        bodies = {record["checksum"]: record["payload"] for record in records}
+        stored: Dict[str, Tuple[Optional[str], int]] = {}
+        for checksum, count in refs.items():
+            path = self.blob_path(checksum)
+            body = bodies[checksum]
+            # reviving a released (ref_count=0) blob counts as new, so its file is rewritten below
+            stmt = insert(PayloadBlob).values(checksum=checksum, path=str(path), size=len(body), ref_count=count)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PayloadBlob.checksum],
+                set_={"ref_count": PayloadBlob.ref_count + stmt.excluded.ref_count},
+            ).returning(PayloadBlob.ref_count, PayloadBlob.encoding, PayloadBlob.stored_size)
+            total, encoding, stored_size = self.db.execute(stmt).one()
+            if total == count:
+                # new blob: the compression setting of the run that first stores the content applies
+                data, encoding = self.compressor.compress(body)
+                stored_size = len(data)
+                self._write(path, data)
+                self.db.execute(
+                    update(PayloadBlob)
+                    .where(PayloadBlob.checksum == checksum)
+                    .values(encoding=encoding, stored_size=stored_size)
+                )
+            elif not path.exists():
+                self._write(path, PayloadCompressor.encode(body, encoding, self.compressor.level))
+            stored[checksum] = (encoding, stored_size if stored_size is not None else len(body))
+        for record in records:
+            encoding, stored_size = stored[record["checksum"]]
+            record["payload_path"] = str(self.blob_path(record["checksum"]))
+            record["payload_encoding"] = encoding
+            record["stored_size"] = stored_size
+            record["payload"] = b""
+
+    def release(self, refs: Iterable[Tuple[str, Optional[str]]]) -> List[str]:
+        """Drops one reference per (checksum, payload_path) pair.
+
+        Blobs left without references stay as ref_count=0 rows until sweep() removes them.
+        Returns the payload paths that are not blobs (plain file-mode payloads) for the caller
+        to delete once it has committed.
+        """
+        counts: Counter = Counter()
+        loose: List[str] = []
+        for checksum, payload_path in refs:
+            if not payload_path:
+                continue
+            if checksum and payload_path == str(self.blob_path(checksum)):
+                counts[checksum] += 1
+            else:
+                loose.append(payload_path)
+        for checksum, count in counts.items():
+            self.db.execute(
+                update(PayloadBlob).where(PayloadBlob.checksum == checksum).values(ref_count=PayloadBlob.ref_count - count)
+            )
+        return loose
+
+    def sweep(self) -> int:
+        """Deletes blobs still at zero references and their files, then commits.
+
+        The DELETE holds SQLite's write lock until the commit, so put_many cannot revive a blob
+        between the check and the unlink; a revival committed earlier has already raised its
+        ref_count and keeps the row out of the DELETE.
+        """
+        paths = self.db.execute(delete(PayloadBlob).where(PayloadBlob.ref_count <= 0).returning(PayloadBlob.path)).scalars().all()
+        for path in paths:
+            try:
+                Path(path).unlink(missing_ok=True)
+            except OSError:
+                self.logger.exception("Failed to delete blob", extra={"run_id": "-", "source_id": "-", "payload": path})
+        self.db.commit()
+        return len(paths)
+
+    def stats(self) -> dict:
+        blobs, stored_bytes, references = self.db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(func.coalesce(PayloadBlob.stored_size, PayloadBlob.size)), 0),
+                func.coalesce(func.sum(PayloadBlob.ref_count), 0),
+            ).where(PayloadBlob.ref_count > 0)
+        ).one()
+        return {"blobs": blobs, "stored_bytes": stored_bytes, "references": references}
+
+    def _write(self, path: Path, body: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(delete=False, dir=path.parent, suffix=".tmp") as tmp:
+                tmp.write(body)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+                temp_path = Path(tmp.name)
+            os.replace(temp_path, path)
+        except Exception as exc:
+            raise StorageError(f"Blob write failed: {exc}", ErrorCode.STORAGE_FAILED) from exc
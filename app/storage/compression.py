@@ -0,0 +1,68 @@
+import gzip
+import zlib
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.errors import StorageError
+from app.core.logging import get_logger
+
+try:  # optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+
+class PayloadCompressor:
+    """Compresses stored payloads with gzip/zlib (or zstd when installed) and reverses it on read."""
+
+    CODECS = ("gzip", "zlib", "zstd")
+    FILE_SUFFIXES = {"gzip": ".gz", "zlib": ".zz", "zstd": ".zst"}
+
+    def __init__(self, codec: str | None = None, level: int | None = None, min_bytes: int | None = None):
+        codec = (codec or settings.payload_compression).lower()
+        if codec != "none" and codec not in self.CODECS:
+            raise ValueError(f"Unsupported payload compression: {codec}")
+        if codec == "zstd" and zstandard is None:
+            get_logger(__name__).warning(
+                "zstd compression requested but the 'zstandard' package is missing; using gzip",
+                extra={"run_id": "-", "source_id": "-"},
+            )
+            codec = "gzip"
+        self.codec = None if codec == "none" else codec
+        self.level = settings.payload_compression_level if level is None else level
+        self.min_bytes = settings.payload_compression_min_bytes if min_bytes is None else min_bytes
+
+    def compress(self, data: bytes) -> Tuple[bytes, Optional[str]]:
+        """Returns the bytes to store and their encoding; payloads that do not shrink are kept as-is."""
+        if self.codec is None or len(data) < self.min_bytes:
+            return data, None
+        packed = self.encode(data, self.codec, self.level)
+        if len(packed) >= len(data):
+            return data, None
+        return packed, self.codec
+
+    @staticmethod
+    def encode(data: bytes, encoding: Optional[str], level: int = 6) -> bytes:
+        if not encoding:
+            return data
+        if encoding == "gzip":
+            # mtime=0 keeps output deterministic for identical payloads
+            return gzip.compress(data, compresslevel=level, mtime=0)
+        if encoding == "zlib":
+            return zlib.compress(data, level)
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdCompressor(level=level).compress(data)
+        raise StorageError(f"Cannot encode payload with {encoding}", ErrorCode.STORAGE_FAILED)
+
+    @staticmethod
+    def decompress(data: bytes, encoding: Optional[str]) -> bytes:
+        if not encoding:
+            return data
+        if encoding == "gzip":
+            return gzip.decompress(data)
+        if encoding == "zlib":
+            return zlib.decompress(data)
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(data)
+        raise StorageError(f"Cannot decode payload stored with {encoding}", ErrorCode.STORAGE_FAILED)
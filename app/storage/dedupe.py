@@ -1,5 +1,8 @@
-from app.storage.dedupe_index import DedupeIndex
 from pathlib import Path
+from typing import List
+
+from app.core.config import settings
+from app.storage.dedupe_index import DedupeIndex
 
 
 class DedupeStrategy:
@@ -7,12 +10,34 @@ class DedupeStrategy:
 
     def __init__(self, mode: str = "store", state_path: Path | None = None):
         self.mode = mode
-        self.index = DedupeIndex(state_path or Path(".state/dedupe_index.json"))
+        self.state_path = state_path or settings.dedupe_index_path
+        self._index: DedupeIndex | None = None
+
+    @property
+    def index(self) -> DedupeIndex:
+        # only skip mode consults the index, so store-mode and db-mode engines never open it
+        if self._index is None:
+            self._index = DedupeIndex.open(self.state_path)
+        return self._index
+
+    def select(self, records: List[dict]) -> List[dict]:
+        """Filters a batch with one index lookup and one write instead of a round trip per record."""
+        if self.mode != "skip":
+            return records
+        checksums = [record["checksum"] for record in records]
+        seen = self.index.seen(checksums)
+        kept = []
+        for record in records:
+            if record["checksum"] in seen:
+                continue
+            # later repeats inside the same batch are duplicates too
+            seen.add(record["checksum"])
+            kept.append(record)
+        self.index.add_many(checksums)
+        return kept
 
     def should_store(self, checksum: str) -> bool:
-        if self.mode == "skip":
-            if self.index.contains(checksum):
-                return False
-        self.index.add(checksum)
-        self.index.save()
-        return True
+        return bool(self.select([{"checksum": checksum}]))
+
+    def expire(self) -> int:
+        return self.index.expire() if self.mode == "skip" else 0
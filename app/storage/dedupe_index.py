@@ -1,30 +1,128 @@
 import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Set
+from typing import Callable, Dict, Iterable, Set
+
+from app.core.config import settings
+from app.storage.bloom import BloomFilter
 
 
 class DedupeIndex:
-    """Persists checksums to disk to survive restarts."""
+    """Checksums seen by the dedupe strategy, kept in an indexed SQLite table with TTL expiry.
+
+    An in-memory Bloom filter answers most negative lookups without touching the table.
+    Instances are shared per path through ``open`` so the filter is built once per process.
+    """
+
+    _instances: Dict[Path, "DedupeIndex"] = {}
+    _instances_lock = threading.Lock()
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int | None = None,
+        bloom_capacity: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
         self.path = path
+        self.clock = clock
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._checksums: Set[str] = set()
-        self._load()
+        self.ttl_seconds = settings.dedupe_ttl_days * 86400 if ttl_seconds is None else ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checksums (checksum TEXT PRIMARY KEY, last_seen REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_checksums_last_seen ON checksums(last_seen)")
+        self._conn.commit()
+        self._migrate_legacy_json()
+        self._bloom_capacity = bloom_capacity or settings.dedupe_bloom_capacity
+        self._bloom = self._build_bloom()
 
-    def _load(self):
-        if self.path.exists():
-            try:
-                data = json.loads(self.path.read_text())
-                self._checksums = set(data.get("checksums", []))
-            except Exception:
-                self._checksums = set()
+    @classmethod
+    def open(cls, path: Path) -> "DedupeIndex":
+        key = path.resolve()
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(path)
+            return cls._instances[key]
 
-    def save(self):
-        self.path.write_text(json.dumps({"checksums": list(self._checksums)}))
+    def _migrate_legacy_json(self) -> None:
+        legacy = self.path.with_suffix(".json")
+        if not legacy.exists():
+            return
+        try:
+            checksums = json.loads(legacy.read_text()).get("checksums", [])
+        except Exception:
+            checksums = []
+        now = self.clock()
+        self._conn.executemany("INSERT OR IGNORE INTO checksums VALUES (?, ?)", ((c, now) for c in checksums))
+        self._conn.commit()
+        legacy.rename(legacy.with_suffix(".json.migrated"))
+
+    def _build_bloom(self) -> BloomFilter:
+        # sized from the live row count, so expired checksums give their room back on rebuild
+        total = self._conn.execute("SELECT COUNT(*) FROM checksums").fetchone()[0]
+        bloom = BloomFilter(max(self._bloom_capacity, total * 2))
+        for (checksum,) in self._conn.execute("SELECT checksum FROM checksums"):
+            bloom.add(checksum)
+        return bloom
+
+    def _cutoff(self) -> float:
+        return self.clock() - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+
+    def seen(self, checksums: Iterable[str]) -> Set[str]:
+        """Returns the subset of checksums recorded within the TTL."""
+        candidates = [c for c in set(checksums) if c in self._bloom]
+        found: Set[str] = set()
+        cutoff = self._cutoff()
+        with self._lock:
+            for start in range(0, len(candidates), 500):
+                chunk = candidates[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT checksum FROM checksums WHERE checksum IN ({placeholders}) AND last_seen >= ?",
+                    (*chunk, cutoff),
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def add_many(self, checksums: Iterable[str]) -> None:
+        """Records (or refreshes) checksums in one transaction."""
+        unique = set(checksums)
+        if not unique:
+            return
+        now = self.clock()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO checksums VALUES (?, ?) ON CONFLICT(checksum) DO UPDATE SET last_seen = excluded.last_seen",
+                ((c, now) for c in unique),
+            )
+            self._conn.commit()
+            for checksum in unique:
+                self._bloom.add(checksum)
+            if self._bloom.saturated:
+                # past capacity the false-positive rate climbs; rebuild at twice the table's size
+                self._bloom = self._build_bloom()
+
+    def expire(self) -> int:
+        """Deletes checksums older than the TTL; the Bloom filter keeps them as harmless false positives."""
+        if self.ttl_seconds <= 0:
+            return 0
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM checksums WHERE last_seen < ?", (self._cutoff(),)).rowcount
+            self._conn.commit()
+        return deleted
 
     def add(self, checksum: str):
-        self._checksums.add(checksum)
+        self.add_many([checksum])
 
     def contains(self, checksum: str) -> bool:
-        return checksum in self._checksums
+        return checksum in self.seen([checksum])
+
+    def save(self):
+        """Kept for callers of the JSON index; writes are committed by add_many."""
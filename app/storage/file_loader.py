@@ -18,3 +18,15 @@ class FileLoader:
         except Exception:
             self.logger.exception("Failed to read payload file", extra={"run_id": "-", "source_id": "-", "payload": path_str})
         return None
+
+    def read_range(self, path_str: str, offset: int, length: int) -> Optional[bytes]:
+        try:
+            with open(path_str, "rb") as handle:
+                handle.seek(offset)
+                data = handle.read(length)
+            return data if len(data) == length else None
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.logger.exception("Failed to read payload segment", extra={"run_id": "-", "source_id": "-", "payload": path_str})
+        return None
@@ -2,21 +2,30 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
 from app.core.config import settings
 from app.core.error_codes import ErrorCode
 from app.core.errors import StorageError
+from app.storage.compression import PayloadCompressor
 from app.storage.storage_mode import StorageMode
 
 
 class FileSystemStorage:
-    """Stores payloads on disk with atomic writes and dedupe options."""
+    """Stores payloads on disk with atomic writes and dedupe options.
+
+    Files land in <run_id>/<checksum[:2]>/<source_id>_<seq>_<checksum[:16]>.<ext>; the sequence is an
+    in-memory per-run counter, so naming never lists a directory and each shard stays small.
+    """
+
+    SHARD_CHARS = 2
 
     def __init__(self, base_dir: Path | None = None, dedupe_mode: str = "store"):
         self.base_dir = base_dir or settings.data_dir / "raw"
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.dedupe_mode = dedupe_mode
+        self._sequences: Dict[str, int] = {}
+        self._known_dirs: Set[Path] = set()
 
     def _extension(self, content_type: Optional[str]) -> str:
         if not content_type:
@@ -29,14 +38,27 @@ class FileSystemStorage:
             return "txt"
         return "bin"
 
-    def _target_path(self, run_id: str, source_id: int, ext: str) -> Path:
-        run_dir = self.base_dir / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-        return run_dir / f"{source_id}_{len(list(run_dir.glob('*')))}.{ext}"
+    def _target_path(self, run_id: str, source_id: int, ext: str, checksum: str) -> Path:
+        shard_dir = self.base_dir / run_id / checksum[: self.SHARD_CHARS]
+        if shard_dir not in self._known_dirs:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(shard_dir)
+        seq = self._sequences.get(run_id, 0)
+        self._sequences[run_id] = seq + 1
+        # the checksum in the name keeps a restarted counter (e.g. a retried run) from clobbering other content
+        return shard_dir / f"{source_id}_{seq:06d}_{checksum[:16]}.{ext}"
 
-    def write_payload(self, run_id: str, source_id: int, payload: bytes, content_type: Optional[str], checksum: str) -> Path:
-        ext = self._extension(content_type)
-        target = self._target_path(run_id, source_id, ext)
+    def write_payload(
+        self,
+        run_id: str,
+        source_id: int,
+        payload: bytes,
+        content_type: Optional[str],
+        checksum: str,
+        encoding: Optional[str] = None,
+    ) -> Path:
+        ext = self._extension(content_type) + PayloadCompressor.FILE_SUFFIXES.get(encoding, "")
+        target = self._target_path(run_id, source_id, ext, checksum)
         if self.dedupe_mode == "skip" and target.exists():
             return target
         try:
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict
+
+
+class HttpValidatorStore:
+    """JSON-backed cache of ETag/Last-Modified validators keyed by request URL."""
+
+    _write_lock = threading.Lock()
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.state: Dict[str, Dict[str, str]] = self._load()
+        self._pending: Dict[str, Dict[str, str]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self.path.exists():
+            try:
+                return json.loads(self.path.read_text())
+            except Exception:
+                return {}
+        return {}
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        validators = self.state.get(key) or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def remember(self, key: str, response_headers) -> None:
+        validators = {
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+        }
+        if validators["etag"] or validators["last_modified"]:
+            self._pending[key] = validators
+
+    def save(self) -> None:
+        if not self._pending:
+            return
+        # several sources share the file, so merge into the latest copy instead of overwriting it
+        with self._write_lock:
+            state = self._load()
+            state.update(self._pending)
+            with tempfile.NamedTemporaryFile("w", delete=False, dir=self.path.parent, suffix=".tmp") as tmp:
+                tmp.write(json.dumps(state))
+            os.replace(tmp.name, self.path)
+        self.state = state
+        self._pending = {}
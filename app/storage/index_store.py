@@ -1,6 +1,7 @@
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
 class FileIndexStore:
@@ -28,13 +29,19 @@ class FileIndexStore:
     def record_mtime(self, file_path: Path) -> None:
         self.state["mtime"][str(file_path)] = file_path.stat().st_mtime
 
-    def is_seen_checksum(self, file_path: Path) -> bool:
+    def is_seen_checksum(self, file_path: Path, checksum: Optional[str] = None) -> bool:
+        """Compares the recorded SHA-256 of the raw file bytes; hashes the file in chunks if not given."""
         key = str(file_path)
         recorded = self.state["checksum"].get(key)
         if not recorded:
             return False
-        current = file_path.read_bytes()
-        return recorded == current
+        if checksum is None:
+            digest = hashlib.sha256()
+            with file_path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            checksum = digest.hexdigest()
+        return recorded == checksum
 
     def record_checksum(self, file_path: Path, checksum: str) -> None:
         self.state["checksum"][str(file_path)] = checksum
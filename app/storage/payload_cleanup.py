@@ -11,7 +11,8 @@ class PayloadCleanup:
         self.logger = get_logger(__name__)
 
     def delete_paths(self, paths: List[str]) -> None:
-        for path_str in paths:
+        # segment files are shared by every record of a run, so the same path can repeat
+        for path_str in dict.fromkeys(paths):
             if not path_str:
                 continue
             path = Path(path_str)
@@ -1,18 +1,35 @@
-from typing import List
+from typing import Callable, List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.storage.storage_engine import StorageEngine
-from app.storage.raw_storage import persist_raw_records
+from app.storage.raw_storage import bulk_insert_raw_records, persist_raw_records
 
 
 class PayloadService:
     """Coordinates storage mode selection and persistence."""
 
-    def __init__(self, db: Session, storage_engine: StorageEngine | None = None):
+    def __init__(
+        self,
+        db: Session,
+        storage_engine: StorageEngine | None = None,
+        insert_mode: str | None = None,
+        chunk_size: int | None = None,
+        compression: str | None = None,
+    ):
         self.db = db
-        self.storage_engine = storage_engine or StorageEngine()
+        self.storage_engine = storage_engine or StorageEngine(db=db, compression=compression)
+        self.insert_mode = insert_mode or settings.insert_mode
+        self.chunk_size = chunk_size or settings.bulk_insert_chunk_size
 
-    def persist(self, run_id: str, source_id: int, records: List[dict]):
+    def persist(self, run_id: str, source_id: int, records: List[dict], before_commit: Optional[Callable[[], None]] = None) -> int:
+        """Stores a batch; before_commit stages extra rows (e.g. the watermark) into the insert's transaction."""
         stored_records = self.storage_engine.persist_payloads(records)
-        return persist_raw_records(self.db, run_id=run_id, source_id=source_id, items=stored_records)
+        if before_commit is not None:
+            before_commit()
+        if self.insert_mode == "bulk":
+            bulk_insert_raw_records(self.db, run_id=run_id, source_id=source_id, items=stored_records, chunk_size=self.chunk_size)
+        else:
+            persist_raw_records(self.db, run_id=run_id, source_id=source_id, items=stored_records)
+        return len(stored_records)
@@ -1,9 +1,45 @@
 import hashlib
-from typing import List
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
 from app.models.entities import RawRecord
+from app.storage.blob_store import BlobStore
+from app.storage.rollups import StatsRollups
+
+
+def _record_values(item: dict, run_id: str, source_id: int, ingest_time: Optional[datetime] = None) -> Dict:
+    payload_bytes = item["payload"]
+    # file storage blanks the payload, so prefer the checksum computed before that
+    checksum = item.get("checksum") or hashlib.sha256(payload_bytes).hexdigest()
+    return {
+        "run_id": run_id,
+        "source_id": source_id,
+        # set explicitly so the record rollup buckets the row under the hour it is stored with
+        "ingest_time": ingest_time or datetime.now(timezone.utc),
+        "format": item["format"],
+        "raw_size": item["raw_size"],
+        "payload": payload_bytes.decode("utf-8", errors="replace"),
+        "checksum": checksum,
+        "validation_status": item["validation_status"],
+        "validation_message": item["validation_message"],
+        "error_code": item.get("validation_code"),
+        "validation_details": item.get("validation_details"),
+        "content_type": item.get("content_type"),
+        "source_uri": item.get("source_uri"),
+        "status_code": item.get("status_code"),
+        "row_count": item.get("row_count"),
+        "columns": item.get("columns"),
+        "metadata_json": item.get("metadata_json"),
+        "payload_path": item.get("payload_path"),
+        "payload_compressed": item.get("payload_compressed"),
+        "payload_encoding": item.get("payload_encoding"),
+        "stored_size": item.get("stored_size", len(payload_bytes)),
+        "payload_offset": item.get("payload_offset"),
+        "payload_length": item.get("payload_length"),
+    }
 
 
 def persist_raw_records(
@@ -14,29 +50,60 @@ def persist_raw_records(
     items: List[dict],
 ) -> List[RawRecord]:
     stored = []
-    for item in items:
-        payload_bytes = item["payload"]
-        checksum = hashlib.sha256(payload_bytes).hexdigest()
-        record = RawRecord(
-            run_id=run_id,
-            source_id=source_id,
-            format=item["format"],
-            raw_size=item["raw_size"],
-            payload=payload_bytes.decode("utf-8", errors="replace"),
-            checksum=checksum,
-            validation_status=item["validation_status"],
-            validation_message=item["validation_message"],
-            error_code=item.get("validation_code"),
-            validation_details=item.get("validation_details"),
-            content_type=item.get("content_type"),
-            source_uri=item.get("source_uri"),
-            status_code=item.get("status_code"),
-            row_count=item.get("row_count"),
-            columns=item.get("columns"),
-            metadata_json=item.get("metadata_json"),
-            payload_path=item.get("payload_path"),
-        )
+    rows = [_record_values(item, run_id, source_id) for item in items]
+    for values in rows:
+        record = RawRecord(**values)
         db.add(record)
         stored.append(record)
+    StatsRollups(db).records_added(rows)
     db.commit()
     return stored
+
+
+def bulk_insert_raw_records(
+    db: Session,
+    *,
+    run_id: str,
+    source_id: int,
+    items: List[dict],
+    chunk_size: int = 500,
+    return_ids: bool = False,
+) -> List[int]:
+    """Inserts records with executemany in chunks, skipping the ORM unit of work.
+
+    Generated record ids are only fetched when ``return_ids`` is set; otherwise an
+    empty list is returned and callers rely on ``len(items)``.
+    """
+    table = RawRecord.__table__
+    chunk_size = max(1, chunk_size)
+    ids: List[int] = []
+    rollups = StatsRollups(db)
+    ingest_time = datetime.now(timezone.utc)
+    for start in range(0, len(items), chunk_size):
+        rows = [_record_values(item, run_id, source_id, ingest_time) for item in items[start : start + chunk_size]]
+        if return_ids:
+            stmt = insert(table).returning(table.c.record_id, sort_by_parameter_order=True)
+            ids.extend(db.execute(stmt, rows).scalars().all())
+        else:
+            db.execute(insert(table), rows)
+        rollups.records_added(rows)
+    db.commit()
+    return ids
+
+
+def purge_run_records(db: Session, run_ids: List[str]) -> List[str]:
+    """Deletes the runs' records and releases their blob references without committing.
+
+    Returns plain payload file paths to delete once the caller has committed; unreferenced
+    blobs are left for BlobStore.sweep().
+    """
+    if not run_ids:
+        return []
+    refs = db.execute(
+        select(RawRecord.checksum, RawRecord.payload_path).where(
+            RawRecord.run_id.in_(run_ids), RawRecord.payload_path.is_not(None)
+        )
+    ).all()
+    StatsRollups(db).records_removed(run_ids)
+    db.execute(delete(RawRecord).where(RawRecord.run_id.in_(run_ids)))
+    return BlobStore(db).release(refs)
@@ -1,6 +1,8 @@
 import hashlib
+import json
 from typing import Dict, List
 
+from app.validation.analyzer import PayloadAnalysis
 from app.validation.payload import PayloadValidator
 from app.validation.schema_hint import SchemaHint
 from app.validation.content_stats import ContentInspector
@@ -13,10 +15,14 @@ class RecordBuilder:
         self.run_id = run_id
         self.source_id = source_id
 
-    def build(self, payload_entry: Dict, fmt: str, raw_size: int, validation) -> Dict:
-        checksum = hashlib.sha256(payload_entry["body"]).hexdigest()
-        schema_hint = SchemaHint.infer(payload_entry["body"], fmt)
-        stats = ContentInspector.analyze(payload_entry["body"])
+    def build(self, payload_entry: Dict, fmt: str, raw_size: int, validation, analysis: PayloadAnalysis | None = None) -> Dict:
+        checksum = payload_entry.get("checksum") or hashlib.sha256(payload_entry["body"]).hexdigest()
+        if analysis is not None:
+            schema_hint = SchemaHint.from_analysis(analysis)
+            stats = ContentInspector.analyze_text(analysis.text)
+        else:
+            schema_hint = SchemaHint.infer(payload_entry["body"], fmt)
+            stats = ContentInspector.analyze(payload_entry["body"])
         record = {
             "run_id": self.run_id,
             "source_id": self.source_id,
@@ -39,13 +45,16 @@ class RecordBuilder:
         PayloadValidator.ensure_complete(record)
         return record
 
+    def build_entry(self, payload_entry: Dict, analyzer, validator) -> Dict:
+        """Builds a record from a single parse shared by detection, validation and schema hints."""
+        analysis = analyzer.analyze(payload_entry["body"])
+        validation = validator.validate_analysis(analysis)
+        return self.build(payload_entry, analysis.format, analysis.raw_size, validation, analysis=analysis)
+
     def build_many(self, payloads: List[Dict], fmt_detector, validator) -> List[Dict]:
         built = []
         for payload_entry in payloads:
             detection = fmt_detector.detect(payload_entry["body"])
             validation = validator.validate(payload_entry["body"], detection["format"])
-            record = self.build(payload_entry, detection["format"], detection["raw_size"], validation)
-            # include checksum for downstream dedupe and file storage
-            record["checksum"] = hashlib.sha256(payload_entry["body"]).hexdigest()
-            built.append(record)
+            built.append(self.build(payload_entry, detection["format"], detection["raw_size"], validation))
         return built
@@ -3,8 +3,11 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
-from app.models.entities import IngestionRun, RawRecord
+from app.models.entities import IngestionRun
+from app.storage.blob_store import BlobStore
 from app.storage.payload_cleanup import PayloadCleanup
+from app.storage.raw_storage import purge_run_records
+from app.storage.rollups import StatsRollups
 
 
 class RetentionPolicy:
@@ -19,11 +22,12 @@ class RetentionPolicy:
         cutoff = datetime.now(timezone.utc) - timedelta(days=self.days)
         old_runs = self.db.query(IngestionRun).filter(IngestionRun.started_at < cutoff).all()
         run_ids = [run.run_id for run in old_runs]
-        payload_paths = [rec.payload_path for rec in self.db.query(RawRecord.payload_path).filter(RawRecord.run_id.in_(run_ids))]
         if not run_ids:
             return
-        self.db.query(RawRecord).filter(RawRecord.run_id.in_(run_ids)).delete(synchronize_session=False)
+        payload_paths = purge_run_records(self.db, run_ids)
+        StatsRollups(self.db).runs_removed(old_runs)
         self.db.query(IngestionRun).filter(IngestionRun.run_id.in_(run_ids)).delete(synchronize_session=False)
         self.db.commit()
-        PayloadCleanup().delete_paths([p[0] if isinstance(p, tuple) else p for p in payload_paths])
+        PayloadCleanup().delete_paths(payload_paths)
+        BlobStore(self.db).sweep()
         self.logger.info("Retention enforced", extra={"run_id": "-", "source_id": "-", "payload": {"deleted_runs": len(run_ids)}})
@@ -2,7 +2,11 @@ from typing import List
 
 from sqlalchemy.orm import Session
 
-from app.models.entities import IngestionRun, RawRecord
+from app.models.entities import IngestionRun
+from app.storage.blob_store import BlobStore
+from app.storage.payload_cleanup import PayloadCleanup
+from app.storage.raw_storage import purge_run_records
+from app.storage.rollups import StatsRollups
 
 
 class RetentionRules:
@@ -13,6 +17,7 @@ class RetentionRules:
         self.max_runs_per_source = max_runs_per_source
 
     def enforce_by_count(self):
+        payload_paths: List[str] = []
         sources = [row[0] for row in self.db.query(IngestionRun.source_id).distinct().all()]
         for source_id in sources:
             runs = (
@@ -25,6 +30,9 @@ class RetentionRules:
                 continue
             to_delete = runs[self.max_runs_per_source :]
             run_ids = [r.run_id for r in to_delete]
-            self.db.query(RawRecord).filter(RawRecord.run_id.in_(run_ids)).delete(synchronize_session=False)
+            payload_paths.extend(purge_run_records(self.db, run_ids))
+            StatsRollups(self.db).runs_removed(to_delete)
             self.db.query(IngestionRun).filter(IngestionRun.run_id.in_(run_ids)).delete(synchronize_session=False)
         self.db.commit()
+        PayloadCleanup().delete_paths(payload_paths)
+        BlobStore(self.db).sweep()
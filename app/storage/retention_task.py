@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.storage.dedupe import DedupeStrategy
 from app.storage.retention import RetentionPolicy
 from app.storage.retention_rules import RetentionRules
 
@@ -14,3 +15,4 @@ class RetentionTask:
     def run(self):
         RetentionPolicy(self.db, days=settings.retention_days).enforce()
         RetentionRules(self.db).enforce_by_count()
+        DedupeStrategy(settings.dedupe_mode).expire()
@@ -0,0 +1,181 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+from app.models.entities import IngestionRun, RawRecord, RecordHourlyRollup, RecordRollup, RunRollup
+from app.services.run_state import RunStatus
+
+TERMINAL_STATUSES = (RunStatus.SUCCESS.value, RunStatus.FAILED.value, RunStatus.CANCELED.value)
+HOUR_FORMAT = "%Y-%m-%d %H:00"
+
+# (status, records_count, bytes_total) of a run at some point in its lifecycle
+RunSnapshot = Tuple[Optional[str], int, int]
+# (source_id, format, validation_status, hour) -> [records, bytes]
+RecordDeltas = Dict[Tuple[int, str, str, str], List[int]]
+
+
+def run_snapshot(run: IngestionRun) -> RunSnapshot:
+    return run.status, run.records_count or 0, run.bytes_total or 0
+
+
+def record_hour(ts: datetime) -> str:
+    return ts.strftime(HOUR_FORMAT)
+
+
+class StatsRollups:
+    """Incrementally maintained aggregate tables behind the stats endpoints.
+
+    Every change is written into the caller's transaction without committing, so rollups move
+    together with the runs and records they summarise.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.logger = get_logger(__name__)
+
+    def run_changed(self, source_id: int, before: RunSnapshot, after: RunSnapshot) -> None:
+        """Moves a run between terminal-status buckets; non-terminal states are not rolled up."""
+        deltas: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        for snapshot, sign in ((before, -1), (after, 1)):
+            status, records, bytes_total = snapshot
+            if status in TERMINAL_STATUSES:
+                bucket = deltas[status]
+                bucket[0] += sign
+                bucket[1] += sign * records
+                bucket[2] += sign * bytes_total
+        for status, (runs, records, bytes_total) in deltas.items():
+            if runs or records or bytes_total:
+                self._upsert_run(source_id, status, runs, records, bytes_total)
+
+    def runs_removed(self, runs: Iterable[IngestionRun]) -> None:
+        for run in runs:
+            self.run_changed(run.source_id, run_snapshot(run), (None, 0, 0))
+
+    def records_added(self, rows: Iterable[dict]) -> None:
+        """Adds inserted record rows (raw_records column values including ingest_time)."""
+        deltas: RecordDeltas = defaultdict(lambda: [0, 0])
+        for row in rows:
+            key = (row["source_id"], row["format"], row["validation_status"], record_hour(row["ingest_time"]))
+            deltas[key][0] += 1
+            deltas[key][1] += row["raw_size"] or 0
+        self._apply_record_deltas(deltas)
+
+    def records_removed(self, run_ids: List[str]) -> None:
+        """Subtracts the runs' records; call before deleting them."""
+        deltas: RecordDeltas = {}
+        for source_id, fmt, status, hour, records, bytes_total in self._grouped_records(RawRecord.run_id.in_(run_ids)):
+            deltas[(source_id, fmt, status, hour)] = [-records, -(bytes_total or 0)]
+        self._apply_record_deltas(deltas)
+
+    def ensure_built(self) -> None:
+        """Rebuilds rollups from the base tables when they are empty but history exists."""
+        if self.db.query(RunRollup).first() is None and self.db.query(IngestionRun.run_id).filter(IngestionRun.status.in_(TERMINAL_STATUSES)).first():
+            self.rebuild_runs()
+        if self.db.query(RecordRollup).first() is None and self.db.query(RawRecord.record_id).first():
+            self.rebuild_records()
+        self.db.commit()
+
+    def rebuild_runs(self) -> None:
+        self.db.execute(delete(RunRollup))
+        rows = self.db.execute(
+            select(
+                IngestionRun.source_id,
+                IngestionRun.status,
+                func.count(),
+                func.coalesce(func.sum(IngestionRun.records_count), 0),
+                func.coalesce(func.sum(IngestionRun.bytes_total), 0),
+            )
+            .where(IngestionRun.status.in_(TERMINAL_STATUSES))
+            .group_by(IngestionRun.source_id, IngestionRun.status)
+        ).all()
+        for source_id, status, runs, records, bytes_total in rows:
+            self._upsert_run(source_id, status, runs, records, bytes_total)
+        self.logger.info("Rebuilt run rollups", extra={"run_id": "-", "source_id": "-", "payload": {"rows": len(rows)}})
+
+    def rebuild_records(self) -> None:
+        self.db.execute(delete(RecordRollup))
+        self.db.execute(delete(RecordHourlyRollup))
+        deltas: RecordDeltas = {}
+        for source_id, fmt, status, hour, records, bytes_total in self._grouped_records():
+            deltas[(source_id, fmt, status, hour)] = [records, bytes_total or 0]
+        self._apply_record_deltas(deltas)
+        self.logger.info("Rebuilt record rollups", extra={"run_id": "-", "source_id": "-", "payload": {"hours": len(deltas)}})
+
+    def run_totals(self, source_id: Optional[int] = None) -> Dict[str, Tuple[int, int, int]]:
+        """status -> (runs, records, bytes): rolled-up finished runs plus a live count of active ones."""
+        finished = select(RunRollup.status, RunRollup.runs, RunRollup.records, RunRollup.bytes_total)
+        active = select(
+            IngestionRun.status,
+            func.count(),
+            func.coalesce(func.sum(IngestionRun.records_count), 0),
+            func.coalesce(func.sum(IngestionRun.bytes_total), 0),
+        ).where(IngestionRun.status.in_([RunStatus.PENDING.value, RunStatus.RUNNING.value]))
+        if source_id is not None:
+            finished = finished.where(RunRollup.source_id == source_id)
+            active = active.where(IngestionRun.source_id == source_id)
+        totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        for status, runs, records, bytes_total in self.db.execute(finished).all():
+            bucket = totals[status]
+            bucket[0] += runs
+            bucket[1] += records
+            bucket[2] += bytes_total
+        for status, runs, records, bytes_total in self.db.execute(active.group_by(IngestionRun.status)).all():
+            totals[status] = [runs, records, bytes_total]
+        return {status: tuple(values) for status, values in totals.items() if values[0]}
+
+    def record_counts(self, column) -> Dict[str, int]:
+        rows = self.db.execute(
+            select(column, func.sum(RecordRollup.records)).group_by(column).having(func.sum(RecordRollup.records) > 0)
+        ).all()
+        return {key: count for key, count in rows}
+
+    def record_total(self) -> int:
+        return self.db.execute(select(func.coalesce(func.sum(RecordRollup.records), 0))).scalar_one()
+
+    def _upsert_run(self, source_id: int, status: str, runs: int, records: int, bytes_total: int) -> None:
+        stmt = insert(RunRollup).values(source_id=source_id, status=status, runs=runs, records=records, bytes_total=bytes_total)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RunRollup.source_id, RunRollup.status],
+                set_={
+                    "runs": RunRollup.runs + stmt.excluded.runs,
+                    "records": RunRollup.records + stmt.excluded.records,
+                    "bytes_total": RunRollup.bytes_total + stmt.excluded.bytes_total,
+                },
+            )
+        )
+
+    def _grouped_records(self, *where):
+        hour = func.strftime(HOUR_FORMAT, RawRecord.ingest_time)
+        return self.db.execute(
+            select(RawRecord.source_id, RawRecord.format, RawRecord.validation_status, hour, func.count(), func.sum(RawRecord.raw_size))
+            .where(*where)
+            .group_by(RawRecord.source_id, RawRecord.format, RawRecord.validation_status, hour)
+        ).all()
+
+    def _apply_record_deltas(self, deltas: RecordDeltas) -> None:
+        # all-time totals back the stats endpoints; hourly rows keep the time series
+        totals: Dict[Tuple[int, str, str], List[int]] = defaultdict(lambda: [0, 0])
+        for (source_id, fmt, status, hour), (records, bytes_total) in deltas.items():
+            self._upsert_record(RecordHourlyRollup, records, bytes_total, source_id=source_id, format=fmt, validation_status=status, hour=hour)
+            totals[(source_id, fmt, status)][0] += records
+            totals[(source_id, fmt, status)][1] += bytes_total
+        for (source_id, fmt, status), (records, bytes_total) in totals.items():
+            self._upsert_record(RecordRollup, records, bytes_total, source_id=source_id, format=fmt, validation_status=status)
+
+    def _upsert_record(self, model, records: int, bytes_total: int, **key) -> None:
+        stmt = insert(model).values(records=records, bytes_total=bytes_total, **key)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[getattr(model, column) for column in key],
+                set_={
+                    "records": model.records + stmt.excluded.records,
+                    "bytes_total": model.bytes_total + stmt.excluded.bytes_total,
+                },
+            )
+        )
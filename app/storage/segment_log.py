@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.errors import StorageError
+from app.storage.compression import PayloadCompressor
+
+
+class SegmentLog:
+    """Appends payloads to per-run segment files and records each one's offset and length.
+
+    A batch is written with one fsync before its records are inserted, so a record never points
+    at bytes that are not on disk; a torn tail after a crash is simply unreferenced.
+    """
+
+    def __init__(self, base_dir: Path | None = None, max_segment_bytes: int | None = None, compressor: PayloadCompressor | None = None):
+        self.base_dir = base_dir or settings.data_dir / "segments"
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max(1, max_segment_bytes or settings.segment_max_bytes)
+        self.compressor = compressor or PayloadCompressor("none")
+        self._current: Dict[str, Path] = {}
+
+    def _segment_for(self, run_id: str) -> Path:
+        current = self._current.get(run_id)
+        if current is None:
+            run_dir = self.base_dir / run_id
+            run_dir.mkdir(parents=True, exist_ok=True)
+            # resume after existing segments, e.g. when a retried attempt reuses the run directory
+            existing = sorted(run_dir.glob("*.seg"))
+            current = existing[-1] if existing else run_dir / "00000.seg"
+        elif current.stat().st_size >= self.max_segment_bytes:
+            current = current.with_name(f"{int(current.stem) + 1:05d}.seg")
+        self._current[run_id] = current
+        return current
+
+    def append_batch(self, records: List[dict]) -> None:
+        """Appends every record's payload in order and fsyncs once for the whole batch."""
+        by_run: Dict[str, List[dict]] = {}
+        for record in records:
+            by_run.setdefault(record["run_id"], []).append(record)
+        for run_id, run_records in by_run.items():
+            segment = self._segment_for(run_id)
+            try:
+                with segment.open("ab") as handle:
+                    offset = handle.tell()
+                    for record in run_records:
+                        body, encoding = self.compressor.compress(record["payload"])
+                        handle.write(body)
+                        record["payload_path"] = str(segment)
+                        record["payload_offset"] = offset
+                        record["payload_length"] = len(body)
+                        record["payload_encoding"] = encoding
+                        record["stored_size"] = len(body)
+                        record["payload"] = b""
+                        offset += len(body)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except OSError as exc:
+                raise StorageError(f"Segment append failed: {exc}", ErrorCode.STORAGE_FAILED) from exc
@@ -1,34 +1,66 @@
 from typing import List
 
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
+from app.storage.blob_store import BlobStore
+from app.storage.compression import PayloadCompressor
 from app.storage.dedupe import DedupeStrategy
 from app.storage.file_system import FileSystemStorage
+from app.storage.segment_log import SegmentLog
 from app.storage.storage_mode import StorageMode
 
 
 class StorageEngine:
     """Selects storage mode for raw payload persistence."""
 
-    def __init__(self, mode: str | None = None, dedupe_mode: str | None = None):
+    def __init__(
+        self,
+        mode: str | None = None,
+        dedupe_mode: str | None = None,
+        db: Session | None = None,
+        compression: str | None = None,
+    ):
         self.mode = StorageMode(mode or settings.storage_mode)
+        self.compressor = PayloadCompressor(compression)
         self.dedupe = DedupeStrategy(dedupe_mode or settings.dedupe_mode)
         self.file_storage = FileSystemStorage(dedupe_mode=self.dedupe.mode)
+        if self.mode == StorageMode.BLOB and db is None:
+            raise ValueError("Blob storage mode requires a database session")
+        self.blob_store = BlobStore(db, compressor=self.compressor) if self.mode == StorageMode.BLOB else None
+        self.segment_log = SegmentLog(compressor=self.compressor) if self.mode == StorageMode.SEGMENT else None
 
     def persist_payloads(self, records: List[dict]) -> List[dict]:
         if self.mode == StorageMode.DB:
+            for record in records:
+                stored, encoding = self.compressor.compress(record["payload"])
+                record["stored_size"] = len(stored)
+                if encoding:
+                    record["payload_compressed"] = stored
+                    record["payload_encoding"] = encoding
+                    record["payload"] = b""
             return records
+        kept = self.dedupe.select(records)
+        if self.mode == StorageMode.BLOB:
+            self.blob_store.put_many(kept)
+            return kept
+        if self.mode == StorageMode.SEGMENT:
+            self.segment_log.append_batch(kept)
+            return kept
         stored: List[dict] = []
-        for record in records:
-            if not self.dedupe.should_store(record["checksum"]):
-                continue
+        for record in kept:
+            body, encoding = self.compressor.compress(record["payload"])
             path = self.file_storage.write_payload(
                 run_id=record["run_id"],
                 source_id=record["source_id"],
-                payload=record["payload"],
+                payload=body,
                 content_type=record.get("content_type"),
                 checksum=record["checksum"],
+                encoding=encoding,
             )
             record["payload_path"] = str(path)
+            record["payload_encoding"] = encoding
+            record["stored_size"] = len(body)
             # strip large payload when using file mode to avoid DB bloat
             record["payload"] = b""
             stored.append(record)
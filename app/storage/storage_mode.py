@@ -4,3 +4,5 @@ from enum import Enum
 class StorageMode(str, Enum):
     DB = "db"
     FILE = "file"
+    BLOB = "blob"
+    SEGMENT = "segment"
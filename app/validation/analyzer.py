@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.validation.csv_rules import CsvRules
+
+
+@dataclass
+class PayloadAnalysis:
+    """Result of parsing a payload once, shared by detection, validation and schema inference."""
+
+    body: bytes
+    text: str
+    format: str
+    raw_size: int
+    document: Any = None
+    rows: Optional[List[List[str]]] = None
+    delimiter: Optional[str] = None
+
+    def detection(self) -> Dict[str, Optional[str]]:
+        encoding = None if self.format == "UNKNOWN" else "utf-8"
+        return {"format": self.format, "encoding": encoding, "schema_hint": None, "raw_size": self.raw_size}
+
+
+class PayloadAnalyzer:
+    """Decodes and parses a payload a single time and classifies its format."""
+
+    @staticmethod
+    def analyze(body: bytes) -> PayloadAnalysis:
+        raw_size = len(body)
+        text = body.decode("utf-8", errors="replace")
+        try:
+            document = json.loads(text)
+            return PayloadAnalysis(body=body, text=text, format="JSON", raw_size=raw_size, document=document)
+        except Exception:
+            pass
+        rows, delimiter = PayloadAnalyzer._parse_csv(text)
+        if rows is not None:
+            return PayloadAnalysis(body=body, text=text, format="CSV", raw_size=raw_size, rows=rows, delimiter=delimiter)
+        fmt = "TEXT" if text.strip() else "UNKNOWN"
+        return PayloadAnalysis(body=body, text=text, format=fmt, raw_size=raw_size)
+
+    @staticmethod
+    def _parse_csv(text: str):
+        # same rule as FormatDetector: the comma-split header must have more than one column
+        try:
+            header = next(csv.reader(io.StringIO(text)), None)
+            if not header or len(header) < 2:
+                return None, None
+            delimiter = CsvRules.probe_delimiter(text)
+            return list(csv.reader(io.StringIO(text), delimiter=delimiter)), delimiter
+        except Exception:
+            return None, None
@@ -1,8 +1,6 @@
-import csv
-import io
-import json
-
 from app.core.config import settings
+from app.core.errors import ValidationError
+from app.validation.analyzer import PayloadAnalysis
 from app.validation.rules import RuleResult, ValidationRules
 from app.validation.csv_rules import CsvRules
 from app.validation.json_rules import JsonRules
@@ -27,7 +25,7 @@ class BasicValidator:
         return ValidationResult("PASSED", "OK")
 
     @staticmethod
-    def validate(content: bytes, detected_format: str) -> ValidationResult:
+    def _check_base(content: bytes) -> ValidationResult | None:
         base_rules = [
             ValidationRules.check_not_empty(content),
             ValidationRules.check_size(content, settings.max_payload_size_bytes),
@@ -37,6 +35,33 @@ class BasicValidator:
                 result = BasicValidator._apply_rule(rule)
                 result.code = "SIZE_OR_EMPTY"
                 return result
+        return None
+
+    @staticmethod
+    def validate_analysis(analysis: PayloadAnalysis) -> ValidationResult:
+        """Validates a payload that PayloadAnalyzer already parsed, without parsing it again."""
+        failed = BasicValidator._check_base(analysis.body)
+        if failed:
+            return failed
+        if analysis.format == "JSON":
+            try:
+                details = JsonRules.validate_document(analysis.document)
+                return ValidationResult("PASSED", "OK", details=details, code="JSON_OK")
+            except ValidationError as exc:
+                return ValidationResult("FAILED", str(exc), code="JSON_INVALID")
+        if analysis.format == "CSV":
+            try:
+                details = CsvRules.validate_rows(analysis.rows or [], analysis.delimiter or ",")
+                return ValidationResult("PASSED", "OK", details=details, code="CSV_OK")
+            except ValidationError as exc:
+                return ValidationResult("FAILED", str(exc), code="CSV_INVALID")
+        return BasicValidator.validate(analysis.body, analysis.format)
+
+    @staticmethod
+    def validate(content: bytes, detected_format: str) -> ValidationResult:
+        failed = BasicValidator._check_base(content)
+        if failed:
+            return failed
 
         if detected_format == "JSON":
             try:
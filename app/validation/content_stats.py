@@ -17,7 +17,10 @@ class ContentInspector:
 
     @staticmethod
     def analyze(payload: bytes) -> ContentStats:
-        text = payload.decode("utf-8", errors="ignore")
+        return ContentInspector.analyze_text(payload.decode("utf-8", errors="ignore"))
+
+    @staticmethod
+    def analyze_text(text: str) -> ContentStats:
         lines = text.splitlines()
         preview = "\n".join(lines[:3])[:200]
         return ContentStats(lines=len(lines), preview=preview)
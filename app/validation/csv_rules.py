@@ -1,6 +1,6 @@
 import csv
 import io
-from typing import Dict
+from typing import Dict, Iterable, List
 
 from app.core.errors import ValidationError
 
@@ -15,10 +15,10 @@ class CsvRules:
         best = ","
         max_cols = 0
         for delim in CsvRules.DELIMS:
-            reader = csv.reader(io.StringIO(text), delimiter=delim)
-            rows = list(reader)
-            if rows and len(rows[0]) > max_cols:
-                max_cols = len(rows[0])
+            # only the header row decides the delimiter, so parsing stops there
+            header = next(csv.reader(io.StringIO(text), delimiter=delim), None)
+            if header and len(header) > max_cols:
+                max_cols = len(header)
                 best = delim
         return best
 
@@ -26,10 +26,13 @@ class CsvRules:
     def validate(payload: bytes, *, max_rows: int = 10000) -> Dict:
         text = payload.decode("utf-8", errors="replace")
         delim = CsvRules.probe_delimiter(text)
-        reader = csv.reader(io.StringIO(text), delimiter=delim)
+        return CsvRules.validate_rows(csv.reader(io.StringIO(text), delimiter=delim), delim, max_rows=max_rows)
+
+    @staticmethod
+    def validate_rows(rows: Iterable[List[str]], delim: str, *, max_rows: int = 10000) -> Dict:
         row_count = 0
         column_count = None
-        for row in reader:
+        for row in rows:
             row_count += 1
             if column_count is None:
                 column_count = len(row)
@@ -16,3 +16,28 @@ class EncodingDetector:
             except Exception:
                 continue
         return "utf-8"
+
+
+class StreamingEncodingDetector:
+    """Chunk-fed equivalent of EncodingDetector.detect keeping one incremental decoder per candidate."""
+
+    def __init__(self, candidates: List[str] | None = None):
+        self._decoders = [(enc, codecs.getincrementaldecoder(enc)()) for enc in (candidates or EncodingDetector.FALLBACKS)]
+
+    @property
+    def settled(self) -> bool:
+        # candidates are ordered by preference, so once one remains further input cannot change the answer
+        return len(self._decoders) <= 1
+
+    def feed(self, chunk: bytes, final: bool = False) -> None:
+        alive = []
+        for enc, decoder in self._decoders:
+            try:
+                decoder.decode(chunk, final)
+            except Exception:
+                continue
+            alive.append((enc, decoder))
+        self._decoders = alive
+
+    def result(self) -> str:
+        return self._decoders[0][0] if self._decoders else "utf-8"
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from app.core.errors import ValidationError
 
@@ -19,6 +19,16 @@ class JsonRules:
             data = json.loads(payload.decode("utf-8", errors="replace"))
         except Exception as exc:
             raise ValidationError(f"JSON parse error: {exc}")
+        return JsonRules.validate_document(data, max_depth=max_depth, max_nodes=max_nodes, max_array_length=max_array_length)
+
+    @staticmethod
+    def validate_document(
+        data: Any,
+        *,
+        max_depth: int = 10,
+        max_nodes: int = 5000,
+        max_array_length: int = 1000,
+    ) -> Dict:
         nodes = 0
 
         def walk(obj, depth: int) -> None:
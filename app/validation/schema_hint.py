@@ -1,7 +1,9 @@
 import csv
 import io
 import json
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+from app.validation.analyzer import PayloadAnalysis
 
 
 class SchemaHint:
@@ -15,16 +17,19 @@ class SchemaHint:
             return SchemaHint._infer_csv(payload)
         return None
 
+    @staticmethod
+    def from_analysis(analysis: PayloadAnalysis) -> Optional[Dict]:
+        if analysis.format == "JSON":
+            return SchemaHint._hint_document(analysis.document)
+        if analysis.format == "CSV":
+            return SchemaHint._hint_rows(analysis.rows or [])
+        return None
+
     @staticmethod
     def _infer_json(payload: bytes) -> Optional[Dict]:
         try:
             data = json.loads(payload.decode("utf-8", errors="ignore"))
-            if isinstance(data, list) and data and isinstance(data[0], dict):
-                keys = sorted(set().union(*[item.keys() for item in data if isinstance(item, dict)]))
-                return {"type": "object_list", "fields": keys}
-            if isinstance(data, dict):
-                return {"type": "object", "fields": sorted(data.keys())}
-            return None
+            return SchemaHint._hint_document(data)
         except Exception:
             return None
 
@@ -33,10 +38,21 @@ class SchemaHint:
         try:
             text = payload.decode("utf-8", errors="ignore")
             reader = csv.reader(io.StringIO(text))
-            rows = list(reader)
-            if not rows:
-                return None
-            header = rows[0]
-            return {"type": "csv", "columns": header, "rows": len(rows) - 1}
+            return SchemaHint._hint_rows(list(reader))
         except Exception:
             return None
+
+    @staticmethod
+    def _hint_document(data: Any) -> Optional[Dict]:
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            keys = sorted(set().union(*[item.keys() for item in data if isinstance(item, dict)]))
+            return {"type": "object_list", "fields": keys}
+        if isinstance(data, dict):
+            return {"type": "object", "fields": sorted(data.keys())}
+        return None
+
+    @staticmethod
+    def _hint_rows(rows: List[List[str]]) -> Optional[Dict]:
+        if not rows:
+            return None
+        return {"type": "csv", "columns": rows[0], "rows": len(rows) - 1}
@@ -0,0 +1,64 @@
+"""Per-payload CPU cost of the stage-by-stage path versus the single-parse analyze stage.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_analyze
+"""
+import argparse
+import json
+import time
+
+from app.validation.analyzer import PayloadAnalyzer
+from app.validation.basic import BasicValidator
+from app.validation.content_stats import ContentInspector
+from app.validation.detector import FormatDetector
+from app.validation.schema_hint import SchemaHint
+
+
+def _json_payload(rows: int) -> bytes:
+    return json.dumps([{"id": i, "name": f"item-{i}", "value": i * 0.5} for i in range(rows)]).encode("utf-8")
+
+
+def _csv_payload(rows: int) -> bytes:
+    lines = ["id,name,value,ts"] + [f"{i},item-{i},{i * 0.5},2024-01-01T00:00:{i % 60:02d}" for i in range(rows)]
+    return "\n".join(lines).encode("utf-8")
+
+
+def _staged(body: bytes) -> None:
+    detection = FormatDetector.detect(body)
+    BasicValidator.validate(body, detection["format"])
+    SchemaHint.infer(body, detection["format"])
+    ContentInspector.analyze(body)
+
+
+def _single_parse(body: bytes) -> None:
+    analysis = PayloadAnalyzer.analyze(body)
+    BasicValidator.validate_analysis(analysis)
+    SchemaHint.from_analysis(analysis)
+    ContentInspector.analyze_text(analysis.text)
+
+
+def _cpu_per_call(func, body: bytes, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        func(body)
+    return (time.process_time() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=900)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, body in [("JSON", _json_payload(args.rows)), ("CSV", _csv_payload(args.rows))]:
+        before = _cpu_per_call(_staged, body, args.iterations)
+        after = _cpu_per_call(_single_parse, body, args.iterations)
+        print(
+            f"{name:<4} {len(body):>8} bytes  staged={before * 1e6:9.1f}us  "
+            f"single-parse={after * 1e6:9.1f}us  speedup={before / after:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
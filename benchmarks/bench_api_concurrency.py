@@ -0,0 +1,106 @@
+"""GET /records latency while an ingestion-style writer commits batches, default vs tuned SQLite.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_api_concurrency --seconds 5
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.api.routes import create_app
+from app.models import entities  # noqa: F401 - ensure model registration
+from app.models.database import Base, build_engine, get_session
+from app.storage.raw_storage import bulk_insert_raw_records
+
+# what the engine did before the tuning layer: rollback journal with full syncs
+BASELINE_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL", "busy_timeout": 5000}
+
+
+def _items(count: int, offset: int):
+    body = b'[{"id": 1, "value": 0.5, "ts": "2024-01-01T00:00:00"}]'
+    return [
+        {
+            "payload": body,
+            "format": "JSON",
+            "raw_size": len(body),
+            "validation_status": "PASSED",
+            "validation_message": "OK",
+            "checksum": f"{offset + i:064x}",
+        }
+        for i in range(count)
+    ]
+
+
+def _run(label: str, pragmas, seconds: float, batch_size: int, seed: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", pragmas=pragmas)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            bulk_insert_raw_records(session, run_id="seed", source_id=1, items=_items(seed, 0), chunk_size=1000)
+
+        def _session():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = create_app()
+        app.dependency_overrides[get_session] = _session
+        client = TestClient(app, raise_server_exceptions=False)
+
+        stop = threading.Event()
+        written = [0]
+
+        def _writer():
+            with Session() as session:
+                offset = seed
+                while not stop.is_set():
+                    # one commit per batch, like PayloadService during a run
+                    bulk_insert_raw_records(session, run_id="load", source_id=2, items=_items(batch_size, offset), chunk_size=batch_size)
+                    offset += batch_size
+                    written[0] += batch_size
+
+        writer = threading.Thread(target=_writer, daemon=True)
+        writer.start()
+        latencies, errors = [], 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = client.get("/records", params={"page_size": 20, "source_id": 1})
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += response.status_code != 200
+        stop.set()
+        writer.join()
+        engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:8s} requests={len(latencies):6d} errors={errors:4d} "
+        f"p50={statistics.median(latencies):7.2f}ms p95={p95:7.2f}ms max={latencies[-1]:8.2f}ms "
+        f"writer={written[0] / seconds:9.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=20000)
+    args = parser.parse_args()
+
+    _run("default", BASELINE_PRAGMAS, args.seconds, args.batch_size, args.seed)
+    _run("tuned", None, args.seconds, args.batch_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Rows/sec of the ORM persistence path versus Core executemany bulk inserts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bulk_insert
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import entities  # noqa: F401 - ensure model registration
+from app.models.database import Base
+from app.storage.raw_storage import bulk_insert_raw_records, persist_raw_records
+
+
+def _items(count: int):
+    body = b'[{"id": 1, "value": 0.5, "ts": "2024-01-01T00:00:00"}]'
+    return [
+        {
+            "payload": body,
+            "format": "JSON",
+            "raw_size": len(body),
+            "validation_status": "PASSED",
+            "validation_message": "OK",
+            "checksum": f"{i:064x}",
+            "content_type": "application/json",
+            "source_uri": "sqlite://example_source.db",
+        }
+        for i in range(count)
+    ]
+
+
+def _rows_per_second(persist, rows: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        items = _items(rows)
+        start = time.perf_counter()
+        persist(session, run_id="bench", source_id=1, items=items)
+        elapsed = time.perf_counter() - start
+        session.close()
+        engine.dispose()
+    return rows / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    orm = _rows_per_second(persist_raw_records, args.rows)
+    bulk = _rows_per_second(
+        lambda db, **kwargs: bulk_insert_raw_records(db, chunk_size=args.chunk_size, **kwargs), args.rows
+    )
+    with_ids = _rows_per_second(
+        lambda db, **kwargs: bulk_insert_raw_records(db, chunk_size=args.chunk_size, return_ids=True, **kwargs), args.rows
+    )
+    print(f"rows={args.rows}")
+    print(f"orm             {orm:10.0f} rows/s")
+    print(f"bulk            {bulk:10.0f} rows/s  ({bulk / orm:4.1f}x)")
+    print(f"bulk+ids        {with_ids:10.0f} rows/s  ({with_ids / orm:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Payload writes/sec of FileSystemStorage as a run grows, versus the old directory-listing naming.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_file_storage --counts 1000 2000 4000 8000
+"""
+import argparse
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+from app.storage.file_system import FileSystemStorage
+
+
+class ListingNamedStorage(FileSystemStorage):
+    """Previous naming: one flat run directory, next index taken from a directory listing."""
+
+    def _target_path(self, run_id: str, source_id: int, ext: str, checksum: str) -> Path:
+        run_dir = self.base_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        return run_dir / f"{source_id}_{len(list(run_dir.glob('*')))}.{ext}"
+
+
+def _writes_per_second(storage_cls, count: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = storage_cls(base_dir=Path(tmp))
+        payloads = [f'{{"seq": {i}}}'.encode() for i in range(count)]
+        checksums = [hashlib.sha256(body).hexdigest() for body in payloads]
+        start = time.perf_counter()
+        for body, checksum in zip(payloads, checksums):
+            storage.write_payload("bench-run", 1, body, "application/json", checksum)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 2000, 4000, 8000])
+    parser.add_argument("--skip-listing", action="store_true", help="only measure the sharded layout")
+    args = parser.parse_args()
+
+    print(f"{'payloads':>9} {'listing w/s':>12} {'sharded w/s':>12}")
+    for count in args.counts:
+        sharded = _writes_per_second(FileSystemStorage, count)
+        listing = float("nan") if args.skip_listing else _writes_per_second(ListingNamedStorage, count)
+        print(f"{count:9d} {listing:12.0f} {sharded:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
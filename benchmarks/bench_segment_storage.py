@@ -0,0 +1,61 @@
+"""Small-payload writes/sec: one file per payload versus batched appends to a segment log.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_segment_storage --payloads 5000 --batch-size 200
+"""
+import argparse
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+from app.storage.file_system import FileSystemStorage
+from app.storage.segment_log import SegmentLog
+
+
+def _records(count: int):
+    records = []
+    for i in range(count):
+        body = f'[{{"id": {i}, "v": {i * 0.5}}}]'.encode()
+        records.append({"run_id": "bench-run", "source_id": 1, "payload": body, "checksum": hashlib.sha256(body).hexdigest()})
+    return records
+
+
+def _file_rate(count: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = FileSystemStorage(base_dir=Path(tmp))
+        records = _records(count)
+        start = time.perf_counter()
+        for record in records:
+            storage.write_payload("bench-run", 1, record["payload"], "application/json", record["checksum"])
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def _segment_rate(count: int, batch_size: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        log = SegmentLog(base_dir=Path(tmp))
+        records = _records(count)
+        start = time.perf_counter()
+        for offset in range(0, count, batch_size):
+            log.append_batch(records[offset : offset + batch_size])
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payloads", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    files = _file_rate(args.payloads)
+    segments = _segment_rate(args.payloads, args.batch_size)
+    print(f"payloads={args.payloads} batch_size={args.batch_size}")
+    print(f"file per payload {files:12.0f} writes/s")
+    print(f"segment log      {segments:12.0f} writes/s  ({segments / files:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-page latency of LIMIT/OFFSET paging versus keyset paging on a large SQLite table.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sqlite_paging --rows 2000000
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from app.adapters.sqlite_pager import SQLitePager
+
+
+def _build_table(db_path: Path, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE metrics(id INTEGER PRIMARY KEY, name TEXT, amount INTEGER)")
+    batch = 50000
+    for start in range(0, rows, batch):
+        conn.executemany(
+            "INSERT INTO metrics(id, name, amount) VALUES (?, ?, ?)",
+            ((i, f"metric-{i % 1000}", i % 9973) for i in range(start + 1, min(start + batch, rows) + 1)),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _measure(pages) -> tuple[int, float, list[float]]:
+    timings = []
+    total = 0
+    last = time.perf_counter()
+    for rows in pages:
+        now = time.perf_counter()
+        timings.append(now - last)
+        total += len(rows)
+        last = time.perf_counter()
+    return total, sum(timings), timings
+
+
+def _report(label: str, total: int, elapsed: float, timings: list[float]) -> None:
+    tail = timings[-10:] or [0.0]
+    print(
+        f"{label:8s} rows={total:9d} total={elapsed:8.2f}s "
+        f"first_page={timings[0] * 1000 if timings else 0:7.2f}ms "
+        f"last_pages_avg={sum(tail) / len(tail) * 1000:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "paging.db"
+        _build_table(db_path, args.rows)
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        pager = SQLitePager(conn, limit=args.page_size)
+
+        keyset = _measure(pager.execute_keyset(key_column="id", table="metrics"))
+        offset = _measure(pager.execute_paginated(pager.build_table_query("metrics")))
+        conn.close()
+
+    print(f"rows={args.rows} page_size={args.page_size}")
+    _report("offset", *offset)
+    _report("keyset", *keyset)
+    print(f"speedup {offset[1] / keyset[1]:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.models.database import build_engine
+
+
+def test_file_engine_applies_configured_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_synchronous", "FULL")
+    monkeypatch.setattr(settings, "sqlite_busy_timeout_ms", 1234)
+    monkeypatch.setattr(settings, "db_pool_size", 3)
+    engine = build_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    try:
+        with engine.connect() as conn:
+            values = {name: conn.execute(text(f"PRAGMA {name}")).scalar() for name in ("journal_mode", "synchronous", "busy_timeout", "temp_store")}
+        # synchronous FULL and temp_store MEMORY both read back as 2
+        assert values == {"journal_mode": "wal", "synchronous": 2, "busy_timeout": 1234, "temp_store": 2}
+        assert engine.pool.size() == 3
+    finally:
+        engine.dispose()
@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.models.entities import RunEvent
+from app.services.event_logger import EventLogger
+
+
+def test_events_are_buffered_until_flush_or_threshold():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    events = EventLogger(session, max_pending=3, max_age_seconds=60)
+
+    events.log("run", stage="RUN", event_type="RUN_STARTED", message="a")
+    events.log("run", stage="FETCH", event_type="FETCH_STARTED", message="b")
+    assert session.query(RunEvent).count() == 0 and events.pending == 2
+
+    events.log("run", stage="FETCH", event_type="FETCH_DONE", message="c")
+    assert session.query(RunEvent).count() == 3 and events.pending == 0
+
+    events.log("run", stage="RUN", event_type="RUN_FAILED", message="d", error_code="E")
+    events.flush()
+    assert [e.event_type for e in session.query(RunEvent).order_by(RunEvent.ts)][-1] == "RUN_FAILED"
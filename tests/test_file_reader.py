@@ -0,0 +1,50 @@
+from app.adapters.file_adapter import FileSource
+from app.adapters.file_reader import ChunkedFileReader
+
+
+def test_payload_chunks_split_on_lines_and_repeat_csv_header(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"a,b\n" + b"".join(f"{i},{i}\n".encode() for i in range(100)))
+    reader = ChunkedFileReader(path, read_size=7)
+    checksum, encoding = reader.scan()
+    parts = list(reader.payload_chunks(encoding, 64, repeat_header=True))
+    assert encoding == "utf-8" and len(checksum) == 64
+    assert len(parts) > 1
+    assert all(part.startswith(b"a,b\n") and part.endswith(b"\n") and len(part) <= 64 for part in parts)
+    assert b"".join(part[4:] for part in parts) == path.read_bytes()[4:]
+
+
+def test_non_utf8_file_is_transcoded_in_chunks(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes("中文日志\n".encode("gbk") * 50)
+    reader = ChunkedFileReader(path, read_size=5, mmap_min_bytes=1)
+    _, encoding = reader.scan()
+    assert encoding == "gbk"
+    assert b"".join(reader.payload_chunks(encoding, 40)) == ("中文日志\n" * 50).encode("utf-8")
+
+
+def test_overlong_line_is_hard_split_at_character_boundaries(tmp_path):
+    path = tmp_path / "app.log"
+    text = "short\n" + "é" * 100 + "\nend\n"
+    path.write_text(text, encoding="utf-8")
+    reader = ChunkedFileReader(path, read_size=16)
+    parts = list(reader.payload_chunks("utf-8", 25))
+    assert all(len(part) <= 25 for part in parts)
+    for part in parts:
+        part.decode("utf-8")  # raises if a part ends mid-character
+    assert b"".join(parts) == text.encode("utf-8")
+
+
+def test_only_line_oriented_files_are_split(tmp_path):
+    (tmp_path / "rows.ndjson").write_bytes(b'{"a": 1}\n' * 20)
+    (tmp_path / "small.json").write_bytes(b'{"items": [1, 2]}')
+    (tmp_path / "big.json").write_bytes(b'{"items": [' + b"1, " * 40 + b"1]}")
+    (tmp_path / "other.json").write_bytes(b'{"items": []}')
+    params = {"directory": str(tmp_path), "state_path": str(tmp_path / "index.json"), "payload_chunk_bytes": 64}
+
+    ndjson = FileSource({**params, "pattern": "*.ndjson"}).fetch()
+    assert len(ndjson) > 1 and all(len(p["body"]) <= 64 for p in ndjson)
+    # the oversized file is skipped without failing the run or holding back its neighbours
+    payloads = FileSource({**params, "pattern": "*.json"}).fetch()
+    assert sorted(p["body"] for p in payloads) == [b'{"items": [1, 2]}', b'{"items": []}']
+    assert FileSource({**params, "pattern": "*.json"}).fetch() == []
@@ -1,3 +1,4 @@
+from app.validation.analyzer import PayloadAnalyzer
 from app.validation.detector import FormatDetector
 
 
@@ -11,3 +12,16 @@ def test_detect_csv():
     payload = b"a,b\n1,2"
     result = FormatDetector.detect(payload)
     assert result["format"] == "CSV"
+
+
+def test_analyzer_matches_detector():
+    for payload in [b'{"key": "value"}', b"a,b\n1,2", b"plain text", b"   "]:
+        analysis = PayloadAnalyzer.analyze(payload)
+        assert analysis.detection() == FormatDetector.detect(payload)
+
+
+def test_analyzer_parses_csv_once_with_probed_delimiter():
+    analysis = PayloadAnalyzer.analyze(b"a,b;c;d\n1;2;3")
+    assert analysis.format == "CSV"
+    assert analysis.delimiter == ";"
+    assert analysis.rows == [["a,b", "c", "d"], ["1", "2", "3"]]
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters import http_api
+from app.adapters.http_api import HttpAPISource
+from app.adapters.http_client import HttpClient
+from app.adapters.http_pool import HttpClientPool
+from app.core.config import settings
+from app.models.database import Base
+from app.models.entities import IngestionRun, RawRecord, RunEvent, SourceConfig
+from app.services import ingestion_service
+from app.services.event_constants import EventType
+from app.services.run_state import RunStatus
+from app.storage.http_validator_store import HttpValidatorStore
+
+LIMIT = 2
+
+
+def _source(tmp_path, handler, **params) -> HttpAPISource:
+    source = HttpAPISource({"url": "https://api.test/items", "validator_state_path": str(tmp_path / "validators.json"), **params})
+    source.client = HttpClient(max_retries=0, backoff_seconds=0, pool=HttpClientPool(transport=httpx.MockTransport(handler)))
+    return source
+
+
+def _offset_pages(short_page: int, delay=lambda page: 0.0):
+    requested = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["offset"]) // LIMIT
+        with lock:
+            requested.append(page)
+        time.sleep(delay(page))
+        size = 1 if page == short_page else LIMIT
+        return httpx.Response(200, json=[{"page": page, "item": i} for i in range(size)])
+
+    return handler, requested
+
+
+def _pages(payloads):
+    return [int(p["url"].split("offset=")[1].split("&")[0]) // LIMIT for p in payloads]
+
+
+def test_concurrent_offset_pages_are_yielded_in_page_order(tmp_path):
+    # earlier pages answer last, so completion order is the reverse of page order
+    handler, requested = _offset_pages(short_page=99, delay=lambda page: 0.05 * (4 - page))
+    source = _source(tmp_path, handler, pagination={"mode": "offset", "limit": LIMIT, "max_pages": 5, "concurrency": 3})
+    payloads = source.fetch()
+    assert _pages(payloads) == [0, 1, 2, 3, 4]
+    assert sorted(requested) == [0, 1, 2, 3, 4]
+
+
+def test_concurrent_offsets_stop_at_first_short_page_and_cancel_the_rest(tmp_path, monkeypatch):
+    submitted, release = [], threading.Event()
+
+    class SingleWorkerExecutor(ThreadPoolExecutor):
+        """One worker, so pages queued behind a blocked request stay cancellable."""
+
+        def __init__(self, max_workers=None, thread_name_prefix=""):
+            super().__init__(max_workers=1, thread_name_prefix=thread_name_prefix)
+
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            submitted.append(future)
+            return future
+
+        def shutdown(self, wait=True, **kwargs):
+            release.set()
+            super().shutdown(wait=wait, **kwargs)
+
+    monkeypatch.setattr(http_api, "ThreadPoolExecutor", SingleWorkerExecutor)
+    base_handler, requested = _offset_pages(short_page=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if int(request.url.params["offset"]) // LIMIT >= 2:
+            release.wait(5)
+        return base_handler(request)
+
+    source = _source(tmp_path, handler, pagination={"mode": "offset", "limit": LIMIT, "max_pages": 10, "concurrency": 3})
+    payloads = source.fetch()
+
+    assert _pages(payloads) == [0, 1]
+    # pages 0-2 start in flight, page 3 is submitted once page 0 is consumed
+    assert len(submitted) == 4
+    assert submitted[3].cancelled()
+    assert 3 not in requested
+
+
+def _conditional_handler(seen_headers):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append({name: request.headers.get(name) for name in ("if-none-match", "if-modified-since")})
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"items": [1]}, headers={"etag": '"v1"', "last-modified": "Tue, 01 Sep 2026 10:00:00 GMT"})
+
+    return handler
+
+
+def test_validators_persist_only_after_commit_state_and_are_sent_next_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "http_validators_path", tmp_path / "validators.json")
+    seen = []
+    handler = _conditional_handler(seen)
+    params = {"url": "https://api.test/items", "query": {"q": "x"}}
+
+    first = HttpAPISource(params)
+    first.client = HttpClient(max_retries=0, pool=HttpClientPool(transport=httpx.MockTransport(handler)))
+    assert len(first.fetch()) == 1
+    assert not (tmp_path / "validators.json").exists()
+
+    # a run that never reached commit_state leaves nothing behind
+    uncommitted = HttpAPISource(params)
+    uncommitted.client = first.client
+    uncommitted.fetch()
+    assert seen[1] == {"if-none-match": None, "if-modified-since": None}
+
+    first.commit_state()
+    second = HttpAPISource(params)
+    second.client = first.client
+    assert second.fetch() == []
+    assert seen[2] == {"if-none-match": '"v1"', "if-modified-since": "Tue, 01 Sep 2026 10:00:00 GMT"}
+    assert second.unchanged == ["https://api.test/items?q=x"]
+
+
+def test_not_modified_response_stores_nothing_and_logs_event(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "http_validators_path", tmp_path / "validators.json")
+    store = HttpValidatorStore(settings.http_validators_path)
+    store.remember("https://api.test/items", {"etag": '"v1"'})
+    store.save()
+
+    seen = []
+    transport = httpx.MockTransport(_conditional_handler(seen))
+
+    def adapter_for(source_type, params):
+        adapter = HttpAPISource(params)
+        adapter.client = HttpClient(max_retries=0, pool=HttpClientPool(transport=transport))
+        return adapter
+
+    monkeypatch.setattr(ingestion_service, "get_adapter", adapter_for)
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(SourceConfig(id=1, name="api", type="HTTP_API", params=json.dumps({"url": "https://api.test/items"})))
+    session.commit()
+
+    run_id = ingestion_service.IngestionService(session).trigger_run(1)
+
+    run = session.query(IngestionRun).filter(IngestionRun.run_id == run_id).one()
+    assert run.status == RunStatus.SUCCESS.value
+    assert session.query(RawRecord).count() == 0
+    events = [e.event_type for e in session.query(RunEvent).filter(RunEvent.run_id == run_id)]
+    assert EventType.FETCH_NOT_MODIFIED in events
+    assert seen == [{"if-none-match": '"v1"', "if-modified-since": None}]
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from app.adapters import http_pool as http_pool_module
+from app.adapters.http_client import HttpClient
+from app.adapters.http_pool import HttpClientPool
+from app.core.errors import AdapterError
+
+
+def test_clients_are_reused_per_host_and_built_with_pool_limits(monkeypatch):
+    built = []
+
+    class RecordingClient(httpx.Client):
+        def __init__(self, **kwargs):
+            built.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(http_pool_module.httpx, "Client", RecordingClient)
+    pool = HttpClientPool(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.5)
+    try:
+        first = pool.client_for("https://api.test/a")
+        assert pool.client_for("https://api.test:443/b?page=2") is first
+        assert pool.client_for("http://api.test/a") is not first
+        assert pool.client_for("https://other.test/a") is not first
+        assert len(built) == 3
+        limits = built[0]["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (7, 3, 12.5)
+        assert built[0]["http2"] is False
+
+        first.close()
+        assert pool.client_for("https://api.test/c") is not first  # closed clients are replaced
+    finally:
+        pool.close()
+    assert pool.stats()["open_clients"] == 0
+
+
+def test_http2_falls_back_when_h2_is_missing(monkeypatch):
+    monkeypatch.setattr(http_pool_module.importlib.util, "find_spec", lambda name: None)
+    assert HttpClientPool(http2=True).http2 is False
+
+
+def test_stats_count_clients_requests_and_failures():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500 if request.url.path == "/fail" else 200, json=[])
+
+    pool = HttpClientPool(max_connections=5, max_keepalive_connections=2, transport=httpx.MockTransport(handler))
+    client = HttpClient(max_retries=0, backoff_seconds=0, pool=pool)
+    try:
+        client.request("GET", "https://api.test/ok")
+        client.request("GET", "https://api.test/ok")
+        with pytest.raises(AdapterError):
+            client.request("GET", "https://api.test/fail")
+        client.request("GET", "http://plain.test/ok")
+        stats = pool.stats()
+    finally:
+        pool.close()
+    assert stats == {
+        "http2": False,
+        "max_connections": 5,
+        "max_keepalive_connections": 2,
+        "open_clients": 2,
+        "hosts": {
+            "https://api.test:443": {"clients": 1, "requests": 3, "failures": 1},
+            "http://plain.test:80": {"clients": 1, "requests": 1, "failures": 0},
+        },
+    }
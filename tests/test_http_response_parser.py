@@ -0,0 +1,24 @@
+import hashlib
+import json
+
+import httpx
+
+from app.adapters.http_response_parser import HttpResponseParser
+
+
+def _response(body: bytes, content_type: str) -> httpx.Response:
+    return httpx.Response(200, content=body, headers={"content-type": content_type}, request=httpx.Request("GET", "https://api.test/items"))
+
+
+def test_json_bodies_are_normalised_for_stable_checksums():
+    compact = HttpResponseParser.to_payload(_response(b'{"a":1,"b":[1,2]}', "application/json"))
+    pretty = HttpResponseParser.to_payload(_response(b'{\n  "a": 1,\n  "b": [1, 2]\n}', "application/json; charset=utf-8"))
+    assert compact.body == pretty.body == json.dumps({"a": 1, "b": [1, 2]}).encode("utf-8")
+    assert hashlib.sha256(compact.body).hexdigest() == hashlib.sha256(pretty.body).hexdigest()
+    assert compact.url == "https://api.test/items"
+
+
+def test_non_json_bodies_are_kept_as_received():
+    payload = HttpResponseParser.to_payload(_response(b"a,b\n1,2\n", "text/csv"))
+    assert payload.body == b"a,b\n1,2\n"
+    assert payload.status_code == 200
@@ -0,0 +1,55 @@
+import json
+import sqlite3
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.errors import StorageError
+from app.models.database import Base
+from app.models.entities import IngestionRun, RawRecord, SourceConfig, SourceWatermark
+from app.services.ingestion_service import IngestionService
+from app.services.run_state import RunStatus
+from app.storage.payload_service import PayloadService
+
+
+def _source_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE events(id INTEGER PRIMARY KEY, updated_at TEXT)")
+    conn.executemany("INSERT INTO events VALUES (?, ?)", [(i, f"2026-01-0{i}") for i in range(1, 6)])
+    conn.commit()
+    conn.close()
+
+
+def test_watermark_commits_with_each_batch_so_failed_runs_do_not_refetch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "pipeline_batch_size", 1)
+    _source_db(tmp_path / "events.db")
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    params = {"db_path": str(tmp_path / "events.db"), "table": "events", "watermark_column": "updated_at", "limit": 2}
+    session.add(SourceConfig(id=1, name="events", type="SQLITE", params=json.dumps(params)))
+    session.commit()
+
+    persist = PayloadService.persist
+    calls = []
+
+    def failing_persist(self, *args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise StorageError("disk full", ErrorCode.STORAGE_FAILED)
+        return persist(self, *args, **kwargs)
+
+    monkeypatch.setattr(PayloadService, "persist", failing_persist)
+    failed = IngestionService(session).trigger_run(1)
+    assert session.query(IngestionRun).filter(IngestionRun.run_id == failed).one().status == RunStatus.FAILED.value
+    # the first page (rows 1-2) was committed together with its watermark
+    assert json.loads(session.get(SourceWatermark, 1).value) == ["2026-01-02", 2]
+
+    monkeypatch.setattr(PayloadService, "persist", persist)
+    IngestionService(session).trigger_run(1)
+    rows = [row["id"] for record in session.query(RawRecord).order_by(RawRecord.record_id) for row in json.loads(record.payload)]
+    assert rows == [1, 2, 3, 4, 5]
+    assert json.loads(session.get(SourceWatermark, 1).value) == ["2026-01-05", 5]
@@ -0,0 +1,53 @@
+import io
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from app.core.logging import ContextQueueHandler, JsonFormatter, SamplingFilter
+
+
+def _record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "context_enriched", None, None)
+    record.run_id = "run-1"
+    record.payload = {"phase": "init"}
+    return record
+
+
+def test_json_formatter_includes_context_and_payload():
+    line = json.loads(JsonFormatter().format(_record("app.services.log_enricher")))
+    assert line["run_id"] == "run-1"
+    assert line["source_id"] == "-"
+    assert line["payload"] == {"phase": "init"}
+
+
+def test_sampling_filter_uses_longest_prefix_and_keeps_warnings():
+    sampling = SamplingFilter({"app.services": 1.0, "app.services.debug_tools": 0.0})
+    assert sampling.filter(_record("app.services.log_enricher"))
+    assert not sampling.filter(_record("app.services.debug_tools"))
+    assert sampling.filter(_record("app.services.debug_tools", logging.WARNING))
+
+
+def test_async_json_logging_keeps_exception_details():
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, output)
+    logger = logging.getLogger("tests.async_json")
+    logger.propagate = False
+    logger.addHandler(ContextQueueHandler(log_queue))
+    listener.start()
+    try:
+        try:
+            raise ValueError("bad payload")
+        except ValueError:
+            logger.exception("Run %s failed", "run-1", extra={"run_id": "run-1"})
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+
+    line = json.loads(stream.getvalue())
+    assert line["message"] == "Run run-1 failed"
+    assert line["run_id"] == "run-1"
+    assert "Traceback" in line["exc"] and "ValueError: bad payload" in line["exc"]
@@ -0,0 +1,65 @@
+import gzip
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes import create_app
+from app.models.database import Base, get_session
+from app.models.entities import RawRecord
+
+PAYLOAD = b"0123456789" * 100_000
+
+
+def _client(tmp_path):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    path = tmp_path / "payload.bin"
+    path.write_bytes(PAYLOAD)
+    common = dict(run_id="run-1", source_id=1, format="TEXT", raw_size=len(PAYLOAD), checksum="abc123", validation_status="PASSED", content_type="text/plain")
+    with Session() as session:
+        session.add(RawRecord(record_id=1, payload="", payload_path=str(path), **common))
+        session.add(RawRecord(record_id=2, payload="", payload_compressed=gzip.compress(PAYLOAD), payload_encoding="gzip", **common))
+        session.commit()
+
+    def _session():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = _session
+    return TestClient(app)
+
+
+def test_raw_download_streams_full_payload_and_ranges(tmp_path):
+    client = _client(tmp_path)
+    for record_id in (1, 2):
+        full = client.get(f"/records/{record_id}/raw")
+        assert full.status_code == 200
+        assert full.content == PAYLOAD
+        assert full.headers["etag"] == '"abc123"'
+        assert full.headers["content-type"].startswith("text/plain")
+
+        part = client.get(f"/records/{record_id}/raw", headers={"Range": "bytes=10-19"})
+        assert part.status_code == 206
+        assert part.content == PAYLOAD[10:20]
+        assert part.headers["content-range"] == f"bytes 10-19/{len(PAYLOAD)}"
+
+    tail = client.get("/records/1/raw", headers={"Range": "bytes=-5"})
+    assert tail.content == PAYLOAD[-5:]
+
+
+def test_raw_download_conditional_and_unsatisfiable(tmp_path):
+    client = _client(tmp_path)
+    assert client.get("/records/1/raw", headers={"If-None-Match": '"abc123"'}).status_code == 304
+    stale = client.get("/records/1/raw", headers={"Range": "bytes=0-9", "If-Range": '"other"'})
+    assert stale.status_code == 200 and len(stale.content) == len(PAYLOAD)
+    unsatisfiable = client.get("/records/1/raw", headers={"Range": f"bytes={len(PAYLOAD)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(PAYLOAD)}"
+    assert client.get("/records/99/raw").status_code == 404
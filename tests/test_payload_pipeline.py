@@ -0,0 +1,23 @@
+from app.services.payload_pipeline import PayloadPipeline
+from app.storage.record_builder import RecordBuilder
+from app.validation.analyzer import PayloadAnalyzer
+from app.validation.basic import BasicValidator
+
+
+def _payloads(count: int, size: int):
+    for i in range(count):
+        yield {"body": (b"x" * (size - 1)) + str(i % 10).encode(), "content_type": "text/plain"}
+
+
+def test_batches_bounded_by_count():
+    pipeline = PayloadPipeline(RecordBuilder("run", 1), PayloadAnalyzer, BasicValidator, batch_size=3, max_inflight_bytes=10_000)
+    sizes = [len(batch) for batch in pipeline.batches(_payloads(7, 10))]
+    assert sizes == [3, 3, 1]
+    assert pipeline.totals.records == 7
+    assert pipeline.totals.size_summary() == {"min": 10, "max": 10, "avg": 10}
+
+
+def test_batches_bounded_by_inflight_bytes():
+    pipeline = PayloadPipeline(RecordBuilder("run", 1), PayloadAnalyzer, BasicValidator, batch_size=100, max_inflight_bytes=25)
+    sizes = [len(batch) for batch in pipeline.batches(_payloads(5, 10))]
+    assert sizes == [3, 2]
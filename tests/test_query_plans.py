@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.models.entities import IngestionRun
+from app.scheduler.timeout_monitor import TimeoutMonitor
+from app.services.queue_metrics import QueueMetrics
+from app.services.record_cursor import RecordCursor
+from app.services.record_query import RecordQueryService
+from app.services.run_queue import RunQueue
+from app.services.run_repository import RunRepository
+from app.storage.retention import RetentionPolicy
+
+HOT_TABLES = ("raw_records", "ingestion_runs")
+
+
+def _capture_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    return statements
+
+
+def _full_scans(engine, statements):
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            for row in plan:
+                detail = row[-1]
+                # "SCAN raw_records" without "USING ... INDEX" reads every row
+                if detail.startswith("SCAN") and "USING" not in detail and any(table in detail for table in HOT_TABLES):
+                    scans.append((detail, statement))
+    return scans
+
+
+def test_hot_queries_use_indexes():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    session.add(IngestionRun(run_id="old", source_id=1, status="SUCCESS", started_at=datetime.now(timezone.utc) - timedelta(days=30)))
+    session.commit()
+
+    statements = _capture_selects(engine)
+    records = RecordQueryService(session)
+    cursor = RecordCursor(datetime(2024, 1, 2), 100).encode()
+    for kwargs in (
+        {"run_id": "run-1", "source_id": None},
+        {"run_id": None, "source_id": 1},
+        {"run_id": None, "source_id": 1, "cursor": cursor, "total_mode": "exact"},
+    ):
+        records.list_records(
+            **kwargs,
+            fmt=None,
+            validation_status=None,
+            from_time="2024-01-01T00:00:00",
+            to_time=None,
+            sort="desc",
+            page=1,
+            page_size=20,
+        )
+    RunQueue(session).next_for_source(1)
+    RunQueue(session).running_sources()
+    RunRepository(session).get_active_run(1)
+    TimeoutMonitor(session).sweep()
+    QueueMetrics(session).depth()
+    RetentionPolicy(session).enforce()
+
+    assert len(statements) >= 9
+    assert _full_scans(engine, statements) == []
@@ -0,0 +1,49 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.models.entities import RawRecord
+from app.services.record_export import RecordExporter
+from app.services.record_filter import RecordFilter
+
+
+def _session(count: int):
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    base = datetime(2024, 1, 1)
+    session.add_all(
+        RawRecord(
+            run_id="run-1" if i % 2 else "run-2",
+            source_id=1,
+            ingest_time=base + timedelta(seconds=i // 3),
+            format="JSON",
+            raw_size=8,
+            payload=json.dumps({"i": i}),
+            checksum=str(i),
+            validation_status="PASSED",
+        )
+        for i in range(count)
+    )
+    session.commit()
+    return session
+
+
+def test_export_streams_filtered_records_in_batches():
+    exporter = RecordExporter(_session(20), batch_size=3, flush_bytes=64)
+    lines = b"".join(exporter.ndjson(RecordFilter(run_id="run-1"))).splitlines()
+    entries = [json.loads(line) for line in lines]
+    assert [json.loads(entry["payload"])["i"] for entry in entries] == list(range(1, 20, 2))
+    assert all(entry["run_id"] == "run-1" for entry in entries)
+
+
+def test_export_gzip_without_payload():
+    exporter = RecordExporter(_session(5), batch_size=2)
+    body = gzip.decompress(b"".join(exporter.ndjson(RecordFilter(), include_payload=False, compression="gzip")))
+    entries = [json.loads(line) for line in body.splitlines()]
+    assert len(entries) == 5
+    assert "payload" not in entries[0]
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.models.entities import RawRecord
+from app.services.record_cursor import RecordCursor
+from app.services.record_query import RecordQueryService
+
+
+def _service(count: int) -> RecordQueryService:
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    base = datetime(2024, 1, 1)
+    # several records share each ingest_time so the record_id tie-break matters
+    session.add_all(
+        RawRecord(
+            run_id="run-1",
+            source_id=1,
+            ingest_time=base + timedelta(seconds=i // 3),
+            format="TEXT",
+            raw_size=1,
+            payload="x",
+            checksum=str(i),
+            validation_status="PASSED",
+        )
+        for i in range(count)
+    )
+    session.commit()
+    return RecordQueryService(session)
+
+
+def _list(service: RecordQueryService, **kwargs):
+    params = dict(run_id=None, source_id=1, fmt=None, validation_status=None, from_time=None, to_time=None, sort="desc", page=1, page_size=4)
+    params.update(kwargs)
+    return service.list_records(**params)
+
+
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_cursor_walk_visits_every_record_once(sort):
+    service = _service(10)
+    seen, cursor = [], None
+    while True:
+        total, items, cursor = _list(service, sort=sort, cursor=cursor, total_mode="none")
+        assert total is None
+        seen.extend(item.record_id for item in items)
+        if cursor is None:
+            break
+    assert seen == sorted(range(1, 11), reverse=sort == "desc")
+
+
+def test_cached_total_and_invalid_cursor():
+    service = _service(5)
+    assert _list(service, total_mode="exact")[0] == 5
+    assert _list(service, total_mode="cached")[0] == 5
+    with pytest.raises(ValueError):
+        _list(service, cursor="not-a-cursor")
+    assert RecordCursor.decode(RecordCursor(datetime(2024, 1, 1), 7, "asc").encode()).record_id == 7
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.models.entities import IngestionRun, RawRecord, RecordHourlyRollup, RecordRollup, RunRollup, SourceConfig
+from app.services.bulk_cancel import BulkCancelService
+from app.services.metrics import RunMetrics
+from app.services.record_stats import RecordStatsService
+from app.services.run_manager import RunManager
+from app.services.run_state import RunStatus
+from app.services.source_stats import SourceStatsService
+from app.services.summary import RunSummaryService
+from app.storage.raw_storage import bulk_insert_raw_records, persist_raw_records
+from app.storage.retention_rules import RetentionRules
+from app.storage.rollups import StatsRollups
+
+
+def _session():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([SourceConfig(id=1, name="a", type="http", params="{}"), SourceConfig(id=2, name="b", type="file", params="{}")])
+    session.commit()
+    return session
+
+
+def _items(count: int, fmt: str):
+    return [
+        {"payload": b"x" * (i + 1), "format": fmt, "raw_size": i + 1, "validation_status": "PASSED" if i % 3 else "FAILED", "validation_message": "OK"}
+        for i in range(count)
+    ]
+
+
+def _finish(session, source_id: int, status: RunStatus, fmt: str, count: int, started_at: datetime):
+    manager = RunManager(session)
+    run = manager.create_run(source_id)
+    run.started_at = started_at
+    manager.start_run(run)
+    if count % 2:
+        persist_raw_records(session, run_id=run.run_id, source_id=source_id, items=_items(count, fmt))
+    else:
+        bulk_insert_raw_records(session, run_id=run.run_id, source_id=source_id, items=_items(count, fmt), chunk_size=2)
+    manager.finalize_run(run, RunMetrics(records_count=count, bytes_total=count * 10), status)
+    return run
+
+
+def _expected(session):
+    records = session.query(RawRecord)
+    by_format = dict(session.query(RawRecord.format, func.count()).group_by(RawRecord.format).all())
+    by_status = dict(session.query(RawRecord.validation_status, func.count()).group_by(RawRecord.validation_status).all())
+    runs = dict(session.query(IngestionRun.status, func.count()).group_by(IngestionRun.status).all())
+    return records.count(), by_format, by_status, runs
+
+
+def _actual(session):
+    stats = RecordStatsService(session)
+    return stats.totals()["records"], stats.by_format(), stats.by_status(), RunSummaryService(session).counts()
+
+
+def test_rollups_track_runs_records_and_retention():
+    session = _session()
+    now = datetime.now(timezone.utc)
+    for i, (status, fmt) in enumerate([(RunStatus.SUCCESS, "JSON"), (RunStatus.FAILED, "CSV"), (RunStatus.SUCCESS, "JSON"), (RunStatus.SUCCESS, "XML")]):
+        _finish(session, 1, status, fmt, count=i + 3, started_at=now - timedelta(minutes=10 - i))
+    _finish(session, 2, RunStatus.SUCCESS, "TEXT", count=4, started_at=now)
+    RunManager(session).create_run(2)
+    BulkCancelService(session).cancel_pending(2)
+    RunManager(session).create_run(1)
+    assert _actual(session) == _expected(session)
+    assert SourceStatsService(session).stats_for_source(1) == {"runs": 5, "success": 3, "failed": 1, "canceled": 0, "records": 18, "bytes": 180}
+
+    RetentionRules(session, max_runs_per_source=2).enforce_by_count()
+    assert _actual(session) == _expected(session)
+    assert SourceStatsService(session).stats_for_source(1)["runs"] == 2
+
+    expected_rows = sorted((r.source_id, r.status, r.runs, r.records, r.bytes_total) for r in session.query(RunRollup).filter(RunRollup.runs > 0))
+    expected_records = sorted((r.source_id, r.format, r.validation_status, r.records) for r in session.query(RecordRollup).filter(RecordRollup.records > 0))
+    expected_hours = sorted((r.source_id, r.format, r.validation_status, r.hour, r.records) for r in session.query(RecordHourlyRollup).filter(RecordHourlyRollup.records > 0))
+    session.query(RunRollup).delete()
+    session.query(RecordRollup).delete()
+    StatsRollups(session).ensure_built()
+    assert sorted((r.source_id, r.status, r.runs, r.records, r.bytes_total) for r in session.query(RunRollup)) == expected_rows
+    assert sorted((r.source_id, r.format, r.validation_status, r.records) for r in session.query(RecordRollup)) == expected_records
+    assert sorted((r.source_id, r.format, r.validation_status, r.hour, r.records) for r in session.query(RecordHourlyRollup)) == expected_hours
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from app.scheduler import worker_pool
+from app.scheduler.due_queue import DueQueue
+from app.scheduler.worker_pool import RunWorkerPool
+
+
+def test_due_queue_pops_in_due_order_and_skips_superseded_entries():
+    queue = DueQueue()
+    queue.schedule(1, 30.0)
+    queue.schedule(2, 10.0)
+    queue.schedule(3, 20.0)
+    queue.schedule(2, 40.0)  # rescheduling supersedes the earlier entry
+    queue.remove(3)
+
+    assert queue.next_due() == 30.0
+    assert queue.pop_due(now=25.0) is None
+    assert queue.pop_due(now=100.0) == (1, 30.0)
+    assert queue.pop_due(now=100.0) == (2, 40.0)
+    assert queue.pop_due(now=100.0) is None
+    assert len(queue) == 0
+
+
+def _blocking_pool(monkeypatch, workers: int):
+    started, release = [], threading.Event()
+
+    def fake_trigger(source_id, session_factory):
+        started.append(source_id)
+        release.wait(5)
+        if source_id == 99:
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(worker_pool, "trigger_source_run", fake_trigger)
+    return RunWorkerPool(session_factory=object(), workers=workers), started, release
+
+
+def test_worker_pool_runs_one_per_source_within_capacity(monkeypatch):
+    pool, started, release = _blocking_pool(monkeypatch, workers=2)
+    done = []
+    pool.add_done_listener(done.append)
+    try:
+        assert pool.submit_trigger(1)
+        assert not pool.submit_trigger(1)  # source already in flight
+        assert not pool.submit_pending(1, "run-x")
+        assert pool.submit_trigger(2)
+        assert not pool.has_capacity()
+        assert not pool.submit_trigger(3)  # pool full
+        assert pool.active_count() == 2 and pool.is_busy(1) and not pool.is_busy(3)
+        release.set()
+        _wait_until(lambda: pool.active_count() == 0)
+        assert sorted(started) == [1, 2] and sorted(done) == [1, 2]
+        assert pool.submit_trigger(3)
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+
+
+def test_worker_pool_frees_source_slot_after_worker_exception(monkeypatch):
+    pool, started, release = _blocking_pool(monkeypatch, workers=1)
+    release.set()
+    try:
+        assert pool.submit_trigger(99)
+        _wait_until(lambda: not pool.is_busy(99))
+        assert pool.has_capacity()
+        assert pool.submit_trigger(99)
+        _wait_until(lambda: pool.active_count() == 0)
+        assert started == [99, 99]
+    finally:
+        pool.shutdown(wait=True)
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
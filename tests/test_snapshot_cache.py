@@ -0,0 +1,118 @@
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes import create_app
+from app.models.database import Base, get_session
+from app.models.entities import SourceConfig
+from app.services.metrics import RunMetrics
+from app.services.monitoring_cache import monitoring_cache
+from app.services.run_manager import RunManager
+from app.services.run_state import RunStatus
+from app.services.ttl_cache import SnapshotCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_snapshot_cache_serves_stale_while_refreshing():
+    clock = FakeClock()
+    cache = SnapshotCache(ttl_seconds=5, stale_seconds=10, clock=clock)
+    loads = []
+    release = threading.Event()
+
+    def loader():
+        loads.append(clock.now)
+        if len(loads) > 1:
+            release.wait(2)
+        return len(loads)
+
+    assert cache.get("k", loader) == 1
+    clock.now = 3
+    assert cache.get("k", loader) == 1
+    clock.now = 7
+    # stale: old value comes back at once and a single background refresh starts
+    assert cache.get("k", loader) == 1
+    assert cache.get("k", loader) == 1
+    release.set()
+    for _ in range(200):
+        if cache.stats()["refreshes"]:
+            break
+        threading.Event().wait(0.01)
+    assert cache.get("k", loader) == 2
+    clock.now = 30
+    # past ttl + stale: reloaded inline
+    assert cache.get("k", loader) == 3
+    assert cache.stats() == {"hits": 2, "stale_hits": 2, "misses": 2, "refreshes": 1, "refresh_errors": 0, "invalidations": 0, "entries": 1}
+
+
+def test_invalidate_drops_entries_and_discards_older_loads():
+    clock = FakeClock()
+    cache = SnapshotCache(ttl_seconds=5, clock=clock)
+    assert cache.get("k", lambda: "old") == "old"
+    cache.invalidate()
+    assert cache.get("k", lambda: "new") == "new"
+
+    def racing_loader():
+        # a run finalizes while this load is still computing
+        cache.invalidate()
+        return "outdated"
+
+    cache.invalidate("k")
+    assert cache.get("k", racing_loader) == "outdated"
+    assert cache.get("k", lambda: "fresh") == "fresh"
+
+
+def _api():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add(SourceConfig(id=1, name="a", type="HTTP_API", params="{}"))
+        session.commit()
+
+    def _session():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = _session
+    return TestClient(app), Session
+
+
+def test_monitoring_routes_are_not_read_as_run_ids_and_refresh_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(monitoring_cache, "clock", clock)
+    client, Session = _api()
+    other_client, _ = _api()
+    session = Session()
+    manager = RunManager(session)
+    run = manager.create_run(1)
+    manager.start_run(run)
+
+    summary = client.get("/runs/summary")
+    health = client.get("/runs/health")
+    assert summary.status_code == 200 and health.status_code == 200
+    assert summary.json()["counts"] == {RunStatus.RUNNING.value: 1}
+    assert health.json()["counts"]["running"] == 1
+    # another database in the same process gets its own snapshot
+    assert other_client.get("/runs/summary").json()["counts"] == {}
+
+    manager.finalize_run(run, RunMetrics(records_count=3, bytes_total=30), RunStatus.SUCCESS)
+    # finishing a run does not invalidate; the snapshot is served until its TTL lapses
+    assert client.get("/runs/summary").json()["counts"] == {RunStatus.RUNNING.value: 1}
+    clock.now += monitoring_cache.ttl_seconds + monitoring_cache.stale_seconds
+    assert client.get("/runs/summary").json()["counts"] == {RunStatus.SUCCESS.value: 1}
+    assert client.get("/runs/health").json()["counts"]["running"] == 0
+    session.close()
@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+
+from app.adapters.sqlite_adapter import SQLiteSource
+from app.adapters.sqlite_pager import SQLitePager
+from app.core.errors import AdapterConfigurationError
+from app.services.source_validator import SourceValidator
+
+
+def _conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE metrics(id INTEGER PRIMARY KEY, name TEXT, amount INTEGER)")
+    conn.executemany("INSERT INTO metrics VALUES (?, ?, ?)", [(i, f"m{i}", i * 10) for i in range(1, 26)])
+    return conn
+
+
+def test_keyset_pages_match_offset_pages():
+    pager = SQLitePager(_conn(), limit=10)
+    offset_rows = [dict(r) for page in pager.execute_paginated(pager.build_table_query("metrics")) for r in page]
+    keyset_pages = list(pager.execute_keyset(key_column="id", table="metrics"))
+    assert [len(page) for page in keyset_pages] == [10, 10, 5]
+    assert [SQLitePager.row_dict(r) for page in keyset_pages for r in page] == offset_rows
+
+
+def test_keyset_over_query_resumes_after_start_key():
+    pager = SQLitePager(_conn(), limit=4)
+    pages = pager.execute_keyset(key_column="id", query="SELECT id, amount FROM metrics WHERE amount > 100", start=20)
+    assert [r["id"] for page in pages for r in page] == [21, 22, 23, 24, 25]
+
+
+def test_keyset_with_tie_column_keeps_rows_sharing_a_key():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE events(updated_at TEXT)")
+    conn.executemany("INSERT INTO events VALUES (?)", [("a",), ("b",), ("b",), ("b",), ("c",)])
+    pager = SQLitePager(conn, limit=2)
+    pages = list(pager.execute_keyset(key_column="updated_at", tie_column="rowid", table="events", start=("a", 1)))
+    assert [SQLitePager.row_key(r, True) for page in pages for r in page] == [("b", 2), ("b", 3), ("b", 4), ("c", 5)]
+
+
+def test_query_watermark_requires_key_column(tmp_path):
+    db_path = tmp_path / "events.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE events(id INTEGER PRIMARY KEY, updated_at TEXT)")
+    conn.commit()
+    conn.close()
+    params = {"db_path": str(db_path), "mode": "query", "query": "SELECT id, updated_at FROM events", "watermark_column": "updated_at"}
+    with pytest.raises(AdapterConfigurationError, match="key_column"):
+        SourceValidator.validate("SQLITE", params)
+    with pytest.raises(AdapterConfigurationError, match="key_column"):
+        SQLiteSource(params).fetch()
+    SourceValidator.validate("SQLITE", {**params, "key_column": "id"})
+    SourceValidator.validate("SQLITE", {"db_path": str(db_path), "table": "events", "watermark_column": "updated_at"})
@@ -1,8 +1,21 @@
+import hashlib
+import json
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.core.config import settings
 from app.models.database import Base
-from app.storage.raw_storage import persist_raw_records
+from app.models.entities import RawRecord
+from app.services.payload_reader import PayloadReader
+from app.storage.blob_store import BlobStore
+from app.storage.bloom import BloomFilter
+from app.storage.dedupe import DedupeStrategy
+from app.storage.dedupe_index import DedupeIndex
+from app.storage.file_system import FileSystemStorage
+from app.storage.raw_storage import bulk_insert_raw_records, persist_raw_records
+from app.storage.segment_log import SegmentLog
+from app.storage.storage_engine import StorageEngine
 
 
 def test_persist_raw_records():
@@ -28,3 +41,184 @@ def test_persist_raw_records():
 
     assert len(stored) == 1
     assert stored[0].checksum is not None
+
+
+def test_bulk_insert_raw_records_returns_ids_in_order():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+    session = Session()
+
+    items = [
+        {
+            "payload": f"row-{i}".encode(),
+            "format": "TEXT",
+            "raw_size": 5,
+            "validation_status": "PASSED",
+            "validation_message": "OK",
+        }
+        for i in range(5)
+    ]
+    ids = bulk_insert_raw_records(session, run_id="bulk-run", source_id=1, items=items, chunk_size=2, return_ids=True)
+
+    assert len(ids) == 5
+    payloads = [session.get(RawRecord, record_id).payload for record_id in ids]
+    assert payloads == [f"row-{i}" for i in range(5)]
+    assert bulk_insert_raw_records(session, run_id="bulk-run", source_id=1, items=items) == []
+    assert session.query(RawRecord).count() == 10
+
+
+def test_blob_store_shares_content_and_releases_unreferenced_blobs(tmp_path):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    store = BlobStore(session, base_dir=tmp_path)
+    body = b'{"status": "unchanged"}'
+    checksum = hashlib.sha256(body).hexdigest()
+    for run_id in ("run-1", "run-2"):
+        records = [{"payload": body, "checksum": checksum} for _ in range(2)]
+        store.put_many(records)
+        session.commit()
+        assert records[0]["payload_path"] == str(store.blob_path(checksum))
+    assert store.stats() == {"blobs": 1, "stored_bytes": len(body), "references": 4}
+
+    path = records[0]["payload_path"]
+    assert store.release([(checksum, path)] * 2 + [("other", "loose.json")]) == ["loose.json"]
+    assert store.blob_path(checksum).exists()
+    assert store.release([(checksum, path)] * 2) == []
+    session.commit()
+    # the released blob is a tombstone until swept; a worker storing the same content revives it
+    assert store.stats()["blobs"] == 0 and store.blob_path(checksum).exists()
+    revived = [{"payload": body, "checksum": checksum}]
+    store.put_many(revived)
+    session.commit()
+    assert store.sweep() == 0
+    assert store.blob_path(checksum).read_bytes() == body
+
+    store.release([(checksum, revived[0]["payload_path"])])
+    session.commit()
+    assert store.sweep() == 1
+    assert not store.blob_path(checksum).exists()
+    assert store.stats() == {"blobs": 0, "stored_bytes": 0, "references": 0}
+
+
+def test_blob_store_creates_directories_only_when_writing(tmp_path):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    store = BlobStore(sessionmaker(bind=engine)(), base_dir=tmp_path / "blobs")
+    assert not (tmp_path / "blobs").exists()
+    store.put_many([{"payload": b"x", "checksum": hashlib.sha256(b"x").hexdigest()}])
+    assert store.blob_path(hashlib.sha256(b"x").hexdigest()).read_bytes() == b"x"
+
+
+def test_dedupe_index_migrates_legacy_json_and_expires_by_ttl(tmp_path):
+    now = [1_000_000.0]
+    (tmp_path / "dedupe_index.json").write_text(json.dumps({"checksums": ["a", "b"]}))
+    index = DedupeIndex(tmp_path / "dedupe_index.db", ttl_seconds=3600, bloom_capacity=16, clock=lambda: now[0])
+    assert index.seen(["a", "b", "c"]) == {"a", "b"}
+
+    index.add_many(f"k{i}" for i in range(100))
+    assert index.seen(["k5", "k99", "missing"]) == {"k5", "k99"}
+
+    now[0] += 1800
+    index.add("a")  # refreshed, so it outlives "b"
+    now[0] += 2400
+    assert index.seen(["a", "b", "k5"]) == {"a"}
+    assert index.expire() == 101
+    assert index.contains("a") and not index.contains("b")
+
+
+def test_dedupe_index_is_opened_only_in_skip_mode(tmp_path, monkeypatch):
+    index_path = tmp_path / "state" / "dedupe_index.db"
+    monkeypatch.setattr(settings, "dedupe_index_path", index_path)
+    records = [{"checksum": c} for c in ("x", "y", "x")]
+
+    StorageEngine(mode="db", dedupe_mode="skip").persist_payloads([])
+    store = DedupeStrategy("store")
+    assert store.select(records) == records and store.expire() == 0
+    assert not index_path.exists()
+
+    skip = DedupeStrategy("skip")
+    assert [r["checksum"] for r in skip.select(records)] == ["x", "y"]
+    assert skip.select([{"checksum": "y"}, {"checksum": "z"}]) == [{"checksum": "z"}]
+    assert index_path.exists()
+
+
+def test_db_mode_compresses_payload_and_reader_restores_it(tmp_path):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    body = b'{"metric": "cpu", "value": 0.5}\n' * 200
+    record = {
+        "payload": body,
+        "format": "JSON",
+        "raw_size": len(body),
+        "validation_status": "PASSED",
+        "validation_message": "OK",
+        "checksum": hashlib.sha256(body).hexdigest(),
+    }
+    storage = StorageEngine(mode="db", compression="gzip", dedupe_mode="store")
+    persist_raw_records(session, run_id="run", source_id=1, items=storage.persist_payloads([record]))
+
+    stored = session.query(RawRecord).one()
+    assert stored.payload_encoding == "gzip"
+    assert stored.stored_size < stored.raw_size == len(body)
+    assert PayloadReader(session).read(stored) == body
+
+
+def test_segment_log_round_trips_payloads_by_offset(tmp_path):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    bodies = [f'{{"seq": {i}}}'.encode() for i in range(5)]
+    records = [
+        {
+            "run_id": "run",
+            "source_id": 1,
+            "payload": body,
+            "format": "JSON",
+            "raw_size": len(body),
+            "validation_status": "PASSED",
+            "validation_message": "OK",
+            "checksum": hashlib.sha256(body).hexdigest(),
+        }
+        for body in bodies
+    ]
+    SegmentLog(base_dir=tmp_path, max_segment_bytes=40).append_batch(records)
+    persist_raw_records(session, run_id="run", source_id=1, items=records)
+
+    reader = PayloadReader(session)
+    stored = session.query(RawRecord).order_by(RawRecord.record_id).all()
+    assert len({record.payload_path for record in stored}) == 1
+    assert [reader.read(record) for record in stored] == bodies
+
+
+def test_file_storage_shards_by_checksum_and_keeps_names_unique(tmp_path):
+    def write(storage, body: bytes):
+        checksum = hashlib.sha256(body).hexdigest()
+        return storage.write_payload("run-1", 7, body, "application/json", checksum), checksum
+
+    storage = FileSystemStorage(base_dir=tmp_path)
+    first_batch = [write(storage, body) for body in (b'{"a": 1}', b'{"a": 2}')]
+    second_batch = [write(storage, body) for body in (b'{"a": 3}', b'{"a": 1}')]
+    for seq, (path, checksum) in enumerate(first_batch + second_batch):
+        assert path.relative_to(tmp_path).parts == ("run-1", checksum[:2], f"7_{seq:06d}_{checksum[:16]}.json")
+    # identical content in a later batch still gets its own file
+    assert len({path for path, _ in first_batch + second_batch}) == 4
+
+    # a retried run restarts the counter; the checksum in the name keeps other content from being overwritten
+    retry_path, _ = write(FileSystemStorage(base_dir=tmp_path), b'{"a": 9}')
+    assert retry_path.name.startswith("7_000000_") and retry_path != first_batch[0][0]
+    assert first_batch[0][0].read_bytes() == b'{"a": 1}'
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_bloom_filter_counts_distinct_keys_only():
+    bloom = BloomFilter(capacity=10)
+    assert all(bloom.add(f"k{i}") for i in range(10))
+    for _ in range(50):
+        for i in range(10):
+            assert not bloom.add(f"k{i}")
+    assert bloom.count == 10 and not bloom.saturated
+    bloom.add("k10")
+    assert bloom.saturated